@@ -0,0 +1,85 @@
+"""
+On-disk cache for generated example data
+Repeated runs of an example load its candles from examples/.cache instead of
+regenerating them. Entries are keyed on the generator's source and bound
+arguments as well as the size and seed, so editing a generator regenerates
+its data; delete that directory to force regeneration otherwise.
+"""
+
+import hashlib
+import inspect
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from lightweight_charts import OHLCColumns
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+# Bump to invalidate every cached file (e.g. after changing the file layout)
+CACHE_VERSION = 1
+
+
+def _generator_digest(generate: Callable) -> str:
+    """Short hash of a generator's source and any partial() arguments"""
+    parts = []
+    while isinstance(generate, partial):
+        parts.append(repr((generate.args, sorted(generate.keywords.items()))))
+        generate = generate.func
+    try:
+        parts.append(inspect.getsource(generate))
+    except (OSError, TypeError):
+        parts.append(f"{generate.__module__}.{generate.__qualname__}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:12]
+
+
+def cached_ohlc(
+    name: str,
+    generate: Callable[[int, int], OHLCColumns],
+    num_candles: int,
+    seed: int = 0
+) -> OHLCColumns:
+    """
+    Load OHLC data from the cache, generating and saving it on first use.
+
+    Args:
+        name: Cache key prefix (usually the example name)
+        generate: Generator called as generate(num_candles, seed); its
+            source and partial() arguments are part of the cache key
+        num_candles: Number of candles
+        seed: Random seed passed to the generator
+
+    Returns:
+        OHLC column arrays
+    """
+    key = _generator_digest(generate)
+    path = CACHE_DIR / f"{name}_{num_candles}_{seed}_v{CACHE_VERSION}_{key}.npz"
+
+    if path.exists():
+        with np.load(path) as arrays:
+            return OHLCColumns(
+                time=arrays["time"],
+                open=arrays["open"],
+                high=arrays["high"],
+                low=arrays["low"],
+                close=arrays["close"],
+                volume=arrays["volume"] if "volume" in arrays else None
+            )
+
+    ohlc = generate(num_candles, seed)
+
+    columns = {
+        "time": ohlc.time,
+        "open": ohlc.open,
+        "high": ohlc.high,
+        "low": ohlc.low,
+        "close": ohlc.close,
+    }
+    if ohlc.volume is not None:
+        columns["volume"] = ohlc.volume
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    np.savez_compressed(path, **columns)
+    return ohlc
@@ -0,0 +1,66 @@
+"""
+Fixed-capacity candle storage for the live-data examples
+Candles live in one preallocated structured array used as a ring buffer, so
+appends never allocate and any candle can be read by position in O(1).
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+# One record per candle; time is epoch seconds
+OHLCV_DTYPE = np.dtype([
+    ("time", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
+@lru_cache(maxsize=1024)
+def local_datetime(timestamp: float) -> datetime:
+    """
+    Cached datetime.fromtimestamp.
+
+    Candle timestamps repeat constantly (every update of the forming candle,
+    every trade in a burst), so most conversions are dictionary hits.
+    """
+    return datetime.fromtimestamp(timestamp)
+
+
+class CandleRing:
+    """Ring buffer of the most recent candles, oldest first."""
+
+    def __init__(self, capacity: int = 200):
+        self._ohlcv = np.zeros(capacity, dtype=OHLCV_DTYPE)
+        self._capacity = capacity
+        self._head = 0  # Next slot to write
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> np.void:
+        """Candle at a chronological position (negative indices count from the newest)."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("candle index out of range")
+        return self._ohlcv[(self._head - self._count + index) % self._capacity]
+
+    def append(
+        self, timestamp: int, open_: float, high: float, low: float, close: float, volume: float
+    ) -> None:
+        """Store a candle, overwriting the oldest once the buffer is full."""
+        self._ohlcv[self._head] = (timestamp, open_, high, low, close, volume)
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def view(self) -> np.ndarray:
+        """All stored candles in chronological order."""
+        if self._count < self._capacity:
+            return self._ohlcv[:self._count]
+        return np.concatenate((self._ohlcv[self._head:], self._ohlcv[:self._head]))
@@ -0,0 +1,73 @@
+"""
+Synthetic OHLC data shared by the examples
+All candles are drawn in bulk from a seeded NumPy Generator and returned as
+column arrays, so results are reproducible and cacheable with _data_cache.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from lightweight_charts import OHLCColumns
+
+
+def generate_ohlc(
+    n: int,
+    seed: int = 0,
+    trend: bool = False,
+    base_price: float = 100,
+    vol_range: Tuple[int, int] = (1_000_000, 10_000_000),
+    volatility: float = 3,
+    wick: float = 2,
+    start: str = "2024-01-01",
+    unit: str = "D"
+) -> OHLCColumns:
+    """
+    Generate a random-walk OHLC series.
+
+    Args:
+        n: Number of candles
+        seed: Random seed
+        trend: Add a slow sine-wave drift and open each candle at a gap from
+            the previous close instead of exactly at it
+        base_price: Starting price
+        vol_range: Half-open [low, high) range of the integer volumes (must
+            fit in int32)
+        volatility: Standard deviation of the close-to-close move
+        wick: Standard deviation of the wick length beyond the body
+        start: First timestamp
+        unit: Spacing between candles as a datetime64 unit (e.g. "D", "h")
+
+    Returns:
+        OHLC column arrays with datetime64 times and int32 volumes
+    """
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64(start, unit)
+
+    if trend:
+        # Each candle opens at the previous close plus noise and a sine trend,
+        # then moves by a second noise term to its close
+        drift = np.sin(np.arange(n) / 20) * 5
+        gap = rng.standard_normal(n) * (volatility * 2 / 3) + drift * 0.1
+        body = rng.standard_normal(n) * volatility
+        close = base_price + np.cumsum(gap + body)
+        open_ = close - body
+    else:
+        # Random walk of closes; each candle opens at the previous close
+        close = base_price + np.cumsum(rng.standard_normal(n) * volatility)
+        open_ = np.empty(n)
+        open_[0] = base_price
+        open_[1:] = close[:-1]
+
+    high = np.maximum(open_, close) + np.abs(rng.standard_normal(n) * wick)
+    low = np.minimum(open_, close) - np.abs(rng.standard_normal(n) * wick)
+
+    return OHLCColumns(
+        time=np.arange(base_date, base_date + n),
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        # Share counts fit in int32; half the memory and cache size of int64
+        volume=rng.integers(vol_range[0], vol_range[1], n).astype(np.int32)
+    )
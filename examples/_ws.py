@@ -0,0 +1,86 @@
+"""
+WebSocket helpers shared by the live-data examples
+"""
+
+import asyncio
+import sys
+from collections import deque
+from typing import Any, List
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+HAS_UVLOOP = False
+if sys.platform != "win32":
+    try:
+        import uvloop
+        HAS_UVLOOP = True
+    except ImportError:
+        pass
+
+# Parse frames with orjson when available; it accepts str and bytes alike
+loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Kraken's once-a-second heartbeat, as a text or binary frame; compared as
+# raw frames so they can be dropped without parsing
+HEARTBEATS = frozenset({'{"event":"heartbeat"}', b'{"event":"heartbeat"}'})
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj for a text frame."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop when available, else a default asyncio loop."""
+    if HAS_UVLOOP:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_once(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Run one iteration of an asyncio loop without waiting for I/O.
+
+    The pending stop makes the loop poll its sockets with a zero timeout,
+    run whatever is ready and return. Called from a fast GUI timer, this
+    lets WebSocket coroutines share the GUI thread instead of needing a
+    thread of their own, without ever blocking it.
+
+    Args:
+        loop: Event loop that is not already running
+    """
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+
+async def recv_batch(ws: Any, max_size: int = 512) -> List[Any]:
+    """
+    Wait for the next frame, then take every frame already buffered.
+
+    The legacy websockets client queues received frames in ``ws.messages``;
+    draining that deque handles a burst in one wakeup instead of one task
+    switch per frame. Clients without it return a single frame per call.
+
+    Args:
+        ws: Connected websockets client
+        max_size: Maximum number of frames returned at once
+
+    Returns:
+        Raw frames in arrival order
+    """
+    batch = [await ws.recv()]
+
+    buffered = getattr(ws, "messages", None)
+    if isinstance(buffered, deque):
+        popleft = buffered.popleft
+        while buffered and len(batch) < max_size:
+            batch.append(popleft())
+
+    return batch
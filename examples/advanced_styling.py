@@ -3,53 +3,52 @@ Example 6: Advanced Styling and Customization
 Demonstrating custom colors and styles
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from lightweight_charts import (
     Chart,
     LineStyleOptions,
     CandleStickStyleOptions,
-    HistogramStyleOptions
+    HistogramStyleOptions,
+    OHLCColumns
 )
-from datetime import datetime, timedelta
 import numpy as np
 
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
+
+try:
+    from scipy.signal import lfilter
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 
-def generate_market_data(num_candles: int = 100):
+def generate_market_data(num_candles: int = 100, seed: int = 0) -> OHLCColumns:
     """Generate realistic market data."""
-    base_date = datetime(2024, 1, 1)
-    ohlc_data = []
-    price = 50000  # Bitcoin-like price
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(hours=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 500
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 300)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 300)
-        volume = np.random.randint(100000000, 1000000000)
-        
-        ohlc_data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": volume
-        })
-        
-        price = close_price
-    
-    return ohlc_data
+    # Bitcoin-like prices on an hourly axis
+    return generate_ohlc(
+        num_candles,
+        seed,
+        base_price=50000,
+        vol_range=(100_000_000, 1_000_000_000),
+        volatility=500,
+        wick=300,
+        start="2024-01-01T00",
+        unit="h"
+    )
+
+
+def exponential_moving_average(values: np.ndarray, alpha: float) -> np.ndarray:
+    """EMA seeded with the first value: ema[i] = alpha * x[i] + (1 - alpha) * ema[i-1]."""
+    if HAS_SCIPY:
+        # Run the recurrence as an IIR filter in C
+        return lfilter([alpha], [1.0, alpha - 1.0], values, zi=[values[0] * (1 - alpha)])[0]
+
+    ema = np.empty(len(values))
+    prev = values[0]
+    for i, value in enumerate(values.tolist()):
+        prev = value * alpha + prev * (1 - alpha)
+        ema[i] = prev
+    return ema
 
 
 def main():
@@ -62,7 +61,7 @@ def main():
     )
 
     # Generate data
-    ohlc_data = generate_market_data(100)
+    ohlc = cached_ohlc("advanced_styling", generate_market_data, 100).astype(np.float32)
 
     # Add candlestick series with custom colors
     candle_series = chart.add_candlestick_series(
@@ -78,19 +77,14 @@ def main():
             body_width=0.8
         )
     )
-    candle_series.set_data(ohlc_data)
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
 
     # Add EMA (exponential moving average) line
-    ema_data = []
-    alpha = 2 / (len(ohlc_data) + 1)
-    ema = ohlc_data[0]["close"]
-    
-    for candle in ohlc_data:
-        ema = candle["close"] * alpha + ema * (1 - alpha)
-        ema_data.append({
-            "time": candle["time"],
-            "value": ema
-        })
+    alpha = 2 / (len(ohlc.close) + 1)
+    ema = exponential_moving_average(ohlc.close, alpha)
 
     ema_series = chart.add_line_series(
         "EMA12",
@@ -99,14 +93,9 @@ def main():
             width=3
         )
     )
-    ema_series.set_data(ema_data)
+    ema_series.set_data_columnar(time=ohlc.time, value=ema)
 
     # Add volume histogram
-    volume_data = [
-        {"time": d["time"], "value": d["volume"] / 1e8}
-        for d in ohlc_data
-    ]
-    
     volume_series = chart.add_histogram_series(
         "Volume",
         HistogramStyleOptions(
@@ -114,10 +103,10 @@ def main():
             bar_width=0.6
         )
     )
-    volume_series.set_data(volume_data)
+    volume_series.set_data_columnar(time=ohlc.time, value=ohlc.volume.astype(np.float32) / 1e8)
 
     # Set time scale
-    chart.update_time_scale_data(ohlc_data)
+    chart.update_time_scale_data(candle_series.columns)
 
     # Render chart
     print("Rendering chart... Close the window to exit.")
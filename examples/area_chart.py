@@ -3,37 +3,25 @@ Example 4: Area Chart
 Area chart with custom colors and styling
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, AreaStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import Chart, AreaStyleOptions, to_list
 import numpy as np
 
 
-def generate_cumulative_data(num_points: int = 100):
+def generate_cumulative_data(num_points: int = 100, seed: int = 0):
     """Generate cumulative return data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    value = 100
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    dates = to_list(np.arange(base_date, base_date + num_points))
     
-    for i in range(num_points):
-        date = base_date + timedelta(days=i)
-        value += np.random.randn() * 1.5
-        value = max(50, value)  # Floor at 50
-        data.append({
-            "time": date,
-            "value": value
-        })
+    # Random walk floored at 50. Adding back the deepest dip below the floor
+    # so far gives value = max(50, value + step) without a Python loop.
+    walk = 100 + np.cumsum(rng.standard_normal(num_points) * 1.5)
+    values = walk + np.maximum(np.maximum.accumulate(50 - walk), 0)
     
-    return data
+    return [
+        {"time": date, "value": value}
+        for date, value in zip(dates, values.tolist())
+    ]
 
 
 def main():
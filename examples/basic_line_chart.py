@@ -4,41 +4,30 @@ Simple line chart with moving average data
 """
 
 import sys
-from pathlib import Path
-import os
 
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path so we can import lightweight_charts
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, LineStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import Chart, LineStyleOptions, to_list
 import numpy as np
 
 
-def generate_price_data(num_points: int = 100):
+def generate_price_data(num_points: int = 100, seed: int = 0):
     """Generate synthetic price data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_points):
-        date = base_date + timedelta(days=i)
-        price += np.random.randn() * 2
-        data.append({
-            "time": date,
-            "value": price
-        })
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    dates = to_list(np.arange(base_date, base_date + num_points))
+    prices = 100 + np.cumsum(rng.standard_normal(num_points) * 2)
     
-    return data
+    return [
+        {"time": date, "value": price}
+        for date, price in zip(dates, prices.tolist())
+    ]
 
 
 def main():
-    print("=" * 60)
-    print("Basic Line Chart Example")
-    print("=" * 60)
+    sys.stdout.write("\n".join([
+        "=" * 60,
+        "Basic Line Chart Example",
+        "=" * 60,
+    ]) + "\n")
     
     # Create chart
     chart = Chart(
@@ -64,13 +53,15 @@ def main():
     chart.update_time_scale_data(data)
 
     # Render chart
-    print("✓ Chart created successfully!")
-    print("✓ Data loaded: 100 points")
-    print("\n📊 Rendering chart window...")
-    print("   • Pan: Click and drag")
-    print("   • Zoom: Mouse wheel")
-    print("   • Close window to exit")
-    print("=" * 60)
+    sys.stdout.write("\n".join([
+        "✓ Chart created successfully!",
+        "✓ Data loaded: 100 points",
+        "\n📊 Rendering chart window...",
+        "   • Pan: Click and drag",
+        "   • Zoom: Mouse wheel",
+        "   • Close window to exit",
+        "=" * 60,
+    ]) + "\n")
     
     chart.render()
 
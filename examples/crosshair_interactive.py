@@ -5,69 +5,46 @@ Run with --fullscreen flag for fullscreen mode
 """
 
 import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from lightweight_charts import Chart, CandleStickStyleOptions, LineStyleOptions
-from datetime import datetime, timedelta
 import numpy as np
+
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
 import logging
 
 # Enable logging to see crosshair data
 logging.basicConfig(level=logging.INFO)
 
 
-def generate_ohlc_data(num_candles: int = 100):
-    """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
-    
-    return data
+# Candle index of the last printed crosshair position
+_last_index = None
 
 
 def on_crosshair_move(position):
-    """Callback when crosshair moves - prints data to console."""
-    if position.series_data:
-        data = position.series_data
-        if isinstance(data, dict) and "close" in data:
-            print(f"\n📊 Crosshair Data:")
-            print(f"   Time: {position.time.strftime('%Y-%m-%d') if position.time else 'N/A'}")
-            print(f"   Open:  ${data.get('open', 0):.2f}")
-            print(f"   High:  ${data.get('high', 0):.2f}")
-            print(f"   Low:   ${data.get('low', 0):.2f}")
-            print(f"   Close: ${data.get('close', 0):.2f}")
-            print(f"   Price at cursor: ${position.price:.2f}")
+    """Callback when crosshair moves - prints data to console once per candle."""
+    global _last_index
+    if not position.series_data or position.data_index == _last_index:
+        return
+    data = position.series_data
+    if isinstance(data, dict) and "close" in data:
+        _last_index = position.data_index
+        sys.stdout.write(
+            f"\n📊 Crosshair Data:\n"
+            f"   Time: {position.time.strftime('%Y-%m-%d') if position.time else 'N/A'}\n"
+            f"   Open:  ${data.get('open', 0):.2f}\n"
+            f"   High:  ${data.get('high', 0):.2f}\n"
+            f"   Low:   ${data.get('low', 0):.2f}\n"
+            f"   Close: ${data.get('close', 0):.2f}\n"
+            f"   Price at cursor: ${position.price:.2f}\n"
+        )
 
 
 def on_crosshair_leave():
     """Callback when mouse leaves chart."""
-    print("\n👋 Mouse left chart area")
+    global _last_index
+    _last_index = None
+    sys.stdout.write("\n👋 Mouse left chart area\n")
 
 
 def main():
@@ -80,32 +57,39 @@ def main():
     if not fullscreen and not maximized and not normal:
         maximized = True  # Default behavior
     
-    print("=" * 70)
-    print("Interactive Crosshair Demo - DARK MODE")
+    banner = [
+        "=" * 70,
+        "Interactive Crosshair Demo - DARK MODE",
+    ]
     if fullscreen:
-        print("🖥️  FULLSCREEN MODE (No window borders)")
+        banner.append("🖥️  FULLSCREEN MODE (No window borders)")
     elif maximized:
-        print("🖥️  MAXIMIZED WINDOW (Window controls visible)")
-    print("=" * 70)
-    print("\n🎯 Features:")
-    print("   ✅ Visual crosshair lines (vertical + horizontal)")
-    print("   ✅ Follows mouse in real-time")
-    print("   ✅ Snaps to nearest data point")
-    print("   ✅ Event callbacks (see console output)")
-    print("   ✅ Data extraction at cursor position")
-    print("   ✅ Dark theme with neon colors")
-    print("\n💡 Try this:")
-    print("   • Move mouse over chart → See crosshair lines")
-    print("   • Watch console → See OHLC data at cursor")
-    print("   • Pan/zoom → Crosshair still works")
+        banner.append("🖥️  MAXIMIZED WINDOW (Window controls visible)")
+    banner += [
+        "=" * 70,
+        "\n🎯 Features:",
+        "   ✅ Visual crosshair lines (vertical + horizontal)",
+        "   ✅ Follows mouse in real-time",
+        "   ✅ Snaps to nearest data point",
+        "   ✅ Event callbacks (see console output)",
+        "   ✅ Data extraction at cursor position",
+        "   ✅ Dark theme with neon colors",
+        "\n💡 Try this:",
+        "   • Move mouse over chart → See crosshair lines",
+        "   • Watch console → See OHLC data at cursor",
+        "   • Pan/zoom → Crosshair still works",
+    ]
     if fullscreen:
-        print("   • Press ESC to exit fullscreen")
-    print("\n💻 Usage:")
-    print("   python crosshair_interactive.py          # Maximized (default)")
-    print("   python crosshair_interactive.py -m       # Maximized")
-    print("   python crosshair_interactive.py --fullscreen # Fullscreen")
-    print("   python crosshair_interactive.py --normal     # Normal size")
-    print("=" * 70)
+        banner.append("   • Press ESC to exit fullscreen")
+    banner += [
+        "\n💻 Usage:",
+        "   python crosshair_interactive.py          # Maximized (default)",
+        "   python crosshair_interactive.py -m       # Maximized",
+        "   python crosshair_interactive.py --fullscreen # Fullscreen",
+        "   python crosshair_interactive.py --normal     # Normal size",
+        "=" * 70,
+    ]
+    sys.stdout.write("\n".join(banner) + "\n")
     
     # Create chart with DARK THEME
     chart = Chart(
@@ -118,7 +102,7 @@ def main():
     )
 
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(100)
+    ohlc = cached_ohlc("crosshair_interactive", generate_ohlc, 100).astype(np.float32)
 
     # Add candlestick series with bright colors for dark theme
     candle_series = chart.add_candlestick_series(
@@ -131,23 +115,22 @@ def main():
             border_down_color="#FF0040"
         )
     )
-    candle_series.set_data(ohlc_data)
-
-    # Add moving average
-    ma_data = []
-    for i in range(len(ohlc_data)):
-        if i < 20:
-            ma_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-19:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma_data.append({"time": ohlc_data[i]["time"], "value": avg})
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+    ohlc_data = candle_series.data
+
+    # Add moving average (rolling mean from a running sum, NaN until the window fills)
+    csum = np.concatenate(([0.0], np.cumsum(ohlc.close)))
+    ma = np.full(len(ohlc.close), np.nan)
+    ma[19:] = (csum[20:] - csum[:-20]) / 20
     
     ma_series = chart.add_line_series(
         "MA20",
         LineStyleOptions(color="#FFD700", width=2)  # Gold - looks great on dark
     )
-    ma_series.set_data(ma_data)
+    ma_series.set_data_columnar(time=ohlc.time, value=ma)
 
     # Set time scale
     chart.update_time_scale_data(ohlc_data)
@@ -162,8 +145,7 @@ def main():
     chart.subscribe_crosshair_move(on_crosshair_move)
     chart.subscribe_crosshair_leave(on_crosshair_leave)
 
-    print("\n🚀 Chart ready! Move your mouse over the chart...")
-    print("=" * 70)
+    sys.stdout.write("\n🚀 Chart ready! Move your mouse over the chart...\n" + "=" * 70 + "\n")
     
     # Render chart
     chart.render()
@@ -4,14 +4,6 @@ Demonstrates crosshair functionality, price markers, and tooltips
 """
 
 import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from lightweight_charts import (
     Chart,
@@ -20,68 +12,58 @@ from lightweight_charts import (
     PriceMarker,
     TimeMarker
 )
-from datetime import datetime, timedelta
 import numpy as np
 
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
 
-def generate_ohlc_data(num_candles: int = 100):
-    """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
-    
-    return data
+
+# Candle index of the last printed crosshair position
+_last_index = None
 
 
 def on_crosshair_move(position):
-    """Callback when crosshair moves."""
-    if position and position.series_data:
-        data = position.series_data
-        print(f"\n📍 Crosshair Position:")
-        print(f"   Time: {position.time}")
-        print(f"   Price: ${position.price:.2f}")
-        if "open" in data:
-            print(f"   Open: ${data['open']:.2f}")
-            print(f"   High: ${data['high']:.2f}")
-            print(f"   Low: ${data['low']:.2f}")
-            print(f"   Close: ${data['close']:.2f}")
+    """Callback when crosshair moves - prints once per candle."""
+    global _last_index
+    if not position or not position.series_data or position.data_index == _last_index:
+        return
+    _last_index = position.data_index
+    data = position.series_data
+    text = (
+        f"\n📍 Crosshair Position:\n"
+        f"   Time: {position.time}\n"
+        f"   Price: ${position.price:.2f}\n"
+    )
+    if "open" in data:
+        text += (
+            f"   Open: ${data['open']:.2f}\n"
+            f"   High: ${data['high']:.2f}\n"
+            f"   Low: ${data['low']:.2f}\n"
+            f"   Close: ${data['close']:.2f}\n"
+        )
+    sys.stdout.write(text)
 
 
 def on_crosshair_leave():
     """Callback when crosshair leaves chart."""
-    print("\n↩️  Crosshair left the chart")
+    global _last_index
+    _last_index = None
+    sys.stdout.write("\n↩️  Crosshair left the chart\n")
 
 
 def main():
-    print("=" * 70)
-    print("Crosshair & Markers Example")
-    print("=" * 70)
-    print("Features demonstrated:")
-    print("  • Crosshair with price/time display")
-    print("  • Price markers on the price axis")
-    print("  • Time markers on the time axis")
-    print("  • Tooltip data on hover")
-    print("  • Event callbacks")
-    print("=" * 70)
+    sys.stdout.write("\n".join([
+        "=" * 70,
+        "Crosshair & Markers Example",
+        "=" * 70,
+        "Features demonstrated:",
+        "  • Crosshair with price/time display",
+        "  • Price markers on the price axis",
+        "  • Time markers on the time axis",
+        "  • Tooltip data on hover",
+        "  • Event callbacks",
+        "=" * 70,
+    ]) + "\n")
     
     # Create chart
     chart = Chart(
@@ -91,7 +73,7 @@ def main():
     )
 
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(100)
+    ohlc = cached_ohlc("crosshair_markers", generate_ohlc, 100).astype(np.float32)
 
     # Add candlestick series
     candle_series = chart.add_candlestick_series(
@@ -101,75 +83,76 @@ def main():
             down_color="#ef5350"
         )
     )
-    candle_series.set_data(ohlc_data)
-
-    # Add moving average
-    ma_data = []
-    for i, candle in enumerate(ohlc_data):
-        start_idx = max(0, i - 19)
-        ma = np.mean([c["close"] for c in ohlc_data[start_idx:i+1]])
-        ma_data.append({
-            "time": candle["time"],
-            "value": ma
-        })
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+
+    # Add moving average (the first 19 points average over the candles so far)
+    csum = np.concatenate(([0.0], np.cumsum(ohlc.close)))
+    end = np.arange(1, len(ohlc.close) + 1)
+    start = np.maximum(0, end - 20)
+    ma = (csum[end] - csum[start]) / (end - start)
 
     ma_series = chart.add_line_series(
         "MA20",
         LineStyleOptions(color="#FF9800", width=2)
     )
-    ma_series.set_data(ma_data)
-
-    # Add price markers
-    current_price = ohlc_data[-1]["close"]
-    chart.add_price_marker(PriceMarker(
-        price=current_price,
-        color="#2196F3",
-        label=f"Current: ${current_price:.2f}"
-    ))
-    
-    # Add price marker at specific level
-    chart.add_price_marker(PriceMarker(
-        price=110,
-        color="#FF5722",
-        label="Resistance: $110"
-    ))
-    
-    chart.add_price_marker(PriceMarker(
-        price=90,
-        color="#4CAF50",
-        label="Support: $90"
-    ))
+    ma_series.set_data_columnar(time=ohlc.time, value=ma)
+
+    # Add price markers: current price plus specific levels
+    current_price = ohlc.close[-1]
+    chart.add_price_markers([
+        PriceMarker(
+            price=current_price,
+            color="#2196F3",
+            label=f"Current: ${current_price:.2f}"
+        ),
+        PriceMarker(
+            price=110,
+            color="#FF5722",
+            label="Resistance: $110"
+        ),
+        PriceMarker(
+            price=90,
+            color="#4CAF50",
+            label="Support: $90"
+        ),
+    ])
 
     # Add time markers
-    chart.add_time_marker(TimeMarker(
-        time=ohlc_data[25]["time"],
-        color="#9C27B0",
-        label="Event A"
-    ))
-    
-    chart.add_time_marker(TimeMarker(
-        time=ohlc_data[75]["time"],
-        color="#FF9800",
-        label="Event B"
-    ))
+    chart.add_time_markers([
+        TimeMarker(
+            time=candle_series.data[25]["time"],
+            color="#9C27B0",
+            label="Event A"
+        ),
+        TimeMarker(
+            time=candle_series.data[75]["time"],
+            color="#FF9800",
+            label="Event B"
+        ),
+    ])
 
     # Subscribe to crosshair events
     chart.subscribe_crosshair_move(on_crosshair_move)
     chart.subscribe_crosshair_leave(on_crosshair_leave)
 
     # Set time scale
-    chart.update_time_scale_data(ohlc_data)
-
-    print("\n✓ Chart created with crosshair system")
-    print("✓ Price markers added (Current, Resistance, Support)")
-    print("✓ Time markers added (Event A, Event B)")
-    print("✓ Crosshair callbacks registered")
-    print("\n📊 Hover over the chart to see crosshair in action!")
-    print("   Mouse events will be printed to console")
-    print("\n💡 Note: Vispy's mouse event handling is basic.")
-    print("   For production use, consider implementing custom")
-    print("   mouse tracking for better crosshair interaction.")
-    print("=" * 70)
+    chart.update_time_scale_data(candle_series.columns)
+
+    sys.stdout.write("\n".join([
+        "\n✓ Chart created with crosshair system",
+        "✓ Price markers added (Current, Resistance, Support)",
+        "✓ Time markers added (Event A, Event B)",
+        "✓ Crosshair callbacks registered",
+        "\n📊 Hover over the chart to see crosshair in action!",
+        "   Mouse events will be printed to console",
+        "\n💡 Note: Vispy's mouse event handling is basic.",
+        "   For production use, consider implementing custom",
+        "   mouse tracking for better crosshair interaction.",
+        "=" * 70,
+    ]) + "\n")
     
     # Render chart
     chart.render()
@@ -3,47 +3,11 @@ Example: Fullscreen Chart Demo
 Opens the chart in fullscreen mode
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from lightweight_charts import Chart, CandleStickStyleOptions, LineStyleOptions
-from datetime import datetime, timedelta
 import numpy as np
 
-
-def generate_ohlc_data(num_candles: int = 200):
-    """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
-    
-    return data
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
 
 
 def main():
@@ -63,7 +27,7 @@ def main():
     )
 
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(200)
+    ohlc = cached_ohlc("fullscreen_chart", generate_ohlc, 200).astype(np.float32)
 
     # Add candlestick series
     candle_series = chart.add_candlestick_series(
@@ -74,40 +38,34 @@ def main():
             wick_color="#FFFFFF"
         )
     )
-    candle_series.set_data(ohlc_data)
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+    ohlc_data = candle_series.data
+
+    # Add moving averages (rolling means from a running sum, NaN until the window fills)
+    csum = np.concatenate(([0.0], np.cumsum(ohlc.close)))
 
-    # Add moving averages
     # MA20
-    ma20_data = []
-    for i in range(len(ohlc_data)):
-        if i < 20:
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-19:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": avg})
+    ma20 = np.full(len(ohlc.close), np.nan)
+    ma20[19:] = (csum[20:] - csum[:-20]) / 20
     
     ma20_series = chart.add_line_series(
         "MA20",
         LineStyleOptions(color="#FFD700", width=2)  # Gold
     )
-    ma20_series.set_data(ma20_data)
+    ma20_series.set_data_columnar(time=ohlc.time, value=ma20)
 
     # MA50
-    ma50_data = []
-    for i in range(len(ohlc_data)):
-        if i < 50:
-            ma50_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-49:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma50_data.append({"time": ohlc_data[i]["time"], "value": avg})
+    ma50 = np.full(len(ohlc.close), np.nan)
+    ma50[49:] = (csum[50:] - csum[:-50]) / 50
     
     ma50_series = chart.add_line_series(
         "MA50",
         LineStyleOptions(color="#9C27B0", width=2)  # Purple
     )
-    ma50_series.set_data(ma50_data)
+    ma50_series.set_data_columnar(time=ohlc.time, value=ma50)
 
     # Set time scale
     chart.update_time_scale_data(ohlc_data)
@@ -4,14 +4,7 @@ Demonstrates SMA, EMA, RSI, MACD, and Bollinger Bands
 """
 
 import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from functools import partial
 
 from lightweight_charts import (
     Chart,
@@ -23,56 +16,37 @@ from lightweight_charts import (
     MACD,
     BollingerBands
 )
-from datetime import datetime, timedelta
+from typing import Optional
 import numpy as np
 
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
 
-def generate_ohlc_data(num_candles: int = 200):
-    """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        # Add some trend
-        trend = np.sin(i / 20) * 5
-        price = price + np.random.randn() * 2 + trend * 0.1
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
-    
-    return data
+
+def last_valid(values: np.ndarray) -> Optional[float]:
+    """Last non-NaN entry of an array, or None if every entry is NaN."""
+    valid = np.flatnonzero(~np.isnan(values))
+    return float(values[valid[-1]]) if valid.size else None
 
 
 def main():
-    print("=" * 80)
-    print("Technical Indicators Example")
-    print("=" * 80)
-    print("This example demonstrates all built-in technical indicators:")
-    print("  • SMA (Simple Moving Average)")
-    print("  • EMA (Exponential Moving Average)")
-    print("  • RSI (Relative Strength Index)")
-    print("  • MACD (Moving Average Convergence Divergence)")
-    print("  • Bollinger Bands")
-    print("=" * 80)
+    sys.stdout.write("\n".join([
+        "=" * 80,
+        "Technical Indicators Example",
+        "=" * 80,
+        "This example demonstrates all built-in technical indicators:",
+        "  • SMA (Simple Moving Average)",
+        "  • EMA (Exponential Moving Average)",
+        "  • RSI (Relative Strength Index)",
+        "  • MACD (Moving Average Convergence Divergence)",
+        "  • Bollinger Bands",
+        "=" * 80,
+    ]) + "\n")
     
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(200)
+    ohlc = cached_ohlc(
+        "indicators_complete", partial(generate_ohlc, trend=True), 200
+    ).astype(np.float32)
     
     # Create chart
     chart = Chart(
@@ -90,7 +64,11 @@ def main():
             down_color="#ef5350"
         )
     )
-    candles.set_data(ohlc_data)
+    candles.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+    ohlc_data = candles.data
 
     # Calculate and add SMA
     print("📈 Calculating SMA(20)...")
@@ -134,38 +112,38 @@ def main():
     # Set time scale
     chart.update_time_scale_data(ohlc_data)
 
-    print("\n✓ Chart created with indicators:")
-    print("  ✓ Candlesticks")
-    print("  ✓ SMA(20) - Blue line")
-    print("  ✓ EMA(50) - Orange line")
-    print("  ✓ Bollinger Bands - Purple lines")
-    
-    print("\n📊 Statistical Summary:")
-    print(f"  • Data points: {len(ohlc_data)}")
-    print(f"  • Price range: ${min([d['low'] for d in ohlc_data]):.2f} - ${max([d['high'] for d in ohlc_data]):.2f}")
-    print(f"  • Last close: ${ohlc_data[-1]['close']:.2f}")
-    print(f"  • SMA(20): ${[x['value'] for x in sma_data if not np.isnan(x['value'])][-1]:.2f}")
-    print(f"  • EMA(50): ${[x['value'] for x in ema_data if not np.isnan(x['value'])][-1]:.2f}")
-    
-    # Calculate RSI for info
+    # Calculate RSI and MACD for info
     rsi_data = RSI.calculate(ohlc_data, period=14)
-    rsi_values = [x['value'] for x in rsi_data if not np.isnan(x['value'])]
-    if rsi_values:
-        print(f"  • RSI(14): {rsi_values[-1]:.2f}")
-    
-    # Calculate MACD for info
+    rsi_last = last_valid(RSI.extract_values(rsi_data, "value"))
     macd_line, signal_line, histogram = MACD.calculate(ohlc_data)
-    macd_values = [x['value'] for x in macd_line if not np.isnan(x['value'])]
-    if macd_values:
-        print(f"  • MACD: {macd_values[-1]:.4f}")
-    
-    print("\n💡 Note: RSI and MACD are calculated but not displayed on this chart.")
-    print("   Run 'python examples/indicators_rsi.py' and 'indicators_macd.py'")
-    print("   to see them in separate charts.")
-    
-    print("\n" + "=" * 80)
-    print("Rendering chart... Close the window to exit.")
-    print("=" * 80)
+    macd_last = last_valid(MACD.extract_values(macd_line, "value"))
+
+    lines = [
+        "\n✓ Chart created with indicators:",
+        "  ✓ Candlesticks",
+        "  ✓ SMA(20) - Blue line",
+        "  ✓ EMA(50) - Orange line",
+        "  ✓ Bollinger Bands - Purple lines",
+        "\n📊 Statistical Summary:",
+        f"  • Data points: {len(ohlc)}",
+        f"  • Price range: ${ohlc.low.min():.2f} - ${ohlc.high.max():.2f}",
+        f"  • Last close: ${ohlc.close[-1]:.2f}",
+        f"  • SMA(20): ${last_valid(sma_series.columns['value']):.2f}",
+        f"  • EMA(50): ${last_valid(ema_series.columns['value']):.2f}",
+    ]
+    if rsi_last is not None:
+        lines.append(f"  • RSI(14): {rsi_last:.2f}")
+    if macd_last is not None:
+        lines.append(f"  • MACD: {macd_last:.4f}")
+    lines += [
+        "\n💡 Note: RSI and MACD are calculated but not displayed on this chart.",
+        "   Run 'python examples/indicators_rsi.py' and 'indicators_macd.py'",
+        "   to see them in separate charts.",
+        "\n" + "=" * 80,
+        "Rendering chart... Close the window to exit.",
+        "=" * 80,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Render
     chart.render()
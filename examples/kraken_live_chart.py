@@ -1,53 +1,107 @@
 """
 Kraken Live Chart - Real-time PAXG/USD with WebSocket
-HYBRID: Uses OHLC + Trade feeds for real-time candle formation
+HYBRID: Uses REST OHLC history + the trade feed for real-time candle formation
 """
 
 from lightweight_charts import Chart, CandleStickStyleOptions, HistogramStyleOptions
 from datetime import datetime, timedelta
 import asyncio
 import websockets
-import json
 import logging
-import threading
 import time
-import requests
-from collections import deque
-from typing import Dict, List, Optional
+import numpy as np
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    import requests
+    HAS_AIOHTTP = False
+
+from _ring import CandleRing, local_datetime
+from _ws import HEARTBEATS, dumps, loads, new_event_loop, recv_batch, run_once
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+async def get_json(url: str, params: Dict[str, Any], timeout: float = 10) -> Tuple[int, Any]:
+    """
+    GET a JSON document without blocking the event loop.
+
+    Uses aiohttp when installed, otherwise runs requests in the default executor.
+
+    Returns:
+        (HTTP status, decoded body or None when the status is not 200)
+    """
+    if HAS_AIOHTTP:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await response.json(loads=loads)
+    
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(
+        None, partial(requests.get, url, params=params, timeout=timeout)
+    )
+    if response.status_code != 200:
+        return response.status_code, None
+    return response.status_code, loads(response.content)
+
+
+# Completed candles kept in memory
+CANDLE_CAPACITY = 200
+
 class KrakenLiveChart:
     """
     Real-time Kraken chart with HYBRID approach:
-    - OHLC feed for completed candles
+    - REST OHLC history for completed candles
     - Trade feed for live updates to current forming candle
+      (and for completing it, so no WebSocket OHLC feed is needed)
     """
     
     def __init__(self, pair: str = "PAXG/USD", interval: int = 5):
         self.pair = pair
         self.interval = interval  # Minutes
+        self._interval_seconds = interval * 60
         self.ws_url = "wss://ws.kraken.com"
         self.ws = None
         
-        # Data storage
-        self.candles = deque(maxlen=200)
+        # The subscribe frame never changes, so serialize it once
+        self._trade_sub = dumps({
+            "event": "subscribe",
+            "pair": [pair],
+            "subscription": {"name": "trade"}
+        })
+        
+        # Completed candles, oldest first
+        self.candles = CandleRing(CANDLE_CAPACITY)
         self.current_candle = None
+        # Epoch seconds of the forming candle's bucket
         self.current_candle_start_time = None
         
+        # Set by the trade handler, cleared once the chart has redrawn
+        self._dirty = False
+        # Set when a candle completes and the time scale needs the new bar
+        self._time_scale_stale = True
+        
         # Chart components
         self.chart = None
         self.candle_series = None
         self.volume_series = None
         
-        # Thread synchronization
+        # Cleared to stop listen()
         self.running = False
         
         logger.info(f"Kraken Live Chart: {pair} - {interval}m (HYBRID mode)")
     
-    def fetch_historical_data(self, num_candles: int = 100):
-        """Fetch historical OHLC data."""
+    async def fetch_historical_data(self, num_candles: int = 100):
+        """Fetch historical OHLC data (can run alongside connect())."""
         try:
             url = "https://api.kraken.com/0/public/OHLC"
             params = {
@@ -56,14 +110,12 @@ class KrakenLiveChart:
             }
             
             logger.info(f"Fetching historical data...")
-            response = requests.get(url, params=params, timeout=10)
+            status, data = await get_json(url, params)
             
-            if response.status_code != 200:
-                logger.error(f"Failed: {response.status_code}")
+            if status != 200:
+                logger.error(f"Failed: {status}")
                 return
             
-            data = response.json()
-            
             if "error" in data and data["error"]:
                 logger.error(f"API error: {data['error']}")
                 return
@@ -79,32 +131,28 @@ class KrakenLiveChart:
             
             # Store all but the last candle (last might be forming)
             for ohlc in ohlc_data[-num_candles:-1]:
-                timestamp = float(ohlc[0])
-                
-                candle = {
-                    "time": datetime.fromtimestamp(timestamp),
-                    "open": float(ohlc[1]),
-                    "high": float(ohlc[2]),
-                    "low": float(ohlc[3]),
-                    "close": float(ohlc[4]),
-                    "volume": float(ohlc[6])
-                }
-                
-                self.candles.append(candle)
+                self.candles.append(
+                    int(ohlc[0]),
+                    float(ohlc[1]),
+                    float(ohlc[2]),
+                    float(ohlc[3]),
+                    float(ohlc[4]),
+                    float(ohlc[6])
+                )
             
             # Initialize current candle from last OHLC
             if ohlc_data:
                 last = ohlc_data[-1]
                 timestamp = float(last[0])
                 self.current_candle = {
-                    "time": datetime.fromtimestamp(timestamp),
+                    "time": local_datetime(int(timestamp)),
                     "open": float(last[1]),
                     "high": float(last[2]),
                     "low": float(last[3]),
                     "close": float(last[4]),
                     "volume": float(last[6])
                 }
-                self.current_candle_start_time = self.current_candle["time"]
+                self.current_candle_start_time = int(last[0])
                 logger.info(f"Current forming candle initialized: {self.current_candle['time'].strftime('%H:%M')}")
             
             logger.info(f"✅ Loaded {len(self.candles)} completed + 1 forming candle")
@@ -143,38 +191,18 @@ class KrakenLiveChart:
         
         logger.info("✅ Chart created")
     
-    def _get_candle_start_time(self, trade_time: datetime) -> datetime:
-        """Get the start time of the candle period for a given trade time."""
-        minutes = (trade_time.minute // self.interval) * self.interval
-        return trade_time.replace(minute=minutes, second=0, microsecond=0)
-    
     async def connect(self):
         """Connect to Kraken WebSocket."""
         try:
-            self.ws = await websockets.connect(self.ws_url)
+            # Unbounded receive queue: listen() drains it in batches.
+            # Kraken frames are small JSON, so skip per-message deflate.
+            self.ws = await websockets.connect(self.ws_url, max_queue=None, compression=None)
             logger.info("✅ Connected to Kraken")
             
-            # Subscribe to trade feed first
-            trade_sub = {
-                "event": "subscribe",
-                "pair": [self.pair],
-                "subscription": {"name": "trade"}
-            }
-            await self.ws.send(json.dumps(trade_sub))
+            # Trades drive both the forming and the completed candles
+            await self.ws.send(self._trade_sub)
             logger.info(f"📊 Subscribed to {self.pair} TRADE feed")
             
-            # Small delay
-            await asyncio.sleep(0.1)
-            
-            # Subscribe to OHLC feed
-            ohlc_sub = {
-                "event": "subscribe",
-                "pair": [self.pair],
-                "subscription": {"name": "ohlc", "interval": self.interval}
-            }
-            await self.ws.send(json.dumps(ohlc_sub))
-            logger.info(f"📊 Subscribed to {self.pair} OHLC {self.interval}m")
-            
         except Exception as e:
             logger.error(f"Connection failed: {e}")
             raise
@@ -188,27 +216,12 @@ class KrakenLiveChart:
         self.running = True
         
         try:
-            async for message in self.ws:  # type: ignore[union-attr]
-                if not self.running:
-                    break
-                
-                data = json.loads(message)
-                
-                if isinstance(data, dict):
-                    event = data.get("event")
-                    if event in ["heartbeat", "systemStatus"]:
-                        continue
-                    elif event == "subscriptionStatus":
-                        logger.info(f"Subscription: {data.get('status')} - {data.get('channelName')}")
+            while self.running:
+                # One wakeup per burst; the handlers never await
+                for message in await recv_batch(self.ws):
+                    if message in HEARTBEATS:
                         continue
-                
-                if isinstance(data, list) and len(data) >= 4:
-                    channel_name = data[2] if len(data) > 2 else ""
-                    
-                    if "trade" in channel_name.lower():
-                        await self._process_trade(data)
-                    elif "ohlc" in channel_name.lower():
-                        await self._process_ohlc(data)
+                    self._handle_message(loads(message))
                     
         except websockets.exceptions.ConnectionClosed:
             logger.warning("WebSocket closed")
@@ -219,87 +232,103 @@ class KrakenLiveChart:
         finally:
             self.running = False
     
-    async def _process_trade(self, data: list):
+    def _handle_message(self, data):
+        """Dispatch one decoded WebSocket message."""
+        if isinstance(data, dict):
+            event = data.get("event")
+            if event == "subscriptionStatus":
+                logger.info(f"Subscription: {data.get('status')} - {data.get('channelName')}")
+            return
+        
+        if isinstance(data, list) and len(data) >= 4 and "trade" in data[2].lower():
+            self._process_trade(data)
+    
+    def _process_trade(self, data: list):
         """
         Process trade data to update current forming candle in REAL-TIME.
         Format: [channelID, [[price, volume, time, side, orderType, misc]], channelName, pair]
         """
         try:
             trades = data[1]
+            if not trades:
+                return
             
-            for trade in trades:
-                price = float(trade[0])
-                volume = float(trade[1])
-                trade_timestamp = float(trade[2])
-                
-                trade_time = datetime.fromtimestamp(trade_timestamp)
-                candle_start = self._get_candle_start_time(trade_time)
-                
-                # Initialize current candle if needed
-                if self.current_candle is None:
-                    self.current_candle = {
-                        "time": candle_start,
-                        "open": price,
-                        "high": price,
-                        "low": price,
-                        "close": price,
-                        "volume": volume
-                    }
-                    self.current_candle_start_time = candle_start
-                    print(f"✨ Started tracking candle at {candle_start.strftime('%H:%M')}")
-                    continue
-                
-                # Check if trade belongs to current candle
-                if candle_start == self.current_candle_start_time:
-                    # Update current candle with trade
-                    old_close = self.current_candle["close"]
-                    self.current_candle["high"] = max(self.current_candle["high"], price)
-                    self.current_candle["low"] = min(self.current_candle["low"], price)
-                    self.current_candle["close"] = price
-                    self.current_candle["volume"] += volume
-                    
-                    print(f"💹 TRADE UPDATE: {price:.2f} (Close {old_close:.2f}→{price:.2f}, Vol +{volume:.4f})")
-                else:
-                    # New candle period - save old one
-                    print(f"\\n🕯️ Candle completed: {self.current_candle['time'].strftime('%H:%M')}")
-                    self.candles.append(self.current_candle)
-                    
-                    # Start new candle
-                    self.current_candle = {
-                        "time": candle_start,
-                        "open": price,
-                        "high": price,
-                        "low": price,
-                        "close": price,
-                        "volume": volume
-                    }
-                    self.current_candle_start_time = candle_start
-                    print(f"✨ NEW candle started at {candle_start.strftime('%H:%M')}: O:{price:.2f}\\n")
+            prices = np.array([trade[0] for trade in trades], dtype=np.float64)
+            volumes = np.array([trade[1] for trade in trades], dtype=np.float64)
+            timestamps = np.array([trade[2] for trade in trades], dtype=np.float64).astype(np.int64)
+            
+            # Bucket in whole epoch seconds, then fold each run of trades that
+            # share a bucket into the candle in one step (usually one run)
+            buckets = timestamps - timestamps % self._interval_seconds
+            starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+            ends = np.r_[starts[1:], len(buckets)]
+            
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self._apply_trades(int(buckets[start]), prices[start:end], volumes[start:end])
             
         except Exception as e:
             logger.error(f"Trade processing error: {e}")
     
-    async def _process_ohlc(self, data: list):
-        """Process OHLC data for candle completion confirmation."""
-        try:
-            ohlc_data = data[1]
-            if len(ohlc_data) < 8:
-                return
-            
-            timestamp = float(ohlc_data[0])
-            candle_time = datetime.fromtimestamp(timestamp)
-            
-            # OHLC messages confirm candle completion
-            # We already handle this with trades, but this serves as backup
-            print(f"📊 OHLC confirmation for {candle_time.strftime('%H:%M')}")
+    def _apply_trades(self, candle_start: int, prices: np.ndarray, volumes: np.ndarray):
+        """Fold consecutive trades from one candle period into the forming candle."""
+        high = float(prices.max())
+        low = float(prices.min())
+        close = float(prices[-1])
+        volume = float(volumes.sum())
+        
+        # Check if trades belong to current candle
+        if self.current_candle is not None and candle_start == self.current_candle_start_time:
+            old_close = self.current_candle["close"]
+            self.current_candle["high"] = max(self.current_candle["high"], high)
+            self.current_candle["low"] = min(self.current_candle["low"], low)
+            self.current_candle["close"] = close
+            self.current_candle["volume"] += volume
+            self._dirty = True
             
-        except Exception as e:
-            logger.error(f"OHLC error: {e}")
+            # Guarded so nothing is formatted on the hot path unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"💹 TRADE UPDATE: {len(prices)} trade(s) "
+                    f"(Close {old_close:.2f}→{close:.2f}, Vol +{volume:.4f})"
+                )
+            return
+        
+        if self.current_candle is not None:
+            # New candle period - save old one
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🕯️ Candle completed: {self.current_candle['time'].strftime('%H:%M')}")
+            candle = self.current_candle
+            self.candles.append(
+                self.current_candle_start_time,
+                candle["open"],
+                candle["high"],
+                candle["low"],
+                candle["close"],
+                candle["volume"]
+            )
+        
+        # Start new candle; the datetime is only built here
+        candle_time = local_datetime(candle_start)
+        self.current_candle = {
+            "time": candle_time,
+            "open": float(prices[0]),
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume
+        }
+        self.current_candle_start_time = candle_start
+        self._time_scale_stale = True
+        self._dirty = True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"✨ NEW candle started at {candle_time.strftime('%H:%M')}: O:{prices[0]:.2f}")
     
     def update_chart(self):
         """Update chart with current candle - TradingView style."""
         if not self.chart or not self.candle_series or not self.current_candle:
             return
+        if not self._dirty:
+            return
         
         try:
             # Update candle series with current bar (TradingView approach)
@@ -309,17 +338,19 @@ class KrakenLiveChart:
             volume_bar = {"time": self.current_candle["time"], "value": self.current_candle["volume"]}
             self.volume_series.update(volume_bar)  # type: ignore[union-attr]
             
-            # Update time scale with all data
-            all_candles = list(self.candles) + [self.current_candle]
-            self.chart.update_time_scale_data(all_candles)
+            # The series already holds every bar; the time scale only needs
+            # them again when a candle completes
+            if self._time_scale_stale:
+                self.chart.update_time_scale_data(self.candle_series.data)
+                self._time_scale_stale = False
             
-            # Force visual update for each pane
+            # Rebuild each pane's visuals, then redraw the canvas once
             for pane in self.chart.panes:
                 pane.update_price_scale()
                 pane.update_visuals()
             
-            # Force canvas redraw
             self.chart.canvas.update()
+            self._dirty = False
             
         except Exception as e:
             logger.error(f"Chart update error: {e}")
@@ -331,21 +362,6 @@ class KrakenLiveChart:
             await self.ws.close()
 
 
-def run_websocket(live_chart):
-    """Run WebSocket in thread."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    async def ws_main():
-        try:
-            await live_chart.connect()
-            await live_chart.listen()
-        except Exception as e:
-            logger.error(f"WS error: {e}")
-    
-    loop.run_until_complete(ws_main())
-
-
 def main():
     """Main function."""
     print("🚀 Kraken LIVE Chart - HYBRID MODE")
@@ -355,21 +371,51 @@ def main():
     
     live_chart = KrakenLiveChart(pair="PAXG/USD", interval=5)
     
+    # One asyncio loop owned by this (GUI) thread, so trades and redraws
+    # never run concurrently
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    
+    # Overlap the REST history request with the WebSocket handshake
     print("📥 Fetching historical data...")
-    live_chart.fetch_historical_data(num_candles=100)
+    _, connected = loop.run_until_complete(asyncio.gather(
+        live_chart.fetch_historical_data(num_candles=100),
+        live_chart.connect(),
+        return_exceptions=True
+    ))
+    if isinstance(connected, Exception):
+        logger.error(f"WS error: {connected}")
     
     live_chart.create_chart()
     
     # Initial display
-    if live_chart.candles or live_chart.current_candle:
-        all_candles = list(live_chart.candles)
+    if len(live_chart.candles) or live_chart.current_candle:
+        candles = live_chart.candles.view()
+        # Local-time datetimes, matching the ones built for live trades
+        times = np.array([local_datetime(t) for t in candles["time"].tolist()], dtype=object)
+        
+        if len(candles):
+            live_chart.candle_series.set_data_columnar(  # type: ignore[union-attr]
+                time=times,
+                open=candles["open"],
+                high=candles["high"],
+                low=candles["low"],
+                close=candles["close"]
+            )
+            live_chart.volume_series.set_data_columnar(  # type: ignore[union-attr]
+                time=times,
+                value=candles["volume"]
+            )
         if live_chart.current_candle:
-            all_candles.append(live_chart.current_candle)
+            current = live_chart.current_candle
+            live_chart.candle_series.update(current)  # type: ignore[union-attr]
+            live_chart.volume_series.update(  # type: ignore[union-attr]
+                {"time": current["time"], "value": current["volume"]}
+            )
         
-        live_chart.candle_series.set_data(all_candles)  # type: ignore[union-attr]
-        volume_data = [{"time": c["time"], "value": c["volume"]} for c in all_candles]
-        live_chart.volume_series.set_data(volume_data)  # type: ignore[union-attr]
+        all_candles = live_chart.candle_series.data  # type: ignore[union-attr]
         live_chart.chart.update_time_scale_data(all_candles)  # type: ignore[union-attr]
+        live_chart._time_scale_stale = False
         
         # Force initial render
         for pane in live_chart.chart.panes:  # type: ignore[union-attr]
@@ -378,27 +424,39 @@ def main():
         
         print(f"✅ Displaying {len(all_candles)} candles (including forming candle)")
     
-    # Start WebSocket
-    ws_thread = threading.Thread(target=run_websocket, args=(live_chart,), daemon=True)
-    ws_thread.start()
+    # Trades queued since connecting are handled on the first timer tick
+    ws_task = loop.create_task(live_chart.listen())
     
     print("✅ WebSocket started - Trade feed active!")
     
-    # Chart updates at 10 FPS
+    # Step the asyncio loop every 5 ms so frames are read as they arrive;
+    # chart updates at 10 FPS
     from vispy import app
     
+    def step_loop(event):
+        run_once(loop)
+    
     def update_timer(event):
         live_chart.update_chart()
     
+    loop_timer = app.Timer(interval=0.005, connect=step_loop, start=True)
     timer = app.Timer(interval=0.1, connect=update_timer, start=True)
     
     print("✅ Chart ready!")
     print("\\n💡 Watch the LAST candle update in real-time as trades occur!")
-    print("📈 High/Low/Close will change with every trade")
+    print("📈 High/Low/Close will change with every trade (run with DEBUG logging to see each one)")
     print("🛑 Close window to exit\\n")
     
-    if live_chart.chart:
-        live_chart.chart.render()  # type: ignore[union-attr]
+    try:
+        if live_chart.chart:
+            live_chart.chart.render()  # type: ignore[union-attr]
+    finally:
+        loop_timer.stop()
+        timer.stop()
+        live_chart.running = False
+        ws_task.cancel()
+        loop.run_until_complete(asyncio.gather(ws_task, return_exceptions=True))
+        loop.close()
 
 
 if __name__ == "__main__":
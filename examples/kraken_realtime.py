@@ -7,14 +7,20 @@ from lightweight_charts import Chart, CandleStickStyleOptions, HistogramStyleOpt
 from datetime import datetime, timedelta
 import asyncio
 import websockets
-import json
 import logging
 from collections import defaultdict
+import numpy as np
 from typing import Dict, List, Optional
 
+from _ring import CandleRing, local_datetime
+from _ws import HEARTBEATS, dumps, loads, recv_batch
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Completed candles kept in memory
+CANDLE_CAPACITY = 200
+
 class KrakenWebSocket:
     """
     Kraken WebSocket client for real-time OHLC and trade data.
@@ -36,8 +42,18 @@ class KrakenWebSocket:
         # Convert pair format for Kraken (PAXG/USD -> XAU/USD in Kraken format)
         self.kraken_pair = self._convert_pair_format(pair)
         
+        # The subscribe frame never changes, so serialize it once
+        self._subscribe_message = dumps({
+            "event": "subscribe",
+            "pair": [self.kraken_pair],
+            "subscription": {
+                "name": "ohlc",
+                "interval": interval
+            }
+        })
+        
         # Store candle data
-        self.candles: List[Dict] = []
+        self.candles = CandleRing(CANDLE_CAPACITY)
         self.current_candle: Optional[Dict] = None
         self.volumes: Dict[datetime, float] = {}
         
@@ -68,20 +84,13 @@ class KrakenWebSocket:
     async def connect(self):
         """Connect to Kraken WebSocket."""
         try:
-            self.ws = await websockets.connect(self.ws_url)
+            # Unbounded receive queue: listen() drains it in batches.
+            # Kraken frames are small JSON, so skip per-message deflate.
+            self.ws = await websockets.connect(self.ws_url, max_queue=None, compression=None)
             logger.info(f"✅ Connected to Kraken WebSocket")
             
             # Subscribe to OHLC (candles) data
-            subscribe_message = {
-                "event": "subscribe",
-                "pair": [self.kraken_pair],
-                "subscription": {
-                    "name": "ohlc",
-                    "interval": self.interval
-                }
-            }
-            
-            await self.ws.send(json.dumps(subscribe_message))
+            await self.ws.send(self._subscribe_message)
             logger.info(f"📊 Subscribed to OHLC {self.interval}m for {self.kraken_pair}")
             
         except Exception as e:
@@ -95,35 +104,38 @@ class KrakenWebSocket:
             return
             
         try:
-            async for message in self.ws:  # type: ignore[union-attr]
-                data = json.loads(message)
-                
-                # Skip heartbeat and system messages
-                if isinstance(data, dict):
-                    event = data.get("event")
-                    if event == "heartbeat":
+            while True:
+                # One wakeup per burst; the handlers never await
+                for message in await recv_batch(self.ws):
+                    if message in HEARTBEATS:
                         continue
-                    elif event == "systemStatus":
-                        logger.info(f"System status: {data.get('status')}")
-                        continue
-                    elif event == "subscriptionStatus":
-                        status = data.get('status')
-                        if status == "error":
-                            logger.error(f"❌ Subscription error: {data}")
-                        else:
-                            logger.info(f"Subscription: {status} - {data.get('channelName')}")
-                        continue
-                
-                # Process OHLC data
-                if isinstance(data, list) and len(data) >= 4:
-                    await self._process_ohlc(data)
+                    self._handle_message(loads(message))
                     
         except websockets.exceptions.ConnectionClosed:
             logger.warning("⚠️ WebSocket connection closed")
         except Exception as e:
             logger.error(f"❌ Error in listen loop: {e}")
     
-    async def _process_ohlc(self, data: list):
+    def _handle_message(self, data):
+        """Dispatch one decoded WebSocket message."""
+        # Skip heartbeat and system messages
+        if isinstance(data, dict):
+            event = data.get("event")
+            if event == "systemStatus":
+                logger.info(f"System status: {data.get('status')}")
+            elif event == "subscriptionStatus":
+                status = data.get('status')
+                if status == "error":
+                    logger.error(f"❌ Subscription error: {data}")
+                else:
+                    logger.info(f"Subscription: {status} - {data.get('channelName')}")
+            return
+        
+        # Process OHLC data
+        if isinstance(data, list) and len(data) >= 4:
+            self._process_ohlc(data)
+    
+    def _process_ohlc(self, data: list):
         """
         Process OHLC data from Kraken.
         
@@ -147,7 +159,7 @@ class KrakenWebSocket:
             volume = float(ohlc_data[7])
             
             # Convert timestamp to datetime
-            dt = datetime.fromtimestamp(timestamp)
+            dt = local_datetime(timestamp)
             
             # Create candle dict
             candle = {
@@ -169,7 +181,15 @@ class KrakenWebSocket:
                 # New candle
                 if self.current_candle:
                     # Finalize previous candle
-                    self.candles.append(self.current_candle)
+                    previous = self.current_candle
+                    self.candles.append(
+                        int(previous["time"].timestamp()),
+                        previous["open"],
+                        previous["high"],
+                        previous["low"],
+                        previous["close"],
+                        previous["volume"]
+                    )
                     if self.on_new_candle:
                         self.on_new_candle(self.current_candle)
                 
@@ -185,9 +205,9 @@ class KrakenWebSocket:
             await self.ws.close()
             logger.info("Disconnected from Kraken WebSocket")
     
-    def get_candles(self) -> List[Dict]:
-        """Get all completed candles."""
-        return self.candles.copy()
+    def get_candles(self) -> np.ndarray:
+        """Get the most recent completed candles (``OHLCV_DTYPE`` records, oldest first)."""
+        return self.candles.view().copy()
     
     def get_current_candle(self) -> Optional[Dict]:
         """Get the current (incomplete) candle."""
@@ -3,47 +3,39 @@ Example: Maximized Window Chart
 Opens chart in maximized window (fills screen but keeps window controls)
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, CandleStickStyleOptions, LineStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import Chart, CandleStickStyleOptions, LineStyleOptions, OHLCColumns
 import numpy as np
 
 
-def generate_ohlc_data(num_candles: int = 200):
+def generate_ohlc_data(num_candles: int = 200, seed: int = 0) -> OHLCColumns:
     """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    noise = rng.standard_normal((num_candles, 3))
+    volumes = rng.integers(1000000, 10000000, size=num_candles, dtype=np.int64).astype(np.int32)
     
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
+    # Random walk of closes; each candle opens at the previous close
+    close_price = 100 + np.cumsum(noise[:, 0] * 3)
+    open_price = np.concatenate(([100.0], close_price[:-1]))
+    high_price = np.maximum(open_price, close_price) + np.abs(noise[:, 1] * 2)
+    low_price = np.minimum(open_price, close_price) - np.abs(noise[:, 2] * 2)
     
-    return data
+    return OHLCColumns(
+        time=np.arange(base_date, base_date + num_candles),
+        open=open_price,
+        high=high_price,
+        low=low_price,
+        close=close_price,
+        volume=volumes
+    )
+
+
+def moving_average(closes: np.ndarray, period: int) -> np.ndarray:
+    """Trailing mean of the last `period` closes, NaN for the first `period` candles."""
+    result = np.full(len(closes), np.nan)
+    window_means = np.convolve(closes, np.ones(period) / period, mode="valid")
+    result[period:] = window_means[1:]
+    return result
 
 
 def main():
@@ -64,7 +56,7 @@ def main():
     )
 
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(200)
+    ohlc = generate_ohlc_data(200)
 
     # Add candlestick series
     candle_series = chart.add_candlestick_series(
@@ -75,43 +67,28 @@ def main():
             wick_color="#FFFFFF"
         )
     )
-    candle_series.set_data(ohlc_data)
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
 
     # Add moving averages
     # MA20
-    ma20_data = []
-    for i in range(len(ohlc_data)):
-        if i < 20:
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-19:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": avg})
-    
     ma20_series = chart.add_line_series(
         "MA20",
         LineStyleOptions(color="#FFD700", width=2)  # Gold
     )
-    ma20_series.set_data(ma20_data)
+    ma20_series.set_data_columnar(time=ohlc.time, value=moving_average(ohlc.close, 20))
 
     # MA50
-    ma50_data = []
-    for i in range(len(ohlc_data)):
-        if i < 50:
-            ma50_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-49:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma50_data.append({"time": ohlc_data[i]["time"], "value": avg})
-    
     ma50_series = chart.add_line_series(
         "MA50",
         LineStyleOptions(color="#9C27B0", width=2)  # Purple
     )
-    ma50_series.set_data(ma50_data)
+    ma50_series.set_data_columnar(time=ohlc.time, value=moving_average(ohlc.close, 50))
 
     # Set time scale
-    chart.update_time_scale_data(ohlc_data)
+    chart.update_time_scale_data(candle_series.columns)
 
     print("\n✨ Opening maximized window...")
     print("   Window controls (close, minimize, resize) are still available!")
@@ -3,22 +3,20 @@ Example: Multi-Pane Chart with Indicators
 Demonstrates the multi-pane layout system
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, CandleStickStyleOptions, LineStyleOptions, HistogramStyleOptions
+from lightweight_charts import (
+    Chart,
+    CandleStickStyleOptions,
+    LineStyleOptions,
+    HistogramStyleOptions,
+    VALUE_DTYPE
+)
 from lightweight_charts.indicators import RSI, MACD
-from datetime import datetime, timedelta
 import numpy as np
 import logging
 
+from _data_cache import cached_ohlc
+from _synth import generate_ohlc
+
 # Enable INFO logging to see pane ranges
 logging.basicConfig(
     level=logging.INFO,
@@ -26,34 +24,6 @@ logging.basicConfig(
 )
 
 
-def generate_ohlc_data(num_candles: int = 200):
-    """Generate synthetic OHLC data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
-    
-    return data
-
-
 def main():
     print("=" * 70)
     print("Multi-Pane Chart Demo")
@@ -75,7 +45,7 @@ def main():
     )
 
     # Generate OHLC data
-    ohlc_data = generate_ohlc_data(200)
+    ohlc = cached_ohlc("multi_pane_chart", generate_ohlc, 200).astype(np.float32)
 
     # ==========  PANE 1: Main Chart (Price Action) ==========
     print("\n📊 Creating Pane 1: Main Chart (70% height)...")
@@ -90,17 +60,18 @@ def main():
             wick_color="#FFFFFF"
         )
     )
-    candles.set_data(ohlc_data)
-    
-    # Add MA20 to main pane
-    ma20_data = []
-    for i in range(len(ohlc_data)):
-        if i < 20:
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": np.nan})
-        else:
-            window = ohlc_data[i-19:i+1]
-            avg = np.mean([c["close"] for c in window])
-            ma20_data.append({"time": ohlc_data[i]["time"], "value": avg})
+    candles.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+    ohlc_data = candles.data
+    
+    # Add MA20 to main pane (rolling mean from a running sum, NaN until the window fills)
+    csum = np.concatenate(([0.0], np.cumsum(ohlc.close)))
+    ma20_data = np.empty(len(ohlc.close), dtype=VALUE_DTYPE)
+    ma20_data["time"] = ohlc.time
+    ma20_data["value"][:19] = np.nan
+    ma20_data["value"][19:] = (csum[20:] - csum[:-20]) / 20
     
     ma20 = main_pane.add_line_series(
         "MA20",
@@ -122,21 +93,22 @@ def main():
     )
     rsi_line.set_data(rsi_data)
     
-    # Add overbought/oversold reference lines (70/30)
-    overbought_data = [{"time": d["time"], "value": 70} for d in ohlc_data]
-    oversold_data = [{"time": d["time"], "value": 30} for d in ohlc_data]
+    # Add overbought/oversold reference lines (70/30). Lines are drawn
+    # against the bar index, so they need a value for every bar.
+    overbought_values = np.full(len(ohlc.time), 70.0)
+    oversold_values = np.full(len(ohlc.time), 30.0)
     
     ob_line = rsi_pane.add_line_series(
         "OB(70)",
         LineStyleOptions(color="#FF4444", width=1)
     )
-    ob_line.set_data(overbought_data)
+    ob_line.set_data_columnar(time=ohlc.time, value=overbought_values)
     
     os_line = rsi_pane.add_line_series(
         "OS(30)",
         LineStyleOptions(color="#44FF44", width=1)
     )
-    os_line.set_data(oversold_data)
+    os_line.set_data_columnar(time=ohlc.time, value=oversold_values)
     
     # ==========  PANE 3: MACD Indicator ==========
     print("📉 Creating Pane 3: MACD (15% height)...")
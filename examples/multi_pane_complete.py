@@ -3,9 +3,8 @@ Complete Multi-Pane Chart Example
 Demonstrates professional multi-pane layout with synchronized crosshair
 """
 
-from lightweight_charts import Chart
+from lightweight_charts import Chart, OHLCColumns
 from lightweight_charts.indicators import MovingAverage, RSI, MACD
-from datetime import datetime, timedelta
 import numpy as np
 import logging
 
@@ -13,42 +12,39 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def generate_realistic_ohlc_data(days: int = 100, start_price: float = 100.0):
+def generate_realistic_ohlc_data(days: int = 100, start_price: float = 100.0, seed: int = 42) -> OHLCColumns:
     """Generate realistic OHLC data with volume"""
-    np.random.seed(42)
-    data = []
-    current_price = start_price
-    base_date = datetime(2024, 1, 1)
-    
-    for i in range(days):
-        # Add trend and noise
-        trend = 0.1 * np.sin(i / 10)  # Sine wave trend
-        noise = np.random.randn() * 2  # Random noise
-        
-        current_price = max(10, current_price + trend + noise)
-        
-        # Generate OHLC
-        daily_range = abs(np.random.randn()) * 3
-        open_price = current_price + np.random.randn() * 0.5
-        close_price = current_price + np.random.randn() * 0.5
-        high_price = max(open_price, close_price) + daily_range * 0.7
-        low_price = min(open_price, close_price) - daily_range * 0.3
-        
-        # Generate volume (higher on big moves)
-        price_change = abs(close_price - open_price)
-        base_volume = 1000000
-        volume = base_volume * (1 + price_change / current_price * 10) * (0.5 + np.random.rand())
-        
-        data.append({
-            "time": base_date + timedelta(days=i),
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": volume
-        })
-    
-    return data
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    draws = rng.standard_normal((days, 4))
+    volume_factors = rng.random(days)
+    
+    # Random walk with a sine wave trend, floored at 10. Adding back the
+    # deepest dip below the floor so far gives price = max(10, price + step).
+    steps = 0.1 * np.sin(np.arange(days) / 10) + draws[:, 0] * 2
+    walk = start_price + np.cumsum(steps)
+    price = walk + np.maximum(np.maximum.accumulate(10 - walk), 0)
+    
+    # Generate OHLC
+    daily_range = np.abs(draws[:, 1]) * 3
+    open_p = price + draws[:, 2] * 0.5
+    close_p = price + draws[:, 3] * 0.5
+    high_p = np.maximum(open_p, close_p) + daily_range * 0.7
+    low_p = np.minimum(open_p, close_p) - daily_range * 0.3
+    
+    # Generate volume (higher on big moves)
+    price_change = np.abs(close_p - open_p)
+    volume = 1000000 * (1 + price_change / price * 10) * (0.5 + volume_factors)
+    volume = volume.astype(np.float32)  # Plenty of precision for histogram bars
+    
+    return OHLCColumns(
+        time=np.arange(base_date, base_date + days),
+        open=open_p,
+        high=high_p,
+        low=low_p,
+        close=close_p,
+        volume=volume
+    )
 
 
 def main():
@@ -59,18 +55,7 @@ def main():
     
     # Generate data
     print("📊 Generating OHLC data...")
-    ohlc_data = generate_realistic_ohlc_data(days=150, start_price=100)
-    
-    # Calculate indicators
-    print("📈 Calculating indicators...")
-    sma_20 = MovingAverage.sma(ohlc_data, period=20)
-    sma_50 = MovingAverage.sma(ohlc_data, period=50)
-    rsi_data = RSI.calculate(ohlc_data, period=14)
-    macd_line, signal_line, histogram = MACD.calculate(ohlc_data)
-    
-    # Extract volume data
-    volume_data = [{"time": d["time"], "value": d["volume"]} for d in ohlc_data]
-    
+    ohlc = generate_realistic_ohlc_data(days=150, start_price=100)
     print("✅ Data prepared!")
     print()
     
@@ -120,7 +105,18 @@ def main():
             body_width=0.6
         )
     )
-    candles.set_data(ohlc_data)
+    candles.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
+    ohlc_data = candles.data
+    
+    # Calculate indicators
+    print("  → Calculating indicators...")
+    sma_20 = MovingAverage.sma(ohlc_data, period=20)
+    sma_50 = MovingAverage.sma(ohlc_data, period=50)
+    rsi_data = RSI.calculate(ohlc_data, period=14)
+    macd_line, signal_line, histogram = MACD.calculate(ohlc_data)
     
     sma20_series = main_pane.add_line_series(
         "SMA 20",
@@ -145,7 +141,7 @@ def main():
             bar_width=0.8
         )
     )
-    volume_series.set_data(volume_data)
+    volume_series.set_data_columnar(time=ohlc.time, value=ohlc.volume)
     
     # RSI pane: Line
     print("  → RSI pane: RSI Line")
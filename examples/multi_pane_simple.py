@@ -3,41 +3,36 @@ Simple Multi-Pane Example
 Shows basic multi-pane setup with price and volume
 """
 
-from lightweight_charts import Chart, CandleStickStyleOptions, HistogramStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import Chart, CandleStickStyleOptions, HistogramStyleOptions, OHLCColumns
 import numpy as np
 
 # Generate sample data
-def generate_data(days=100):
-    np.random.seed(42)
-    data = []
-    price = 100.0
-    base_date = datetime(2024, 1, 1)
+def generate_data(days=100, seed=42):
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    draws = rng.standard_normal((days, 4))
+    volume_factors = rng.random(days)
     
-    for i in range(days):
-        price += np.random.randn() * 2
-        daily_range = abs(np.random.randn()) * 3
-        
-        open_p = price + np.random.randn() * 0.5
-        close_p = price + np.random.randn() * 0.5
-        high_p = max(open_p, close_p) + daily_range * 0.7
-        low_p = min(open_p, close_p) - daily_range * 0.3
-        volume = 1000000 * (0.5 + np.random.rand())
-        
-        data.append({
-            "time": base_date + timedelta(days=i),
-            "open": open_p,
-            "high": high_p,
-            "low": low_p,
-            "close": close_p,
-            "volume": volume
-        })
+    price = 100.0 + np.cumsum(draws[:, 0] * 2)
+    daily_range = np.abs(draws[:, 1]) * 3
     
-    return data
+    open_p = price + draws[:, 2] * 0.5
+    close_p = price + draws[:, 3] * 0.5
+    high_p = np.maximum(open_p, close_p) + daily_range * 0.7
+    low_p = np.minimum(open_p, close_p) - daily_range * 0.3
+    volume = (1000000 * (0.5 + volume_factors)).astype(np.float32)
+    
+    return OHLCColumns(
+        time=np.arange(base_date, base_date + days),
+        open=open_p,
+        high=high_p,
+        low=low_p,
+        close=close_p,
+        volume=volume
+    )
 
 # Generate data
-ohlc_data = generate_data(100)
-volume_data = [{"time": d["time"], "value": d["volume"]} for d in ohlc_data]
+ohlc = generate_data(100)
 
 # Create chart
 chart = Chart(1200, 700, title="Price & Volume - Multi-Pane", background_color="#1E222D")
@@ -51,17 +46,20 @@ candles = price_pane.add_candlestick_series(
     "BTC/USD",
     CandleStickStyleOptions(up_color="#26A69A", down_color="#EF5350")
 )
-candles.set_data(ohlc_data)
+candles.set_data_columnar(
+    time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+    volume=ohlc.volume
+)
 
 # Add volume histogram to volume pane
 volume = volume_pane.add_histogram_series(
     "Volume",
     HistogramStyleOptions(color="#4CAF50", bar_width=0.8)
 )
-volume.set_data(volume_data)
+volume.set_data_columnar(time=ohlc.time, value=ohlc.volume)
 
 # Configure
-chart.update_time_scale_data(ohlc_data)
+chart.update_time_scale_data(candles.columns)
 chart.set_crosshair_colors(vert_color="#00FFFF", horiz_color="#FF00FF")
 
 print("✅ Two-pane chart ready!")
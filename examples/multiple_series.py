@@ -3,73 +3,48 @@ Example 3: Multiple Series
 Display multiple series (candles + moving averages) on same chart
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from lightweight_charts import (
     Chart,
     LineStyleOptions,
     CandleStickStyleOptions,
-    AreaStyleOptions
+    AreaStyleOptions,
+    OHLCColumns
 )
-from datetime import datetime, timedelta
 import numpy as np
 
 
-def generate_ohlc_with_ma(num_candles: int = 100):
-    """Generate OHLC data with moving averages."""
-    base_date = datetime(2024, 1, 1)
-    ohlc_data = []
-    price = 100
-    
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        high_price = max(open_price, close_price) + abs(np.random.randn() * 2)
-        low_price = min(open_price, close_price) - abs(np.random.randn() * 2)
-        
-        ohlc_data.append({
-            "time": date,
-            "open": open_price,
-            "high": high_price,
-            "low": low_price,
-            "close": close_price,
-            "volume": np.random.randint(1000000, 10000000)
-        })
-        
-        price = close_price
+def trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last `window` values at each point (fewer at the start)."""
+    n = len(values)
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    end = np.arange(1, n + 1)
+    return (csum[end] - csum[np.maximum(end - window, 0)]) / np.minimum(end, window)
+
+
+def generate_ohlc_with_ma(num_candles: int = 100, seed: int = 0):
+    """Generate OHLC columns with MA20 and MA50 arrays."""
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    noise = rng.standard_normal((num_candles, 3))
+    volumes = rng.integers(1000000, 10000000, size=num_candles, dtype=np.int64).astype(np.int32)
     
-    # Calculate moving averages
-    ma20_data = []
-    ma50_data = []
+    # Random walk of closes; each candle opens at the previous close
+    close_price = 100 + np.cumsum(noise[:, 0] * 3)
+    open_price = np.concatenate(([100.0], close_price[:-1]))
+    high_price = np.maximum(open_price, close_price) + np.abs(noise[:, 1] * 2)
+    low_price = np.minimum(open_price, close_price) - np.abs(noise[:, 2] * 2)
     
-    for i, candle in enumerate(ohlc_data):
-        # MA20
-        start_ma20 = max(0, i - 19)
-        ma20 = np.mean([c["close"] for c in ohlc_data[start_ma20:i+1]])
-        ma20_data.append({
-            "time": candle["time"],
-            "value": ma20
-        })
-        
-        # MA50
-        start_ma50 = max(0, i - 49)
-        ma50 = np.mean([c["close"] for c in ohlc_data[start_ma50:i+1]])
-        ma50_data.append({
-            "time": candle["time"],
-            "value": ma50
-        })
+    ohlc = OHLCColumns(
+        time=np.arange(base_date, base_date + num_candles),
+        open=open_price,
+        high=high_price,
+        low=low_price,
+        close=close_price,
+        volume=volumes
+    )
     
-    return ohlc_data, ma20_data, ma50_data
+    # Calculate moving averages (partial windows over the first candles)
+    return ohlc, trailing_mean(close_price, 20), trailing_mean(close_price, 50)
 
 
 def main():
@@ -81,7 +56,7 @@ def main():
     )
 
     # Generate data
-    ohlc_data, ma20_data, ma50_data = generate_ohlc_with_ma(100)
+    ohlc, ma20, ma50 = generate_ohlc_with_ma(100)
 
     # Add candlestick series
     candle_series = chart.add_candlestick_series(
@@ -91,7 +66,10 @@ def main():
             down_color="#ef5350"
         )
     )
-    candle_series.set_data(ohlc_data)
+    candle_series.set_data_columnar(
+        time=ohlc.time, open=ohlc.open, high=ohlc.high, low=ohlc.low, close=ohlc.close,
+        volume=ohlc.volume
+    )
 
     # Add MA20 line
     ma20_series = chart.add_line_series(
@@ -101,7 +79,7 @@ def main():
             width=2
         )
     )
-    ma20_series.set_data(ma20_data)
+    ma20_series.set_data_columnar(time=ohlc.time, value=ma20)
 
     # Add MA50 line
     ma50_series = chart.add_line_series(
@@ -111,10 +89,10 @@ def main():
             width=2
         )
     )
-    ma50_series.set_data(ma50_data)
+    ma50_series.set_data_columnar(time=ohlc.time, value=ma50)
 
     # Set time scale
-    chart.update_time_scale_data(ohlc_data)
+    chart.update_time_scale_data(candle_series.columns)
 
     # Render chart
     print("Rendering chart... Close the window to exit.")
@@ -3,20 +3,16 @@ Price Scale Visual Demo
 Demonstrates the visual price scale with labels and tick marks
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from lightweight_charts import (
     Chart,
     CandleStickStyleOptions,
     LineStyleOptions,
     PriceScaleOptions,
     PriceScaleMode,
-    PriceScaleMargins
+    PriceScaleMargins,
+    to_list
 )
 from lightweight_charts.indicators import MovingAverage
-from datetime import datetime, timedelta
 import numpy as np
 
 def main():
@@ -35,30 +31,25 @@ def main():
     print("\n📊 Generating sample data...")
     
     # Generate realistic OHLC data
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 45000  # Starting BTC price
-    
-    for i in range(100):
-        # Random walk with slight uptrend
-        change = np.random.randn() * 500 + 50
-        
-        open_p = price
-        close_p = price + change
-        high_p = max(open_p, close_p) + abs(np.random.randn() * 200)
-        low_p = min(open_p, close_p) - abs(np.random.randn() * 200)
-        volume = np.random.uniform(100, 1000)
-        
-        data.append({
-            "time": base_date + timedelta(days=i),
-            "open": open_p,
-            "high": high_p,
-            "low": low_p,
-            "close": close_p,
-            "volume": volume
-        })
-        
-        price = close_p
+    rng = np.random.default_rng(0)
+    base_date = np.datetime64("2024-01-01")
+    dates = to_list(np.arange(base_date, base_date + 100))
+    noise = rng.standard_normal((100, 3))
+    volumes = rng.uniform(100, 1000, size=100)
+    
+    # Random walk with slight uptrend from a $45,000 start; each candle opens
+    # at the previous close
+    close_p = 45000 + np.cumsum(noise[:, 0] * 500 + 50)
+    open_p = np.concatenate(([45000.0], close_p[:-1]))
+    high_p = np.maximum(open_p, close_p) + np.abs(noise[:, 1] * 200)
+    low_p = np.minimum(open_p, close_p) - np.abs(noise[:, 2] * 200)
+    
+    data = [
+        {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for t, o, h, l, c, v in zip(
+            dates, open_p.tolist(), high_p.tolist(), low_p.tolist(), close_p.tolist(), volumes.tolist()
+        )
+    ]
     
     print(f"✅ Generated {len(data)} candles")
     print(f"   Price range: ${data[0]['open']:.2f} → ${data[-1]['close']:.2f}")
@@ -2,38 +2,33 @@
 Example 7: Real-time Updates
 Simulating real-time data streaming to the chart
 Note: This is a simplified example. In production, you would connect to a real data feed.
+Each new point is pushed with series.update(), which writes only that point
+instead of reloading the whole series. Indicators follow the same pattern:
+IncrementalSMA/IncrementalRSI carry their state forward, so each tick is O(1).
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, LineStyleOptions, CandleStickStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import (
+    Chart,
+    LineStyleOptions,
+    CandleStickStyleOptions,
+    IncrementalSMA,
+    IncrementalRSI,
+    to_list
+)
 import numpy as np
 
 
-def generate_initial_data(num_points: int = 50):
+def generate_initial_data(num_points: int = 50, seed: int = 0):
     """Generate initial historical data."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    dates = to_list(np.arange(base_date, base_date + num_points))
+    prices = 100 + np.cumsum(rng.standard_normal(num_points) * 2)
     
-    for i in range(num_points):
-        date = base_date + timedelta(days=i)
-        price += np.random.randn() * 2
-        data.append({
-            "time": date,
-            "value": price
-        })
-    
-    return data
+    return [
+        {"time": date, "value": price}
+        for date, price in zip(dates, prices.tolist())
+    ]
 
 
 def main():
@@ -51,8 +46,9 @@ def main():
         title="Real-time Price Stream"
     )
 
-    # Generate initial data
-    initial_data = generate_initial_data(50)
+    # Generate initial data; the last 10 points arrive as simulated ticks
+    all_data = generate_initial_data(60)
+    initial_data, ticks = all_data[:50], all_data[50:]
 
     # Add line series
     line_series = chart.add_line_series(
@@ -64,16 +60,37 @@ def main():
     )
     line_series.set_data(initial_data)
 
+    # Indicators warm up on the history, then advance one tick at a time
+    sma = IncrementalSMA(period=10, source="value")
+    rsi = IncrementalRSI(period=14, source="value")
+    sma_series = chart.add_line_series(
+        "SMA(10)",
+        LineStyleOptions(
+            color="#FF9800",
+            width=1
+        )
+    )
+    sma_series.set_data([sma.update(point) for point in initial_data])
+    for point in initial_data:
+        rsi_point = rsi.update(point)
+
+    # Stream ticks: a new time appends a point, the same time revises the last one
+    for point in ticks:
+        line_series.update(point)
+        sma_series.update(sma.update(point))
+        rsi_point = rsi.update(point)
+
     # Set time scale
-    chart.update_time_scale_data(initial_data)
+    chart.update_time_scale_data(line_series.data)
 
-    print("\nInitialized chart with 50 historical data points.")
+    print(f"\nInitialized chart with {len(initial_data)} historical points + {len(ticks)} live ticks.")
+    print(f"RSI(14) after the last tick: {rsi_point['value']:.1f}")
     print("\nTo implement real-time updates in your application:")
     print("1. Connect to your data feed (WebSocket, REST API, etc.)")
     print("2. On each new data point:")
-    print("   - Append to your data list")
-    print("   - Call: line_series.set_data(updated_data)")
-    print("   - Call: chart.update_time_scale_data(updated_data)")
+    print("   - Call: line_series.update(point)")
+    print("   - Call: sma_series.update(sma.update(point)); rsi.update(point) for indicators")
+    print("   - On a new time only: chart.update_time_scale_data(line_series.data)")
     print("   - Call: chart._update_visuals()")
     print("\nRendering static chart... Close the window to exit.")
     
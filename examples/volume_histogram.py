@@ -3,46 +3,32 @@ Example 5: Volume Histogram
 Histogram chart for volume analysis
 """
 
-import sys
-from pathlib import Path
-import os
-
-# Suppress Qt DPI warning on Windows
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from lightweight_charts import Chart, HistogramStyleOptions
-from datetime import datetime, timedelta
+from lightweight_charts import Chart, HistogramStyleOptions, OHLCColumns
 import numpy as np
 
 
-def generate_volume_data(num_candles: int = 100):
+def generate_volume_data(num_candles: int = 100, seed: int = 0) -> OHLCColumns:
     """Generate OHLC data with volume."""
-    base_date = datetime(2024, 1, 1)
-    data = []
-    price = 100
+    rng = np.random.default_rng(seed)
+    base_date = np.datetime64("2024-01-01")
+    noise = rng.standard_normal((num_candles, 3))
+    volumes = rng.integers(1000000, 10000000, size=num_candles, dtype=np.int64)
     
-    for i in range(num_candles):
-        date = base_date + timedelta(days=i)
-        
-        open_price = price
-        close_price = price + np.random.randn() * 3
-        volume = np.random.randint(1000000, 10000000)
-        
-        data.append({
-            "time": date,
-            "open": open_price,
-            "high": max(open_price, close_price) + abs(np.random.randn() * 2),
-            "low": min(open_price, close_price) - abs(np.random.randn() * 2),
-            "close": close_price,
-            "volume": volume / 1e6  # Convert to millions
-        })
-        
-        price = close_price
+    # Random walk of closes; each candle opens at the previous close
+    close_price = 100 + np.cumsum(noise[:, 0] * 3)
+    open_price = np.concatenate(([100.0], close_price[:-1]))
+    high_price = np.maximum(open_price, close_price) + np.abs(noise[:, 1] * 2)
+    low_price = np.minimum(open_price, close_price) - np.abs(noise[:, 2] * 2)
+    volume = (volumes / 1e6).astype(np.float32)  # Convert to millions
     
-    return data
+    return OHLCColumns(
+        time=np.arange(base_date, base_date + num_candles),
+        open=open_price,
+        high=high_price,
+        low=low_price,
+        close=close_price,
+        volume=volume
+    )
 
 
 def main():
@@ -65,11 +51,10 @@ def main():
         )
     )
     
-    volume_data = [{"time": d["time"], "value": d["volume"]} for d in data]
-    volume_series.set_data(volume_data)
+    volume_series.set_data_columnar(time=data.time, value=data.volume)
 
     # Set time scale
-    chart.update_time_scale_data(volume_data)
+    chart.update_time_scale_data(volume_series.columns)
 
     # Render chart
     print("Rendering chart... Close the window to exit.")
@@ -2,139 +2,53 @@
 Lightweight Charts Python - Complete Feature Showcase
 Interactive demonstration of all implemented features
 
-Run this script to see a menu of all features and examples.
+Run this script to see a menu of all features and examples, or pass an
+example number (e.g. `python showcase.py 14`) to run it directly.
 """
 
-import sys
 import os
+import sys
+import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Add src to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
-def print_header():
-    """Print fancy header."""
-    print("\n" + "="*80)
-    print("🚀 LIGHTWEIGHT CHARTS PYTHON - FEATURE SHOWCASE")
-    print("="*80)
-    print("GPU-Accelerated Financial Charting with Multi-Pane Support")
-    print("Version 1.0.0 | October 2025")
-    print("="*80 + "\n")
+RULE = "─" * 80
 
-def print_features():
-    """Print completed features."""
-    print("✅ COMPLETED FEATURES:")
-    print("─" * 80)
-    
-    features = {
-        "Core Charting": [
-            "GPU-Accelerated Rendering (Vispy)",
-            "Candlestick Charts (OHLC)",
-            "Line Charts",
-            "Area Charts with Fill",
-            "Histogram/Bar Charts",
-            "Time & Price Scales",
-            "Pan & Zoom Interactivity",
-        ],
-        "Multi-Pane System ⭐ NEW": [
-            "Independent Panes with Own Views",
-            "Grid Layout Architecture",
-            "Main Pane (Full Pan/Zoom)",
-            "Indicator Panes (Y-Axis Locked)",
-            "Synchronized Crosshair",
-            "Visual Border Separators",
-            "Customizable Height Ratios",
-        ],
-        "Crosshair System": [
-            "Visual Crosshair Lines",
-            "Multi-Pane Support",
-            "Event Callbacks",
-            "Customizable Colors",
-        ],
-        "Real-Time Data 🔴 LIVE": [
-            "WebSocket Integration",
-            "Kraken Exchange Support",
-            "HYBRID Mode (OHLC + Trades)",
-            "Live Candle Formation",
-            "update() Method (TradingView-style)",
-            "Background Threading",
-            "Historical Data Fetching",
-        ],
-        "Technical Indicators": [
-            "SMA (Simple Moving Average)",
-            "EMA (Exponential Moving Average)",
-            "WMA (Weighted Moving Average)",
-            "RSI (Relative Strength Index)",
-            "MACD (Moving Average Convergence Divergence)",
-            "Bollinger Bands",
-        ],
-    }
-    
-    for category, items in features.items():
-        print(f"\n📊 {category}")
-        for item in items:
-            print(f"   ✓ {item}")
-    
-    print("\n" + "─" * 80)
+# Run examples with this interpreter (and its virtualenv), not whatever
+# "python" is first on PATH
+_PY = sys.executable
 
-def print_examples():
-    """Print available examples."""
-    print("\n\n📁 AVAILABLE EXAMPLES (18 files):")
-    print("─" * 80)
-    
-    examples = [
-        ("1", "basic_line_chart.py", "Simple line chart", "⚡ Quick"),
-        ("2", "candlestick_chart.py", "OHLC candlestick chart", "⚡ Quick"),
-        ("3", "multiple_series.py", "Multiple series on one chart", "⚡ Quick"),
-        ("4", "area_chart.py", "Area chart with fill", "⚡ Quick"),
-        ("5", "volume_histogram.py", "Volume histogram bars", "⚡ Quick"),
-        ("6", "advanced_styling.py", "Custom colors and dark theme", "🎨 Style"),
-        ("7", "real_time_updates.py", "Streaming data updates", "🔄 Real-time"),
-        ("8", "crosshair_markers.py", "Price and time markers", "🎯 Interactive"),
-        ("9", "crosshair_interactive.py", "Interactive crosshair", "🎯 Interactive"),
-        ("10", "indicators_complete.py", "All technical indicators", "📈 Advanced"),
-        ("11", "fullscreen_chart.py", "Fullscreen mode", "🖥️ Display"),
-        ("12", "maximized_window.py", "Maximized window", "🖥️ Display"),
-        ("13", "multi_pane_simple.py", "Basic 2-pane chart", "✨ Multi-Pane"),
-        ("14", "multi_pane_complete.py", "4-pane dashboard", "✨ Multi-Pane"),
-        ("15", "multi_pane_chart.py", "Multi-pane (legacy)", "📜 Legacy"),
-        ("16", "kraken_live_chart.py", "Live WebSocket PAXG/USD", "🔴 LIVE"),
-        ("17", "kraken_realtime.py", "Real-time data demo", "🔴 LIVE"),
-        ("18", "price_scale_demo.py", "Price scale demo", "📊 Demo"),
-    ]
-    
-    for num, filename, desc, category in examples:
-        print(f"{num:>3}. {filename:<30} - {desc:<35} [{category}]")
-    
-    print("─" * 80)
+# Examples import lightweight_charts like an installed package; the
+# sys.path entry above is not inherited, so give them src on PYTHONPATH
+_EXAMPLE_ENV = {
+    **os.environ,
+    "PYTHONPATH": os.pathsep.join(
+        filter(None, [str(project_root / "src"), os.environ.get("PYTHONPATH")])
+    ),
+}
 
-def print_project_stats():
-    """Print project statistics."""
-    print("\n\n📊 PROJECT STATISTICS:")
-    print("─" * 80)
-    
-    stats = {
-        "Source Files": "10 core modules",
-        "Example Scripts": "18 comprehensive examples",
-        "Documentation Files": "8 main docs + archives",
-        "Test Files": "18 test modules",
-        "Lines of Code": "~8,000+ lines",
-        "Dependencies": "3 core (vispy, numpy, PyQt6)",
-        "Performance": "10,000+ candles at 60 FPS",
-        "Multi-Pane": "Up to 4 panes with no penalty",
-    }
-    
-    for key, value in stats.items():
-        print(f"  {key:<25} : {value}")
-    
-    print("─" * 80)
+# Static screens are joined once at import and written with a single call
+_HEADER_TEXT = "\n".join([
+    "",
+    "=" * 80,
+    "🚀 LIGHTWEIGHT CHARTS PYTHON - FEATURE SHOWCASE",
+    "=" * 80,
+    "GPU-Accelerated Financial Charting with Multi-Pane Support",
+    "Version 1.0.0 | October 2025",
+    "=" * 80,
+    "",
+    "",
+])
 
-def print_architecture():
-    """Print architecture overview."""
-    print("\n\n🏗️  ARCHITECTURE:")
-    print("─" * 80)
-    print("""
+_ARCHITECTURE_TEXT = "\n".join([
+    "\n\n🏗️  ARCHITECTURE:",
+    RULE,
+    """
 Chart
 ├── Canvas (Vispy SceneCanvas)
 └── Grid Layout
@@ -152,66 +66,148 @@ Chart
         └── Line Series (RSI, MACD, etc.)
 
 Real-Time Data Flow:
-WebSocket → Background Thread → Update Current Candle → 
-series.update() → Timer (10 FPS) → Visual Update → GPU Render
-    """)
-    print("─" * 80)
+WebSocket → asyncio loop on the GUI thread (stepped every 5 ms) →
+Update Current Candle → series.update() → Timer (10 FPS) →
+Visual Update → GPU Render
+    """,
+    RULE,
+    "",
+])
 
-def print_menu():
-    """Print interactive menu."""
-    print("\n\n🎮 INTERACTIVE MENU:")
-    print("─" * 80)
-    print("Choose what to run:")
-    print()
-    print("  [1-18] Run specific example (see list above)")
-    print("  [Q]    Quick Demo - Multi-pane with indicators")
-    print("  [L]    Live Demo - Real-time Kraken WebSocket")
-    print("  [D]    Documentation - View project status")
-    print("  [X]    Exit")
-    print()
-    print("─" * 80)
+_MENU_TEXT = "\n".join([
+    "\n\n🎮 INTERACTIVE MENU:",
+    RULE,
+    "Choose what to run:",
+    "",
+    "  [1-18] Run specific example (see list above)",
+    "  [Q]    Quick Demo - Multi-pane with indicators",
+    "  [L]    Live Demo - Real-time Kraken WebSocket",
+    "  [D]    Documentation - View project status",
+    "  [X]    Exit",
+    "",
+    RULE,
+    "",
+])
 
-def run_example(number):
-    """Run a specific example."""
-    examples = {
-        "1": "basic_line_chart.py",
-        "2": "candlestick_chart.py",
-        "3": "multiple_series.py",
-        "4": "area_chart.py",
-        "5": "volume_histogram.py",
-        "6": "advanced_styling.py",
-        "7": "real_time_updates.py",
-        "8": "crosshair_markers.py",
-        "9": "crosshair_interactive.py",
-        "10": "indicators_complete.py",
-        "11": "fullscreen_chart.py",
-        "12": "maximized_window.py",
-        "13": "multi_pane_simple.py",
-        "14": "multi_pane_complete.py",
-        "15": "multi_pane_chart.py",
-        "16": "kraken_live_chart.py",
-        "17": "kraken_realtime.py",
-        "18": "price_scale_demo.py",
-    }
-    
-    if number in examples:
-        filename = examples[number]
-        filepath = project_root / "examples" / filename
-        
-        if filepath.exists():
-            print(f"\n🚀 Running: {filename}")
-            print("─" * 80)
-            os.system(f"python {filepath}")
-        else:
-            print(f"\n❌ Error: {filename} not found!")
-    else:
-        print("\n❌ Invalid example number!")
+# Menu number -> (filename, absolute path, description, category); the single
+# source for both the example list and run_example
+_EXAMPLES_DIR = (project_root / "examples").resolve()
+_EXAMPLES = {
+    str(number): (filename, _EXAMPLES_DIR / filename, desc, category)
+    for number, (filename, desc, category) in enumerate([
+        ("basic_line_chart.py", "Simple line chart", "⚡ Quick"),
+        ("candlestick_chart.py", "OHLC candlestick chart", "⚡ Quick"),
+        ("multiple_series.py", "Multiple series on one chart", "⚡ Quick"),
+        ("area_chart.py", "Area chart with fill", "⚡ Quick"),
+        ("volume_histogram.py", "Volume histogram bars", "⚡ Quick"),
+        ("advanced_styling.py", "Custom colors and dark theme", "🎨 Style"),
+        ("real_time_updates.py", "Streaming data updates", "🔄 Real-time"),
+        ("crosshair_markers.py", "Price and time markers", "🎯 Interactive"),
+        ("crosshair_interactive.py", "Interactive crosshair", "🎯 Interactive"),
+        ("indicators_complete.py", "All technical indicators", "📈 Advanced"),
+        ("fullscreen_chart.py", "Fullscreen mode", "🖥️ Display"),
+        ("maximized_window.py", "Maximized window", "🖥️ Display"),
+        ("multi_pane_simple.py", "Basic 2-pane chart", "✨ Multi-Pane"),
+        ("multi_pane_complete.py", "4-pane dashboard", "✨ Multi-Pane"),
+        ("multi_pane_chart.py", "Multi-pane (legacy)", "📜 Legacy"),
+        ("kraken_live_chart.py", "Live WebSocket PAXG/USD", "🔴 LIVE"),
+        ("kraken_realtime.py", "Real-time data demo", "🔴 LIVE"),
+        ("price_scale_demo.py", "Price scale demo", "📊 Demo"),
+    ], 1)
+}
 
-def show_documentation():
-    """Show documentation."""
-    print("\n\n📚 DOCUMENTATION:")
-    print("─" * 80)
-    print("""
+@lru_cache(maxsize=32)
+def _resolve_example(number: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Look up an example once per session instead of on every run.
+
+    Returns:
+        (filename, path string, file exists), or None for an unknown number
+    """
+    example = _EXAMPLES.get(number)
+    if example is None:
+        return None
+    filename, filepath, _, _ = example
+    return filename, str(filepath), filepath.exists()
+
+_FEATURES = {
+    "Core Charting": [
+        "GPU-Accelerated Rendering (Vispy)",
+        "Candlestick Charts (OHLC)",
+        "Line Charts",
+        "Area Charts with Fill",
+        "Histogram/Bar Charts",
+        "Time & Price Scales",
+        "Pan & Zoom Interactivity",
+    ],
+    "Multi-Pane System ⭐ NEW": [
+        "Independent Panes with Own Views",
+        "Grid Layout Architecture",
+        "Main Pane (Full Pan/Zoom)",
+        "Indicator Panes (Y-Axis Locked)",
+        "Synchronized Crosshair",
+        "Visual Border Separators",
+        "Customizable Height Ratios",
+    ],
+    "Crosshair System": [
+        "Visual Crosshair Lines",
+        "Multi-Pane Support",
+        "Event Callbacks",
+        "Customizable Colors",
+    ],
+    "Real-Time Data 🔴 LIVE": [
+        "WebSocket Integration",
+        "Kraken Exchange Support",
+        "HYBRID Mode (OHLC + Trades)",
+        "Live Candle Formation",
+        "update() Method (TradingView-style)",
+        "Single-Thread asyncio + GUI Loop",
+        "Historical Data Fetching",
+    ],
+    "Technical Indicators": [
+        "SMA (Simple Moving Average)",
+        "EMA (Exponential Moving Average)",
+        "WMA (Weighted Moving Average)",
+        "RSI (Relative Strength Index)",
+        "MACD (Moving Average Convergence Divergence)",
+        "Bollinger Bands",
+    ],
+}
+
+_FEATURES_TEXT = "\n".join([
+    "✅ COMPLETED FEATURES:",
+    RULE,
+    *(
+        f"\n📊 {category}\n" + "\n".join(f"   ✓ {item}" for item in items)
+        for category, items in _FEATURES.items()
+    ),
+    "\n" + RULE,
+    "",
+])
+
+_STATS = {
+    "Source Files": "10 core modules",
+    "Example Scripts": "18 comprehensive examples",
+    "Documentation Files": "8 main docs + archives",
+    "Test Files": "18 test modules",
+    "Lines of Code": "~8,000+ lines",
+    "Dependencies": "3 core (vispy, numpy, PyQt6)",
+    "Performance": "10,000+ candles at 60 FPS",
+    "Multi-Pane": "Up to 4 panes with no penalty",
+}
+
+_STATS_TEXT = "\n".join([
+    "\n\n📊 PROJECT STATISTICS:",
+    RULE,
+    *(f"  {key:<25} : {value}" for key, value in _STATS.items()),
+    RULE,
+    "",
+])
+
+_DOCUMENTATION_TEXT = "\n".join([
+    "\n\n📚 DOCUMENTATION:",
+    RULE,
+    """
 Main Documentation:
   • README.md - Project overview
   • docs/PROJECT_STATUS.md - Current state and roadmap
@@ -231,15 +227,15 @@ Quick Start:
 Online Documentation:
   All docs are in the /docs directory
   Start with docs/PROJECT_STATUS.md for current state
-    """)
-    print("─" * 80)
-    input("\nPress ENTER to continue...")
+    """,
+    RULE,
+    "",
+])
 
-def show_known_issues():
-    """Show known issues."""
-    print("\n\n⚠️  KNOWN ISSUES:")
-    print("─" * 80)
-    print("""
+_KNOWN_ISSUES_TEXT = "\n".join([
+    "\n\n⚠️  KNOWN ISSUES:",
+    RULE,
+    """
 1. Real-Time Candle Visual Scaling
    Status: Under investigation
    Issue: Current forming candle updates but visual changes are minimal
@@ -251,20 +247,89 @@ def show_known_issues():
    Issue: PAXG/USD has infrequent trades
    Impact: Longer gaps between updates
    Solution: Trade feed provides updates when trades occur
-    """)
+    """,
+    RULE,
+    "",
+])
+
+def print_header():
+    """Print fancy header."""
+    sys.stdout.write(_HEADER_TEXT)
+
+def print_features():
+    """Print completed features."""
+    sys.stdout.write(_FEATURES_TEXT)
+
+def print_examples():
+    """Print available examples."""
+    print(f"\n\n📁 AVAILABLE EXAMPLES ({len(_EXAMPLES)} files):")
     print("─" * 80)
+    
+    for num, (filename, _, desc, category) in _EXAMPLES.items():
+        print(f"{num:>3}. {filename:<30} - {desc:<35} [{category}]")
+    
+    print("─" * 80)
+
+def print_project_stats():
+    """Print project statistics."""
+    sys.stdout.write(_STATS_TEXT)
+
+def print_architecture():
+    """Print architecture overview."""
+    sys.stdout.write(_ARCHITECTURE_TEXT)
+
+def print_menu():
+    """Print interactive menu."""
+    sys.stdout.write(_MENU_TEXT)
+
+def run_example(number):
+    """Run a specific example."""
+    example = _resolve_example(number)
+    if example is None:
+        print("\n❌ Invalid example number!")
+        return
+    
+    filename, filepath, exists = example
+    if exists:
+        print(f"\n🚀 Running: {filename}")
+        print("─" * 80)
+        # No shell: one fewer process, and paths with spaces just work
+        subprocess.run([_PY, filepath], check=False, env=_EXAMPLE_ENV)
+    else:
+        print(f"\n❌ Error: {filename} not found!")
+
+def show_documentation():
+    """Show documentation."""
+    sys.stdout.write(_DOCUMENTATION_TEXT)
+    input("\nPress ENTER to continue...")
+
+def show_known_issues():
+    """Show known issues."""
+    sys.stdout.write(_KNOWN_ISSUES_TEXT)
     input("\nPress ENTER to continue...")
 
 def main():
     """Main function."""
+    # One-shot use: replace this process with the example instead of
+    # drawing the menu and waiting on a child interpreter
+    example = _resolve_example(sys.argv[1]) if len(sys.argv) > 1 else None
+    if example is not None and example[2]:
+        sys.stdout.flush()
+        os.execve(_PY, [_PY, example[1]], _EXAMPLE_ENV)
+    
     print_header()
     print_features()
     print_examples()
     print_project_stats()
     print_architecture()
     
+    # The blank lines that close each round go out with the next menu, so
+    # every round is one write; flush so the menu is visible before input()
+    separator = ""
     while True:
-        print_menu()
+        sys.stdout.write(separator + _MENU_TEXT)
+        sys.stdout.flush()
+        separator = "\n\n"
         
         choice = input("Enter your choice: ").strip().upper()
         
@@ -281,12 +346,10 @@ def main():
             show_documentation()
         elif choice == 'I':
             show_known_issues()
-        elif choice.isdigit() and 1 <= int(choice) <= 18:
+        elif choice in _EXAMPLES:
             run_example(choice)
         else:
             print("\n❌ Invalid choice! Please try again.")
-        
-        print("\n")
 
 if __name__ == "__main__":
     try:
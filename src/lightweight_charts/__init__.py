@@ -2,59 +2,118 @@
 Lightweight Charts for Python - Main package
 """
 
-from .chart import Chart
-from .pane import Pane
-from .series import (
-    BaseSeries,
-    LineSeries,
-    CandlestickSeries,
-    AreaSeries,
-    HistogramSeries
-)
-from .scales import (
-    TimeScale,
-    PriceScale,
-    PriceScaleMode,
-    PriceScaleMargins,
-    PriceScaleOptions
-)
-from .data_types import (
-    SeriesType,
-    AxisLabelFormat,
-    LineStyleOptions,
-    CandleStickStyleOptions,
-    HistogramStyleOptions,
-    AreaStyleOptions,
-    ChartOptions,
-    OHLC,
-    DataPoint,
-    TooltipOptions
-)
-from .crosshair import (
-    Crosshair,
-    CrosshairOptions,
-    CrosshairVisual,
-    CrosshairPosition,
-    PriceMarker,
-    TimeMarker
-)
-from .price_scale_visual import PriceScaleVisual
-from .utils import (
-    hex_to_rgb,
-    hex_to_rgba,
-    format_price,
-    format_volume,
-    normalize_value,
-    denormalize_value,
-    clamp
-)
-from .indicators import (
-    MovingAverage,
-    RSI,
-    MACD,
-    BollingerBands,
-    IndicatorCalculator
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .chart import Chart
+    from .pane import Pane
+    from .series import (
+        BaseSeries,
+        LineSeries,
+        CandlestickSeries,
+        AreaSeries,
+        HistogramSeries
+    )
+    from .scales import (
+        TimeScale,
+        PriceScale,
+        PriceScaleMode,
+        PriceScaleMargins,
+        PriceScaleOptions
+    )
+    from .data_types import (
+        SeriesType,
+        AxisLabelFormat,
+        LineStyleOptions,
+        CandleStickStyleOptions,
+        HistogramStyleOptions,
+        AreaStyleOptions,
+        ChartOptions,
+        OHLC,
+        OHLCColumns,
+        CANDLE_DTYPE,
+        VALUE_DTYPE,
+        DataPoint,
+        TooltipOptions
+    )
+    from .crosshair import (
+        Crosshair,
+        CrosshairOptions,
+        CrosshairVisual,
+        CrosshairPosition,
+        PriceMarker,
+        TimeMarker
+    )
+    from .price_scale_visual import PriceScaleVisual
+    from .utils import (
+        hex_to_rgb,
+        hex_to_rgba,
+        format_price,
+        format_volume,
+        normalize_value,
+        denormalize_value,
+        clamp,
+        m4_decimate,
+        to_list,
+        columns_to_records,
+        records_to_columns
+    )
+
+# Public names are imported from their submodule on first access (PEP 562),
+# so importing the package does not load Vispy until a chart is used
+_LAZY_IMPORTS = {
+    "Chart": ".chart",
+    "Pane": ".pane",
+    "BaseSeries": ".series",
+    "LineSeries": ".series",
+    "CandlestickSeries": ".series",
+    "AreaSeries": ".series",
+    "HistogramSeries": ".series",
+    "TimeScale": ".scales",
+    "PriceScale": ".scales",
+    "PriceScaleMode": ".scales",
+    "PriceScaleMargins": ".scales",
+    "PriceScaleOptions": ".scales",
+    "SeriesType": ".data_types",
+    "AxisLabelFormat": ".data_types",
+    "LineStyleOptions": ".data_types",
+    "CandleStickStyleOptions": ".data_types",
+    "HistogramStyleOptions": ".data_types",
+    "AreaStyleOptions": ".data_types",
+    "ChartOptions": ".data_types",
+    "OHLC": ".data_types",
+    "OHLCColumns": ".data_types",
+    "CANDLE_DTYPE": ".data_types",
+    "VALUE_DTYPE": ".data_types",
+    "DataPoint": ".data_types",
+    "TooltipOptions": ".data_types",
+    "Crosshair": ".crosshair",
+    "CrosshairOptions": ".crosshair",
+    "CrosshairVisual": ".crosshair",
+    "CrosshairPosition": ".crosshair",
+    "PriceMarker": ".crosshair",
+    "TimeMarker": ".crosshair",
+    "PriceScaleVisual": ".price_scale_visual",
+    "hex_to_rgb": ".utils",
+    "hex_to_rgba": ".utils",
+    "format_price": ".utils",
+    "format_volume": ".utils",
+    "normalize_value": ".utils",
+    "denormalize_value": ".utils",
+    "clamp": ".utils",
+    "m4_decimate": ".utils",
+    "to_list": ".utils",
+    "columns_to_records": ".utils",
+    "records_to_columns": ".utils",
+    "MovingAverage": ".indicators",
+    "RSI": ".indicators",
+    "MACD": ".indicators",
+    "BollingerBands": ".indicators",
+    "IndicatorCalculator": ".indicators",
+    "IncrementalSMA": ".indicators",
+    "IncrementalRSI": ".indicators",
+}
 
 __version__ = "1.0.0"
 __author__ = "TradingView Lightweight Charts Python Port"
@@ -79,6 +138,9 @@ __all__ = [
     "AreaStyleOptions",
     "ChartOptions",
     "OHLC",
+    "OHLCColumns",
+    "CANDLE_DTYPE",
+    "VALUE_DTYPE",
     "DataPoint",
     "TooltipOptions",
     "Crosshair",
@@ -95,9 +157,27 @@ __all__ = [
     "normalize_value",
     "denormalize_value",
     "clamp",
+    "m4_decimate",
+    "to_list",
+    "columns_to_records",
+    "records_to_columns",
     "MovingAverage",
     "RSI",
     "MACD",
     "BollingerBands",
-    "IndicatorCalculator"
+    "IndicatorCalculator",
+    "IncrementalSMA",
+    "IncrementalRSI"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -4,7 +4,7 @@ MULTI-PANE: Uses grid layout with separate views for each pane
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -16,10 +16,20 @@ from .data_types import (
     HistogramStyleOptions,
     LineStyleOptions,
 )
-from .pane import Pane
+from .pane import Pane, ViewTransformCache
 from .price_scale_visual import PriceScaleVisual
 from .scales import PriceScale, PriceScaleOptions, TimeScale
-from .series import AreaSeries, BaseSeries, CandlestickSeries, HistogramSeries, LineSeries
+from .series import (
+    AreaSeries,
+    BaseSeries,
+    CandlestickSeries,
+    HistogramSeries,
+    LineBatch,
+    LineSeries,
+    create_series_visual,
+    remove_all_series,
+    remove_series_visuals,
+)
 from .utils import hex_to_rgb
 
 logger = logging.getLogger(__name__)
@@ -43,6 +53,7 @@ class Chart:
         background_color: str = "#ffffff",
         fullscreen: bool = False,
         maximized: bool = False,
+        vsync: bool = False,
     ):
         if not HAS_VISPY:
             raise ImportError("Vispy is required. Install with: pip install vispy")
@@ -74,6 +85,8 @@ class Chart:
         self._bg_color_tuple = hex_to_rgb(background_color)
 
         self.series: Dict[str, BaseSeries] = {}
+        # Line series of the single view share one visual per line width
+        self._line_batches: Dict[float, LineBatch] = {}
         self.time_scale = TimeScale([])
         self.price_scale = PriceScale()
 
@@ -100,6 +113,7 @@ class Chart:
             bgcolor=background_color,
             keys="interactive",
             fullscreen=fullscreen,
+            vsync=vsync,
             show=False,
         )
 
@@ -108,6 +122,7 @@ class Chart:
         self.view.camera = scene.PanZoomCamera(rect=(0, -1, 1000, 2))  # type: ignore[arg-type]
         self.view.camera.interactive = True
         self.view.camera.aspect = None
+        self._view_transform = ViewTransformCache(self.view)
 
         # Crosshair
         self.crosshair_visual = None
@@ -119,15 +134,25 @@ class Chart:
 
         # Store last mouse position
         self._last_mouse_pos: Optional[Tuple[float, float]] = None
+        # Device pixel of the last handled move (sub-pixel moves are dropped)
+        self._last_mouse_pixel: Optional[Tuple[int, int]] = None
         self._last_data_pos: Optional[Tuple[float, float]] = None
+        # (data index, pixel row) last reported to crosshair subscribers
+        self._last_crosshair_key: Optional[Tuple[Optional[int], int]] = None
 
-        # Timer for crosshair updates
-        from vispy import app as vispy_app
+        # Pan/zoom moves the data under a stationary mouse; re-place the
+        # crosshair on the next draw instead of polling the cursor
+        self._crosshair_dirty = False
 
-        self._crosshair_timer = vispy_app.Timer(
-            interval=0.016, connect=self._update_crosshair_position, start=True
-        )
-        logger.debug("Chart: Timer started (60 FPS)")
+        # A burst of pan()/zoom() calls is redrawn once, on the next turn of
+        # the event loop (timer created on first use)
+        self._refresh_pending = False
+        self._refresh_timer: Optional[Any] = None
+        # Camera width (in bars) the visuals were last built for
+        self._fitted_view_width: Optional[float] = None
+
+        self.view.camera.transform.changed.connect(self._on_view_changed)
+        self.canvas.events.draw.connect(self._update_crosshair_position)
 
     @property
     def background_color(self) -> Tuple[float, float, float]:
@@ -137,7 +162,7 @@ class Chart:
         self, name: str = "", style: Optional[LineStyleOptions] = None
     ) -> LineSeries:
         series = LineSeries(name, style)
-        series.create_visual(self.view)
+        create_series_visual(series, self.view, self._line_batches)
         self.series[name or f"line_{len(self.series)}"] = series
         return series
 
@@ -153,7 +178,7 @@ class Chart:
         self, name: str = "", style: Optional[AreaStyleOptions] = None
     ) -> AreaSeries:
         series = AreaSeries(name, style)
-        series.create_visual(self.view)
+        create_series_visual(series, self.view, self._line_batches)
         self.series[name or f"area_{len(self.series)}"] = series
         return series
 
@@ -168,23 +193,38 @@ class Chart:
         return series
 
     def update_price_scale(self) -> None:
-        min_prices = []
-        max_prices = []
-
-        for series in self.series.values():
-            if series.visible:
-                visible = series.get_visible_data(self.time_scale)
-                min_p, max_p = series._get_price_range(visible)
-                min_prices.append(min_p)
-                max_prices.append(max_p)
-
-        if min_prices and max_prices:
-            self.price_scale.update_range(min(min_prices), max(max_prices), auto_pad=True)
+        self._fit_price_scale([series for series in self.series.values() if series.visible])
+
+    def _fit_price_scale(self, visible_series: List[BaseSeries]) -> None:
+        """Fit the price scale to the visible range of the given series."""
+        # The same bar and pixel row may now mean a different price
+        self._last_crosshair_key = None
+        price_ranges = [
+            price_range
+            for price_range in (
+                series.get_price_range(self.time_scale) for series in visible_series
+            )
+            if price_range
+        ]
+
+        if price_ranges:
+            lows, highs = zip(*price_ranges)
+            self.price_scale.update_range(min(lows), max(highs), auto_pad=True)
         else:
             self.price_scale.update_range(0, 100)
 
-    def update_time_scale_data(self, data: List[Any]) -> None:
+    def update_time_scale_data(self, data: Union[List[Any], Dict[str, np.ndarray]]) -> None:
+        """
+        Set the bars the time axis spans.
+        
+        Args:
+            data: List of data points, or column arrays with a 'time' field
+                such as ``series.columns`` of a columnar series (no per-bar
+                dicts are built; pass it again after appending bars)
+        """
         self.time_scale.set_data(data)
+        # The same index may now be a different bar
+        self._last_crosshair_key = None
 
     def render(self) -> None:
         """Render and display the chart."""
@@ -216,17 +256,7 @@ class Chart:
                 except Exception as e:
                     logger.error(f"Chart: ❌ Price scale failed: {e}")
 
-            self.update_price_scale()
-            for series in self.series.values():
-                if series.visible:
-                    series.update_visual(self.time_scale, self.price_scale)
-
-            if self.price_scale_visual:
-                self.price_scale_visual.update(
-                    visible_data_range=self.time_scale.visible_range,
-                    canvas_width=self.width,
-                    canvas_height=self.height,
-                )
+            self._refresh()
 
         self.canvas.show()
 
@@ -261,9 +291,9 @@ class Chart:
             # Create view in grid
             pane.create_view(self.grid, row=i, col=0)
 
-            # Add separator line at the top of each pane (except the first)
-            if i > 0:
-                self._add_pane_border(pane)
+            # Outline every pane, the main one included, so the frame is
+            # uniform and adjacent edges separate stacked panes
+            self._add_pane_border(pane)
 
             # Update pane data
             pane.update_price_scale()
@@ -279,52 +309,75 @@ class Chart:
         logger.info(f"✅ Multi-pane grid created: {len(self.panes)} panes!")
 
     def _add_pane_border(self, pane: Pane) -> None:
-        """Add a border line at the top of a pane."""
+        """
+        Outline a pane with a 2px border on all four sides.
+
+        Where panes stack, adjacent edges form the separator between them;
+        the outer edges frame the chart as well.
+        """
         if not pane.view:
             return
 
-        try:
-            from vispy.scene import visuals
-
-            # Get visible X range
-            x_start, x_end = self.time_scale.visible_range
-
-            # Extend line across full width
-            x_padding = (x_end - x_start) * 0.05
-            x_left = x_start - x_padding
-            x_right = x_end + x_padding
-
-            # Draw line at the top of this pane's viewport (y=1.0)
-            line = visuals.Line(  # type: ignore[attr-defined]
-                pos=np.array([[x_left, 1.0, 0], [x_right, 1.0, 0]]),
-                color=(0.3, 0.3, 0.3, 1.0),  # Dark gray, fully opaque
-                width=2,  # Slightly thicker for visibility
-                connect="strip",
-                antialias=True,
-            )
-
-            # Add to this pane's view
-            pane.view.add(line)
-            line.order = 1000  # Render on top of everything
-
-            logger.debug(f"Added border to pane '{pane.name}'")
-        except Exception as e:
-            logger.error(f"Failed to add pane border: {e}")
+        # Every ViewBox already owns a border mesh, hidden while its colour is
+        # blank; colouring it draws the separator in pixel space without
+        # adding a visual (and GL program) of our own to each pane
+        pane.view.border_color = (0.3, 0.3, 0.3, 1.0)  # Dark gray, fully opaque
+        pane.view.border_width = 2  # Slightly thicker for visibility
+        logger.debug(f"Added border to pane '{pane.name}'")
 
     def pan(self, delta: float) -> None:
         self.time_scale.pan(delta)
-        self.update_price_scale()
-        self._update_visuals()
+        self._schedule_refresh()
 
     def zoom(self, factor: float, center: Optional[float] = None) -> None:
         self.time_scale.zoom(factor, center)
-        self.update_price_scale()
-        self._update_visuals()
+        self._schedule_refresh()
 
-    def _update_visuals(self) -> None:
-        for series in self.series.values():
-            if series.visible:
-                series.update_visual(self.time_scale, self.price_scale)
+    def _schedule_refresh(self) -> None:
+        """Refresh once on the next event-loop turn, however many calls come first."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        if self._refresh_timer is None:
+            self._refresh_timer = app.Timer(
+                interval=0, iterations=1, connect=self._flush_refresh
+            )
+        self._refresh_timer.start()
+
+    def _flush_refresh(self, event: Any = None) -> None:
+        if self._refresh_pending:
+            self._refresh()
+
+    def flush(self) -> None:
+        """
+        Apply pending pan()/zoom() calls now instead of on the next event-loop turn.
+        
+        Needed by scripts that read the price scale or visuals right after
+        panning or zooming without running the event loop.
+        """
+        self._flush_refresh()
+
+    def _refresh(self) -> None:
+        """
+        Fit the price scale and redraw, walking the series once.
+        
+        Each series' visible slice is computed by the price-scale fit and
+        reused from its cache by the visual update.
+        """
+        self._refresh_pending = False
+        visible_series = [series for series in self.series.values() if series.visible]
+        self._fit_price_scale(visible_series)
+        self._update_visuals(visible_series)
+
+    def _update_visuals(self, visible_series: Optional[List[BaseSeries]] = None) -> None:
+        if visible_series is None:
+            visible_series = [series for series in self.series.values() if series.visible]
+        self.time_scale.fit_pixel_width(self.view)
+        self._fitted_view_width = self.view.camera.rect.width
+        for series in visible_series:
+            series.update_visual(self.time_scale, self.price_scale)
+        for batch in self._line_batches.values():
+            batch.update_visual(self.time_scale, self.price_scale)
 
         if self.price_scale_visual:
             self.price_scale_visual.update(
@@ -338,12 +391,7 @@ class Chart:
 
     def remove_series(self, name: str) -> bool:
         if name in self.series:
-            series = self.series.pop(name)
-            for visual in series.visuals.values():
-                try:
-                    visual.parent = None
-                except Exception:
-                    pass
+            remove_series_visuals(self.series.pop(name))
             return True
         return False
 
@@ -352,13 +400,7 @@ class Chart:
             self.series[name].visible = visible
 
     def clear_series(self) -> None:
-        for series in list(self.series.values()):
-            for visual in series.visuals.values():
-                try:
-                    visual.parent = None
-                except Exception:
-                    pass
-        self.series.clear()
+        remove_all_series(self.series, self._line_batches)
 
     def set_background_color(self, color: str) -> None:
         self._bg_color_tuple = hex_to_rgb(color)
@@ -373,6 +415,7 @@ class Chart:
         self.canvas.size = (width, height)
 
     def export_image(self, filepath: str) -> None:
+        self.flush()
         try:
             from vispy.io import write_png
 
@@ -380,8 +423,8 @@ class Chart:
         except ImportError:
             raise ImportError("PIL/Pillow required for image export")
 
-    def subscribe_crosshair_move(self, callback: Any) -> None:
-        self.crosshair.on_move(callback)
+    def subscribe_crosshair_move(self, callback: Any, throttled: bool = False) -> None:
+        self.crosshair.on_move(callback, throttled)
 
     def subscribe_crosshair_leave(self, callback: Any) -> None:
         self.crosshair.on_leave(callback)
@@ -392,6 +435,12 @@ class Chart:
     def add_time_marker(self, marker: TimeMarker) -> None:
         self.time_markers.append(marker)
 
+    def add_price_markers(self, markers: List[PriceMarker]) -> None:
+        self.price_markers.extend(markers)
+
+    def add_time_markers(self, markers: List[TimeMarker]) -> None:
+        self.time_markers.extend(markers)
+
     def clear_markers(self) -> None:
         self.price_markers.clear()
         self.time_markers.clear()
@@ -435,27 +484,32 @@ class Chart:
 
     def _on_mouse_move(self, event: Any) -> None:
         """Handle mouse move for crosshair updates."""
-        if not self.time_scale.data:
+        if not len(self.time_scale):
+            return
+
+        # Drags that leave the canvas keep sending moves; skip them before
+        # mapping through the view transform
+        x, y = event.pos[:2]
+        canvas_width, canvas_height = self.canvas.size
+        if not (0 <= x < canvas_width and 0 <= y < canvas_height):
+            return
+
+        # High-rate and high-DPI mice report fractional moves within one
+        # pixel; the crosshair cannot move less than a pixel
+        pixel = (int(round(x)), int(round(y)))
+        if pixel == self._last_mouse_pixel:
             return
+        self._last_mouse_pixel = pixel
 
         if self.use_panes:
             # Multi-pane mode: update crosshairs in all panes
             for pane in self.panes:
-                if not pane.view:
+                if not pane.view or not pane.view_transform:
                     continue
 
                 try:
                     # Transform mouse position to this pane's data coordinates
-                    tr = pane.view.scene.transform
-                    data_pos_result = tr.imap(event.pos[:2])
-
-                    if data_pos_result is None:
-                        continue
-
-                    # Type cast for Pylance
-                    data_pos = cast(Tuple[float, float], data_pos_result)
-                    x_data = data_pos[0]
-                    y_data = data_pos[1]
+                    x_data, y_data = pane.view_transform.imap(event.pos)
 
                     start_idx, end_idx = self.time_scale.visible_range
 
@@ -472,16 +526,7 @@ class Chart:
                 pos = event.pos
                 self._last_mouse_pos = (pos[0], pos[1])
 
-                tr = self.view.scene.transform
-                data_pos_result = tr.imap(pos[:2])
-
-                if data_pos_result is None:
-                    return
-
-                # Type cast for Pylance
-                data_pos = cast(Tuple[float, float], data_pos_result)
-                x_data = data_pos[0]
-                y_data = data_pos[1]
+                x_data, y_data = self._view_transform.imap(pos)
 
                 start_idx, end_idx = self.time_scale.visible_range
 
@@ -491,13 +536,20 @@ class Chart:
 
                 data_index = int(round(x_data))
                 is_over_data = (
-                    0 <= data_index < len(self.time_scale.data) and start_idx <= x_data <= end_idx
+                    0 <= data_index < len(self.time_scale) and start_idx <= x_data <= end_idx
                 )
 
                 price_value = self.price_scale.get_price_at_y(y_data)
 
+                # Horizontal moves within one bar, on the same pixel row, change
+                # nothing subscribers can see; skip the lookup and callbacks
+                crosshair_key = (data_index if is_over_data else None, pixel[1])
+                if crosshair_key == self._last_crosshair_key:
+                    return
+                self._last_crosshair_key = crosshair_key
+
                 if is_over_data:
-                    data_point = self.time_scale.data[data_index]
+                    data_point = self.time_scale.point_at(data_index)
                     time_value = (
                         data_point.get("time")
                         if isinstance(data_point, dict)
@@ -537,29 +589,34 @@ class Chart:
 
         self.crosshair.clear_position()
         self._last_mouse_pos = None
+        self._last_mouse_pixel = None
         self._last_data_pos = None
+        self._last_crosshair_key = None
+
+    def _on_view_changed(self, event: Any = None) -> None:
+        """Mark the crosshair for re-placement after the camera moves."""
+        self._crosshair_dirty = True
+        # The pixel under a still mouse now shows other data
+        self._last_mouse_pixel = None
+        # A camera zoom changes how many bars share a pixel: redo the line
+        # decimation and candle widths for the new scale
+        if self.view.camera.rect.width != self._fitted_view_width:
+            self._schedule_refresh()
 
     def _update_crosshair_position(self, event: Any = None) -> None:
-        if not self.crosshair_visual or not self.time_scale.data:
+        """Re-place the crosshair at the last mouse position once per view change."""
+        if not self._crosshair_dirty:
             return
+        self._crosshair_dirty = False
 
-        if not self.crosshair.visible:
+        if not self.crosshair_visual or not len(self.time_scale):
             return
 
-        try:
-            mouse_pos = self.canvas.native.mapFromGlobal(self.canvas.native.cursor().pos())
-            canvas_pos = (mouse_pos.x(), mouse_pos.y())
-
-            tr = self.view.scene.transform
-            data_pos_result = tr.imap(canvas_pos)
-
-            if data_pos_result is None:
-                return
+        if not self.crosshair.visible or self._last_mouse_pos is None:
+            return
 
-            # Type cast for Pylance
-            data_pos = cast(Tuple[float, float], data_pos_result)
-            x_data = data_pos[0]
-            y_data = data_pos[1]
+        try:
+            x_data, y_data = self._view_transform.imap(self._last_mouse_pos)
 
             start_idx, end_idx = self.time_scale.visible_range
 
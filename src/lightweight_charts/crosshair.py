@@ -77,6 +77,11 @@ class Crosshair:
         self.visible = False
         self._move_callbacks: List[Callable] = []
         self._leave_callbacks: List[Callable] = []
+        # Callbacks that only want the latest position once per event-loop
+        # turn, however many moves arrive in between
+        self._throttled_callbacks: List[Callable] = []
+        self._flush_pending = False
+        self._flush_timer: Any = None
     
     def set_position(
         self, x: float, y: float, time: Optional[datetime] = None,
@@ -87,6 +92,29 @@ class Crosshair:
         self.position = CrosshairPosition(x, y, time, price, data_index, series_data)
         for callback in self._move_callbacks:
             callback(self.position)
+        if self._throttled_callbacks:
+            self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Report to throttled callbacks on the next event-loop turn."""
+        if self._flush_pending:
+            return
+        self._flush_pending = True
+        if not HAS_VISPY:
+            self._flush_moves()
+            return
+        if self._flush_timer is None:
+            from vispy import app
+            self._flush_timer = app.Timer(interval=0, iterations=1, connect=self._flush_moves)
+        self._flush_timer.start()
+    
+    def _flush_moves(self, event: Any = None) -> None:
+        self._flush_pending = False
+        # Nothing to report if the mouse left before the flush
+        if self.position is None:
+            return
+        for callback in self._throttled_callbacks:
+            callback(self.position)
     
     def clear_position(self) -> None:
         self.visible = False
@@ -94,8 +122,19 @@ class Crosshair:
         for callback in self._leave_callbacks:
             callback()
     
-    def on_move(self, callback: Callable) -> None:
-        self._move_callbacks.append(callback)
+    def on_move(self, callback: Callable, throttled: bool = False) -> None:
+        """
+        Call callback with the new position when the crosshair moves.
+        
+        Args:
+            callback: Called with a CrosshairPosition
+            throttled: Call at most once per event-loop turn, with the latest
+                position, instead of once per move
+        """
+        if throttled:
+            self._throttled_callbacks.append(callback)
+        else:
+            self._move_callbacks.append(callback)
     
     def on_leave(self, callback: Callable) -> None:
         self._leave_callbacks.append(callback)
@@ -168,41 +207,33 @@ class CrosshairVisual:
         self.options = options or CrosshairOptions()
         self._initialized = False
         
-        from .utils import hex_to_rgba
+        # Last uploaded line coordinates (unchanged lines are not re-uploaded)
+        self._last_x: Optional[float] = None
+        self._last_y: Optional[float] = None
         
-        # SOLID LINES - much faster!
-        v_color = hex_to_rgba(self.options.vert_color, 0.6)  # Semi-transparent
-        self.v_line = visuals.Line(  # type: ignore[attr-defined]
-            pos=np.array([[0, -100000, 0], [0, 100000, 0]], dtype=np.float32),
-            color=v_color,
-            width=1,
-            connect='strip',  # Solid line
-            method='gl',
-            antialias=True
-        )
+        # Both lines in one vertex buffer, rewritten in place on every move:
+        # rows 0-1 are the vertical line, rows 2-3 the horizontal one
+        self._buf = np.array([
+            [0, -100000, 0], [0, 100000, 0],
+            [-100000, 0, 0], [100000, 0, 0]
+        ], dtype=np.float32)
         
-        h_color = hex_to_rgba(self.options.horiz_color, 0.6)  # Semi-transparent
-        self.h_line = visuals.Line(  # type: ignore[attr-defined]
-            pos=np.array([[-100000, 0, 0], [100000, 0, 0]], dtype=np.float32),
-            color=h_color,
+        # SOLID LINES - much faster! Drawn as two segments of one visual,
+        # so the crosshair is a single draw call
+        self.lines = visuals.Line(  # type: ignore[attr-defined]
+            pos=self._buf,
+            color=self._line_colors(self.options.vert_color, self.options.horiz_color),
             width=1,
-            connect='strip',  # Solid line
+            connect='segments',
             method='gl',
             antialias=True
         )
         
         try:
-            view.add(self.v_line)
-            view.add(self.h_line)
-            
-            self.v_line.order = 10000
-            self.h_line.order = 10000
-            
-            self.v_line.set_gl_state('translucent', depth_test=False, cull_face=False)
-            self.h_line.set_gl_state('translucent', depth_test=False, cull_face=False)
-            
-            self.v_line.visible = True
-            self.h_line.visible = True
+            view.add(self.lines)
+            self.lines.order = 10000
+            self.lines.set_gl_state('translucent', depth_test=False, cull_face=False)
+            self.lines.visible = True
             
             self._initialized = True
             
@@ -212,21 +243,34 @@ class CrosshairVisual:
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _line_colors(vert_color: str, horiz_color: str) -> np.ndarray:
+        """Per-vertex colours: vertical line, then horizontal (semi-transparent)."""
+        from .utils import hex_to_rgba
+        return np.array(
+            [hex_to_rgba(vert_color, 0.6)] * 2 + [hex_to_rgba(horiz_color, 0.6)] * 2,
+            dtype=np.float32
+        )
+    
     def update_position(self, x: float, y: float, x_range: Tuple[float, float]) -> None:
-        """Update with simple solid lines - NO lag!"""
-        if not self._initialized:
+        """Update with simple solid lines, re-uploading only when a line moved."""
+        if not self._initialized or not self.options.visible:
             return
         
         try:
-            # Vertical line: fixed X, full Y range
-            v_pos = np.array([[x, -100000, 0], [x, 100000, 0]], dtype=np.float32)
-            self.v_line.set_data(v_pos)
+            if x == self._last_x and y == self._last_y:
+                if not self.lines.visible:
+                    self.show()
+                return
             
-            # Horizontal line: fixed Y, full X range
-            h_pos = np.array([[-100000, y, 0], [100000, y, 0]], dtype=np.float32)
-            self.h_line.set_data(h_pos)
+            # Vertical line: fixed X, full Y range; horizontal: fixed Y, full X range
+            self._buf[:2, 0] = x
+            self._buf[2:, 1] = y
+            self.lines.set_data(self._buf)
+            self._last_x = x
+            self._last_y = y
             
-            if not self.v_line.visible:
+            if not self.lines.visible:
                 self.show()
                 
         except Exception as e:
@@ -237,8 +281,7 @@ class CrosshairVisual:
             return
         if HAS_VISPY and self.options.visible:
             try:
-                self.v_line.visible = True
-                self.h_line.visible = True
+                self.lines.visible = True
             except:
                 pass
     
@@ -247,8 +290,7 @@ class CrosshairVisual:
             return
         if HAS_VISPY:
             try:
-                self.v_line.visible = False
-                self.h_line.visible = False
+                self.lines.visible = False
             except:
                 pass
     
@@ -262,10 +304,8 @@ class CrosshairVisual:
     def update_colors(self, vert_color: str, horiz_color: str) -> None:
         if not self._initialized:
             return
-        from .utils import hex_to_rgba
         try:
-            self.v_line.color = hex_to_rgba(vert_color, 0.6)
-            self.h_line.color = hex_to_rgba(horiz_color, 0.6)
+            self.lines.set_data(color=self._line_colors(vert_color, horiz_color))
             self.options.vert_color = vert_color
             self.options.horiz_color = horiz_color
         except:
@@ -7,6 +7,10 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
+import numpy as np
+
+from .utils import to_list
+
 
 class SeriesType(Enum):
     """Supported chart series types"""
@@ -96,6 +100,73 @@ class OHLC:
         }
 
 
+# Structured dtype for a contiguous array of candles
+CANDLE_DTYPE = np.dtype([
+    ("time", "datetime64[s]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+# Structured dtype for single-value series (line, area, histogram)
+VALUE_DTYPE = np.dtype([
+    ("time", "datetime64[s]"),
+    ("value", "f8"),
+])
+
+
+@dataclass
+class OHLCColumns:
+    """Column-oriented OHLC data: one NumPy array per field"""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert to the list-of-dicts format accepted by ``set_data``."""
+        columns = {
+            "time": to_list(self.time),
+            "open": self.open.tolist(),
+            "high": self.high.tolist(),
+            "low": self.low.tolist(),
+            "close": self.close.tolist(),
+        }
+        if self.volume is not None:
+            columns["volume"] = self.volume.tolist()
+        keys = list(columns)
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+    def astype(self, dtype: Any) -> "OHLCColumns":
+        """Copy with the price columns cast to ``dtype`` (e.g. ``np.float32``)."""
+        return OHLCColumns(
+            time=self.time,
+            open=self.open.astype(dtype, copy=False),
+            high=self.high.astype(dtype, copy=False),
+            low=self.low.astype(dtype, copy=False),
+            close=self.close.astype(dtype, copy=False),
+            volume=self.volume
+        )
+
+    def to_structured(self) -> np.ndarray:
+        """Pack the columns into one contiguous array of ``CANDLE_DTYPE`` records."""
+        candles = np.empty(len(self), dtype=CANDLE_DTYPE)
+        candles["time"] = self.time
+        candles["open"] = self.open
+        candles["high"] = self.high
+        candles["low"] = self.low
+        candles["close"] = self.close
+        candles["volume"] = self.volume if self.volume is not None else np.nan
+        return candles
+
+
 @dataclass
 class DataPoint:
     """Generic data point"""
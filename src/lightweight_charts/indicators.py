@@ -4,32 +4,337 @@ Calculations for common trading indicators
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from collections import OrderedDict, deque
 from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
+from .data_types import OHLCColumns
+from .utils import to_list
+
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+try:
+    import talib
+    HAS_TALIB = True
+except ImportError:
+    HAS_TALIB = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# The kernels take user data that may contain NaN (gaps, missing closes),
+# so they are compiled without fastmath: it lets Numba assume finite inputs
+# and reorder the running sums, which changes results
+@njit(cache=True)
+def _sma_kernel(values, period):
+    """Rolling mean using a running sum; NaN until the window is full"""
+    out = np.full(len(values), np.nan)
+    total = 0.0
+    for i in range(len(values)):
+        total += values[i]
+        if i >= period:
+            total -= values[i - period]
+        if i >= period - 1:
+            out[i] = total / period
+    return out
+
+
+@njit(cache=True)
+def _ema_kernel(values, period):
+    """EMA seeded with the SMA of the first period values"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    alpha = 2.0 / (period + 1)
+    ema_value = 0.0
+    for i in range(period):
+        ema_value += values[i]
+    ema_value /= period
+    out[period - 1] = ema_value
+    for i in range(period, n):
+        ema_value = alpha * values[i] + (1.0 - alpha) * ema_value
+        out[i] = ema_value
+    return out
+
+
+@njit(cache=True)
+def _macd_kernel(values, fast_period, slow_period, signal_period):
+    """
+    MACD line, signal line and histogram in one pass over values.
+    
+    Both EMAs and the signal EMA are seeded with the SMA of their first
+    period inputs, matching _ema_kernel and the Python implementation.
+    """
+    n = len(values)
+    macd = np.full(n, np.nan)
+    signal = np.full(n, np.nan)
+    histogram = np.full(n, np.nan)
+    alpha_fast = 2.0 / (fast_period + 1)
+    alpha_slow = 2.0 / (slow_period + 1)
+    alpha_signal = 2.0 / (signal_period + 1)
+    start = max(fast_period, slow_period) - 1
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_signal = 0.0
+    for i in range(n):
+        value = values[i]
+        if i < fast_period:
+            ema_fast += value
+            if i == fast_period - 1:
+                ema_fast /= fast_period
+        else:
+            ema_fast = alpha_fast * value + (1.0 - alpha_fast) * ema_fast
+        if i < slow_period:
+            ema_slow += value
+            if i == slow_period - 1:
+                ema_slow /= slow_period
+        else:
+            ema_slow = alpha_slow * value + (1.0 - alpha_slow) * ema_slow
+        if i < start:
+            continue
+        
+        macd_value = ema_fast - ema_slow
+        macd[i] = macd_value
+        j = i - start
+        if j < signal_period:
+            ema_signal += macd_value
+            if j < signal_period - 1:
+                continue
+            ema_signal /= signal_period
+        else:
+            ema_signal = (macd_value - ema_signal) * alpha_signal + ema_signal
+        signal[i] = ema_signal
+        histogram[i] = macd_value - ema_signal
+    return macd, signal, histogram
+
+
+@njit(cache=True)
+def _rsi_kernel(values, period):
+    """Wilder-smoothed RSI; NaN for the first period values"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = values[i] - values[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    for i in range(period, n):
+        if i > period:
+            delta = values[i] - values[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def _bollinger_std_kernel(values, period):
+    """Rolling population standard deviation; NaN until the window is full"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(period - 1, n):
+        mean = 0.0
+        for j in range(i - period + 1, i + 1):
+            mean += values[j]
+        mean /= period
+        var = 0.0
+        for j in range(i - period + 1, i + 1):
+            var += (values[j] - mean) ** 2
+        out[i] = np.sqrt(var / period)
+    return out
+
+
+# Source values extracted from lists of points, and EMAs of those values,
+# kept for the next indicator call on the same data. An entry holds its list
+# (so the id is not reused), the length and the last point it was read at;
+# see IndicatorCalculator.invalidate for earlier points edited in place
+_CACHE_SIZE = 16
+_VALUE_CACHE: "OrderedDict[Tuple[int, str], Tuple[Any, int, Any, np.ndarray]]" = OrderedDict()
+_EMA_CACHE: "OrderedDict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def _trim(cache: "OrderedDict[Any, Any]") -> None:
+    """Drop the least recently used entries beyond _CACHE_SIZE"""
+    while len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _forget_emas(values: np.ndarray) -> None:
+    """Drop the cached EMAs of a values array that is no longer current"""
+    for key in [k for k, entry in _EMA_CACHE.items() if entry[0] is values]:
+        del _EMA_CACHE[key]
+
+
+def _ema_values(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA of values seeded with the SMA of the first period (NaN before it)"""
+    key = (id(values), period)
+    cached = _EMA_CACHE.get(key)
+    if cached is not None and cached[0] is values:
+        return cached[1]
+    
+    if HAS_TALIB and len(values) >= period:
+        ema_values = talib.EMA(values, timeperiod=period)
+    elif HAS_NUMBA:
+        ema_values = _ema_kernel(values, period)
+    else:
+        # EMA multiplier
+        multiplier = 2 / (period + 1)
+        ema_values = np.full(len(values), np.nan)
+        
+        if len(values) >= period:
+            # Start with SMA for first value
+            ema_value = np.mean(values[:period])
+            ema_values[period - 1] = ema_value
+            for i in range(period, len(values)):
+                # Calculate EMA: (Close - EMA(previous)) * multiplier + EMA(previous)
+                ema_value = (values[i] - ema_value) * multiplier + ema_value
+                ema_values[i] = ema_value
+    
+    # Keyed by the values array, which stays cached (and alive) only while
+    # its source list is cached; read-only, like the values
+    if not values.flags.writeable:
+        ema_values.flags.writeable = False
+        _EMA_CACHE[key] = (values, ema_values)
+        _trim(_EMA_CACHE)
+    return ema_values
+
+
+def _source_value(item: Union[Dict[str, Any], Any], source: str) -> float:
+    """Read one source field from a dict or dataclass data point"""
+    if isinstance(item, dict):
+        return float(item.get(source, 0))
+    return float(getattr(item, source, 0))
+
 
 class IndicatorCalculator:
     """Base class for indicator calculations"""
     
     @staticmethod
-    def extract_values(data: List[Dict[str, Any]], source: str = "close") -> np.ndarray:
+    def _source_values(data: Any, source: str = "close") -> np.ndarray:
+        """
+        extract_values without the copy: values of a list of points are
+        the cached, read-only array shared with other indicator calls.
+        """
+        if isinstance(data, OHLCColumns):
+            column = getattr(data, source, None)
+        elif isinstance(data, dict):
+            column = data.get(source)
+        elif isinstance(data, np.ndarray) and data.dtype.names:
+            column = data[source] if source in data.dtype.names else None
+        elif hasattr(data, "to_numpy") and hasattr(data, "columns"):
+            column = data[source].to_numpy() if source in data.columns else None
+        else:
+            key = (id(data), source)
+            cached = _VALUE_CACHE.pop(key, None)
+            if cached is not None:
+                source_data, length, last, array = cached
+                # Same list, same length and the same last point with the
+                # same value, so a replaced or revised forming bar misses
+                if (
+                    source_data is data
+                    and length == len(data)
+                    and data[length - 1] is last
+                    and np.array_equal(_source_value(last, source), array[-1], equal_nan=True)
+                ):
+                    _VALUE_CACHE[key] = cached
+                    return array
+                _forget_emas(array)
+            
+            array = np.array([_source_value(item, source) for item in data], dtype=np.float64)
+            if len(data):
+                # Shared by every later call on this list, so nobody may edit it
+                array.flags.writeable = False
+                _VALUE_CACHE[key] = (data, len(data), data[-1], array)
+                _trim(_VALUE_CACHE)
+            return array
+        
+        if column is None:
+            return np.zeros(len(IndicatorCalculator.extract_times(data)))
+        return np.asarray(column, dtype=np.float64)
+    
+    @staticmethod
+    def extract_values(data: Any, source: str = "close") -> np.ndarray:
         """
         Extract values from OHLC data.
         
+        Column-oriented data (``OHLCColumns``, a dict of arrays such as
+        ``series.columns``, a structured array or a pandas DataFrame) is
+        read as one array; only a list of points is walked item by item.
+        
         Args:
-            data: List of OHLC data points
+            data: List of OHLC data points, or column-oriented OHLC data
             source: Which value to extract (open, high, low, close, volume)
         
         Returns:
-            NumPy array of values
+            NumPy array of values (zeros where the source field is missing)
         """
-        values = []
-        for item in data:
-            if isinstance(item, dict):
-                values.append(float(item.get(source, 0)))
-            else:
-                values.append(float(getattr(item, source, 0)))
-        return np.array(values)
+        values = IndicatorCalculator._source_values(data, source)
+        return values if values.flags.writeable else values.copy()
+    
+    @staticmethod
+    def invalidate(data: Any = None) -> None:
+        """
+        Forget cached values (and EMAs) of a list edited in place.
+        
+        Lists of points are cached by identity, length and last point, so
+        appending or replacing the last point is noticed but editing an
+        earlier point in place is not.
+        
+        Args:
+            data: List whose cached values to drop (default: all)
+        """
+        for key, (source_data, _, _, values) in list(_VALUE_CACHE.items()):
+            if data is None or source_data is data:
+                del _VALUE_CACHE[key]
+                _forget_emas(values)
+    
+    @staticmethod
+    def extract_times(data: Any) -> List[Any]:
+        """
+        Extract the time of every data point.
+        
+        Args:
+            data: List of OHLC data points, or column-oriented OHLC data
+        
+        Returns:
+            List of times (datetime64 columns become datetime objects)
+        """
+        if isinstance(data, OHLCColumns):
+            return to_list(data.time)
+        if isinstance(data, dict) or (isinstance(data, np.ndarray) and data.dtype.names):
+            return to_list(data["time"])
+        if hasattr(data, "to_numpy") and hasattr(data, "columns"):
+            times = data["time"] if "time" in data.columns else data.index
+            return to_list(times.to_numpy())
+        return [IndicatorCalculator.get_time(item) for item in data]
     
     @staticmethod
     def get_time(item: Union[Dict[str, Any], Any]) -> datetime:
@@ -46,6 +351,23 @@ class IndicatorCalculator:
             return item["time"]
         else:
             return item.time
+    
+    @staticmethod
+    def to_series(data: Any, values: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Pair computed indicator values with the times of the source data.
+        
+        Args:
+            data: Source data points, or column-oriented data
+            values: One indicator value per data point
+        
+        Returns:
+            List of {time, value} dictionaries
+        """
+        return [
+            {"time": time, "value": value}
+            for time, value in zip(IndicatorCalculator.extract_times(data), values.tolist())
+        ]
 
 
 class MovingAverage(IndicatorCalculator):
@@ -64,26 +386,24 @@ class MovingAverage(IndicatorCalculator):
         Returns:
             List of {time, value} dictionaries
         """
-        values = MovingAverage.extract_values(data, source)
-        result = []
-        
-        for i in range(len(values)):
-            if i < period - 1:
-                # Not enough data yet
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": np.nan
-                })
-            else:
-                # Calculate SMA
-                window = values[i - period + 1:i + 1]
-                sma_value = np.mean(window)
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": float(sma_value)
-                })
-        
-        return result
+        values = MovingAverage._source_values(data, source)
+        
+        if HAS_BOTTLENECK:
+            return MovingAverage.to_series(data, bn.move_mean(values, window=period, min_count=period))
+        if HAS_TALIB:
+            return MovingAverage.to_series(data, talib.SMA(values, timeperiod=period))
+        if HAS_NUMBA:
+            return MovingAverage.to_series(data, _sma_kernel(values, period))
+        
+        # Window sums as differences of one cumulative sum: O(n) for any period
+        sma_values = np.full(len(values), np.nan)
+        if len(values) >= period:
+            csum = np.cumsum(values, dtype=np.float64)
+            sums = csum[period - 1:].copy()
+            sums[1:] -= csum[:-period]
+            sma_values[period - 1:] = sums / period
+        
+        return MovingAverage.to_series(data, sma_values)
     
     @staticmethod
     def ema(data: List[Dict[str, Any]], period: int = 20, source: str = "close") -> List[Dict[str, Any]]:
@@ -98,35 +418,9 @@ class MovingAverage(IndicatorCalculator):
         Returns:
             List of {time, value} dictionaries
         """
-        values = MovingAverage.extract_values(data, source)
-        result = []
+        values = MovingAverage._source_values(data, source)
         
-        # EMA multiplier
-        multiplier = 2 / (period + 1)
-        
-        # Start with SMA for first value
-        ema_value = np.mean(values[:period])
-        
-        for i in range(len(values)):
-            if i < period - 1:
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": np.nan
-                })
-            elif i == period - 1:
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": float(ema_value)
-                })
-            else:
-                # Calculate EMA: (Close - EMA(previous)) * multiplier + EMA(previous)
-                ema_value = (values[i] - ema_value) * multiplier + ema_value
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": float(ema_value)
-                })
-        
-        return result
+        return MovingAverage.to_series(data, _ema_values(values, period))
     
     @staticmethod
     def wma(data: List[Dict[str, Any]], period: int = 20, source: str = "close") -> List[Dict[str, Any]]:
@@ -141,27 +435,18 @@ class MovingAverage(IndicatorCalculator):
         Returns:
             List of {time, value} dictionaries
         """
-        values = MovingAverage.extract_values(data, source)
-        result = []
-        
-        # Create weights (more recent = higher weight)
-        weights = np.arange(1, period + 1)
-        
-        for i in range(len(values)):
-            if i < period - 1:
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": np.nan
-                })
-            else:
-                window = values[i - period + 1:i + 1]
-                wma_value = np.sum(window * weights) / np.sum(weights)
-                result.append({
-                    "time": MovingAverage.get_time(data[i]),
-                    "value": float(wma_value)
-                })
+        values = MovingAverage._source_values(data, source)
         
-        return result
+        # Normalized weights, most recent highest; np.convolve flips its
+        # kernel, so reversing them lines weight `period` up with the newest
+        weights = np.arange(1, period + 1, dtype=np.float64)
+        weights /= weights.sum()
+        
+        wma_values = np.full(len(values), np.nan)
+        if len(values) >= period:
+            wma_values[period - 1:] = np.convolve(values, weights[::-1], mode="valid")
+        
+        return MovingAverage.to_series(data, wma_values)
 
 
 class RSI(IndicatorCalculator):
@@ -180,8 +465,16 @@ class RSI(IndicatorCalculator):
         Returns:
             List of {time, value} dictionaries with RSI values (0-100)
         """
-        values = RSI.extract_values(data, source)
-        result = []
+        values = RSI._source_values(data, source)
+        
+        if HAS_TALIB:
+            return RSI.to_series(data, talib.RSI(values, timeperiod=period))
+        if HAS_NUMBA:
+            return RSI.to_series(data, _rsi_kernel(values, period))
+        
+        rsi_values = np.full(len(values), np.nan)
+        if len(values) <= period:
+            return RSI.to_series(data, rsi_values)
         
         # Calculate price changes
         deltas = np.diff(values)
@@ -194,44 +487,19 @@ class RSI(IndicatorCalculator):
         avg_gain = np.mean(gains[:period])
         avg_loss = np.mean(losses[:period])
         
-        for i in range(len(values)):
-            if i < period:
-                result.append({
-                    "time": RSI.get_time(data[i]),
-                    "value": np.nan
-                })
-            elif i == period:
-                # First RSI calculation
-                if avg_loss == 0:
-                    rsi_value = 100
-                else:
-                    rs = avg_gain / avg_loss
-                    rsi_value = 100 - (100 / (1 + rs))
-                
-                result.append({
-                    "time": RSI.get_time(data[i]),
-                    "value": float(rsi_value)
-                })
-            else:
+        for i in range(period, len(values)):
+            if i > period:
                 # Smoothed average gain/loss
-                current_gain = gains[i - 1]
-                current_loss = losses[i - 1]
-                
-                avg_gain = (avg_gain * (period - 1) + current_gain) / period
-                avg_loss = (avg_loss * (period - 1) + current_loss) / period
-                
-                if avg_loss == 0:
-                    rsi_value = 100
-                else:
-                    rs = avg_gain / avg_loss
-                    rsi_value = 100 - (100 / (1 + rs))
-                
-                result.append({
-                    "time": RSI.get_time(data[i]),
-                    "value": float(rsi_value)
-                })
-        
-        return result
+                avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+                avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+            
+            if avg_loss == 0:
+                rsi_values[i] = 100
+            else:
+                rs = avg_gain / avg_loss
+                rsi_values[i] = 100 - (100 / (1 + rs))
+        
+        return RSI.to_series(data, rsi_values)
 
 
 class MACD(IndicatorCalculator):
@@ -258,72 +526,30 @@ class MACD(IndicatorCalculator):
         Returns:
             Tuple of (macd_line, signal_line, histogram)
         """
-        values = MACD.extract_values(data, source)
-        
-        # Calculate fast and slow EMAs
-        fast_ema = MovingAverage.ema(data, fast_period, source)
-        slow_ema = MovingAverage.ema(data, slow_period, source)
-        
-        # Calculate MACD line (fast - slow)
-        macd_line = []
-        macd_values = []
-        
-        for i in range(len(data)):
-            if not np.isnan(fast_ema[i]["value"]) and not np.isnan(slow_ema[i]["value"]):
-                macd_val = fast_ema[i]["value"] - slow_ema[i]["value"]
-                macd_values.append(macd_val)
-            else:
-                macd_val = np.nan
-            
-            macd_line.append({
-                "time": MACD.get_time(data[i]),
-                "value": float(macd_val) if not np.isnan(macd_val) else np.nan
-            })
-        
-        # Calculate signal line (EMA of MACD)
-        signal_line = []
-        signal_ema = np.nan
-        valid_macd = [v for v in macd_values if not np.isnan(v)]
-        
-        if len(valid_macd) >= signal_period:
-            # Initialize with SMA
-            signal_ema = np.mean(valid_macd[:signal_period])
-            multiplier = 2 / (signal_period + 1)
-        
-        signal_idx = 0
-        for i in range(len(data)):
-            if np.isnan(macd_line[i]["value"]):
-                signal_value = np.nan
-            elif signal_idx < signal_period - 1:
-                signal_value = np.nan
-                signal_idx += 1
-            elif signal_idx == signal_period - 1:
-                signal_value = signal_ema
-                signal_idx += 1
-            else:
-                # Calculate EMA
-                signal_ema = (macd_line[i]["value"] - signal_ema) * multiplier + signal_ema
-                signal_value = signal_ema
-            
-            signal_line.append({
-                "time": MACD.get_time(data[i]),
-                "value": float(signal_value) if not np.isnan(signal_value) else np.nan
-            })
-        
-        # Calculate histogram (MACD - Signal)
-        histogram = []
-        for i in range(len(data)):
-            if not np.isnan(macd_line[i]["value"]) and not np.isnan(signal_line[i]["value"]):
-                hist_val = macd_line[i]["value"] - signal_line[i]["value"]
-            else:
-                hist_val = np.nan
-            
-            histogram.append({
-                "time": MACD.get_time(data[i]),
-                "value": float(hist_val) if not np.isnan(hist_val) else np.nan
-            })
-        
-        return macd_line, signal_line, histogram
+        values = MACD._source_values(data, source)
+        
+        if HAS_NUMBA:
+            macd, signal, histogram = _macd_kernel(values, fast_period, slow_period, signal_period)
+            return (
+                MACD.to_series(data, macd),
+                MACD.to_series(data, signal),
+                MACD.to_series(data, histogram)
+            )
+        
+        # Whole-array arithmetic: NaN warm-up values propagate on their own
+        macd = _ema_values(values, fast_period) - _ema_values(values, slow_period)
+        
+        # Signal line: EMA of the MACD line from its first valid value
+        signal = np.full(len(values), np.nan)
+        valid = np.flatnonzero(~np.isnan(macd))
+        if len(valid):
+            signal[valid[0]:] = _ema_values(macd[valid[0]:], signal_period)
+        
+        return (
+            MACD.to_series(data, macd),
+            MACD.to_series(data, signal),
+            MACD.to_series(data, macd - signal)
+        )
 
 
 class BollingerBands(IndicatorCalculator):
@@ -348,46 +574,153 @@ class BollingerBands(IndicatorCalculator):
         Returns:
             Tuple of (upper_band, middle_band, lower_band)
         """
-        values = BollingerBands.extract_values(data, source)
-        
-        upper_band = []
-        middle_band = []
-        lower_band = []
-        
-        for i in range(len(values)):
-            if i < period - 1:
-                upper_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": np.nan
-                })
-                middle_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": np.nan
-                })
-                lower_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": np.nan
-                })
-            else:
-                # Calculate SMA (middle band)
-                window = values[i - period + 1:i + 1]
-                sma = np.mean(window)
-                std = np.std(window)
-                
-                upper = sma + (std_dev * std)
-                lower = sma - (std_dev * std)
-                
-                upper_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": float(upper)
-                })
-                middle_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": float(sma)
-                })
-                lower_band.append({
-                    "time": BollingerBands.get_time(data[i]),
-                    "value": float(lower)
-                })
-        
-        return upper_band, middle_band, lower_band
+        values = BollingerBands._source_values(data, source)
+        
+        if HAS_BOTTLENECK:
+            middle = bn.move_mean(values, window=period, min_count=period)
+            std = bn.move_std(values, window=period, min_count=period)
+            return (
+                BollingerBands.to_series(data, middle + std_dev * std),
+                BollingerBands.to_series(data, middle),
+                BollingerBands.to_series(data, middle - std_dev * std)
+            )
+        if HAS_TALIB:
+            upper, middle, lower = talib.BBANDS(
+                values, timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev, matype=0
+            )
+            return (
+                BollingerBands.to_series(data, upper),
+                BollingerBands.to_series(data, middle),
+                BollingerBands.to_series(data, lower)
+            )
+        if HAS_NUMBA:
+            middle = _sma_kernel(values, period)
+            std = _bollinger_std_kernel(values, period)
+            return (
+                BollingerBands.to_series(data, middle + std_dev * std),
+                BollingerBands.to_series(data, middle),
+                BollingerBands.to_series(data, middle - std_dev * std)
+            )
+        
+        # Every window as a row of one strided view: mean and std in two calls
+        middle = np.full(len(values), np.nan)
+        std = np.full(len(values), np.nan)
+        if len(values) >= period:
+            windows = sliding_window_view(values, period)
+            middle[period - 1:] = windows.mean(axis=1)
+            std[period - 1:] = windows.std(axis=1)
+        
+        return (
+            BollingerBands.to_series(data, middle + std_dev * std),
+            BollingerBands.to_series(data, middle),
+            BollingerBands.to_series(data, middle - std_dev * std)
+        )
+
+
+class IncrementalSMA(IndicatorCalculator):
+    """
+    Simple Moving Average updated one bar at a time.
+    
+    Keeps a running sum over the last `period` values so each update is O(1),
+    for live feeds where recomputing the whole series per tick is wasteful.
+    A bar with the same time as the previous one replaces it (a forming candle).
+    """
+    
+    def __init__(self, period: int = 20, source: str = "close"):
+        self.period = period
+        self.source = source
+        self._window = deque(maxlen=period)
+        self._sum = 0.0
+        self._last_time = None
+    
+    def update(self, bar: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
+        """
+        Add or revise a bar.
+        
+        Args:
+            bar: OHLC data point (dict or dataclass)
+        
+        Returns:
+            {time, value} dictionary for the bar (NaN until `period` bars are seen)
+        """
+        time = self.get_time(bar)
+        value = _source_value(bar, self.source)
+        
+        if self._window and time == self._last_time:
+            self._sum += value - self._window[-1]
+            self._window[-1] = value
+        else:
+            if len(self._window) == self.period:
+                self._sum -= self._window[0]
+            self._window.append(value)
+            self._sum += value
+            self._last_time = time
+        
+        if len(self._window) < self.period:
+            return {"time": time, "value": np.nan}
+        return {"time": time, "value": self._sum / self.period}
+
+
+class IncrementalRSI(IndicatorCalculator):
+    """
+    Wilder RSI updated one bar at a time.
+    
+    Carries the smoothed average gain and loss between calls so each update is
+    O(1). Values match RSI.calculate over the same bars. A bar with the same
+    time as the previous one replaces it (a forming candle).
+    """
+    
+    def __init__(self, period: int = 14, source: str = "close"):
+        self.period = period
+        self.source = source
+        # (previous value, values seen, average gain, average loss); during
+        # warm-up the averages hold running sums
+        self._state = (0.0, 0, 0.0, 0.0)
+        self._before_last = self._state
+        self._last_time = None
+    
+    def _advance(self, state: Tuple[float, int, float, float], value: float) -> Tuple[float, int, float, float]:
+        prev, count, avg_gain, avg_loss = state
+        if count == 0:
+            return (value, 1, 0.0, 0.0)
+        
+        delta = value - prev
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        if count < self.period:
+            avg_gain += gain
+            avg_loss += loss
+        elif count == self.period:
+            avg_gain = (avg_gain + gain) / self.period
+            avg_loss = (avg_loss + loss) / self.period
+        else:
+            avg_gain = (avg_gain * (self.period - 1) + gain) / self.period
+            avg_loss = (avg_loss * (self.period - 1) + loss) / self.period
+        
+        return (value, count + 1, avg_gain, avg_loss)
+    
+    def update(self, bar: Union[Dict[str, Any], Any]) -> Dict[str, Any]:
+        """
+        Add or revise a bar.
+        
+        Args:
+            bar: OHLC data point (dict or dataclass)
+        
+        Returns:
+            {time, value} dictionary with the RSI (0-100), NaN during warm-up
+        """
+        time = self.get_time(bar)
+        value = _source_value(bar, self.source)
+        
+        if self._state[1] == 0 or time != self._last_time:
+            self._before_last = self._state
+            self._last_time = time
+        self._state = self._advance(self._before_last, value)
+        
+        _, count, avg_gain, avg_loss = self._state
+        if count <= self.period:
+            return {"time": time, "value": np.nan}
+        if avg_loss == 0:
+            return {"time": time, "value": 100.0}
+        return {"time": time, "value": 100 - (100 / (1 + avg_gain / avg_loss))}
@@ -3,9 +3,20 @@ Pane system for multi-pane charts
 Allows separate panes for price action, indicators, etc.
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Sequence, Tuple
 import logging
-from .series import BaseSeries, LineSeries, CandlestickSeries, AreaSeries, HistogramSeries
+import numpy as np
+from .series import (
+    BaseSeries,
+    LineSeries,
+    CandlestickSeries,
+    AreaSeries,
+    HistogramSeries,
+    LineBatch,
+    create_series_visual,
+    remove_all_series,
+    remove_series_visuals
+)
 from .scales import TimeScale, PriceScale
 from .data_types import (
     LineStyleOptions,
@@ -18,11 +29,65 @@ logger = logging.getLogger(__name__)
 
 try:
     from vispy import scene
+    from vispy.visuals.transforms import MatrixTransform, STTransform
     HAS_VISPY = True
 except ImportError:
     HAS_VISPY = False
 
 
+class ViewTransformCache:
+    """
+    Canvas-to-data mapping of a 2D view, cached between camera moves.
+    
+    The scene transform is reduced to an inverse 2x2 matrix and offset
+    once per camera move, so mapping a mouse position is six float
+    operations instead of a call through Vispy's transform machinery.
+    """
+    
+    def __init__(self, view: Any):
+        """
+        Initialize ViewTransformCache.
+        
+        Args:
+            view: Vispy view whose scene transform is inverted
+        """
+        self.view = view
+        self._transform: Any = None
+        # (xx, yx, xy, yy, x offset, y offset) of the inverse mapping
+        self._inverse: Optional[Tuple[float, ...]] = None
+    
+    def _invalidate(self, event: Any = None) -> None:
+        self._inverse = None
+    
+    def imap(self, pos: Sequence[float]) -> Tuple[float, float]:
+        """Map a canvas position to (x, y) data coordinates."""
+        transform = self.view.scene.transform
+        if not isinstance(transform, (MatrixTransform, STTransform)):
+            data_pos = transform.imap(pos[:2])
+            return float(data_pos[0]), float(data_pos[1])
+        
+        if transform is not self._transform:
+            # Cameras normally update one transform in place; follow a swap
+            if self._transform is not None:
+                self._transform.changed.disconnect(self._invalidate)
+            transform.changed.connect(self._invalidate)
+            self._transform = transform
+            self._inverse = None
+        
+        if self._inverse is None:
+            # Row-vector convention: canvas = data @ M[:2, :2] + M[3, :2]
+            if isinstance(transform, STTransform):
+                transform = transform.as_matrix()
+            matrix = transform.matrix
+            inverse = np.linalg.inv(matrix[:2, :2])
+            self._inverse = (*inverse.ravel().tolist(), *matrix[3, :2].tolist())
+        
+        xx, yx, xy, yy, x_offset, y_offset = self._inverse
+        dx = pos[0] - x_offset
+        dy = pos[1] - y_offset
+        return float(dx * xx + dy * xy), float(dx * yx + dy * yy)
+
+
 class Pane:
     """
     A single pane in a multi-pane chart.
@@ -53,12 +118,16 @@ class Pane:
         
         # Series in this pane
         self.series: Dict[str, BaseSeries] = {}
+        # Line series share one visual per line width
+        self._line_batches: Dict[float, LineBatch] = {}
         
         # Vispy view for this pane (created later)
         self.view: Optional[Any] = None
         
         # Crosshair visual for this pane
         self.crosshair_visual: Optional[Any] = None
+        # Mouse-to-data mapping of the view (created with the view)
+        self.view_transform: Optional[ViewTransformCache] = None
         
         # Position in layout
         self.y_position = 0.0
@@ -94,6 +163,7 @@ class Pane:
             )
             self.view.camera = camera  # type: ignore[attr-defined]
             camera.aspect = None
+            self.view_transform = ViewTransformCache(self.view)
             
             # Main pane: full interactivity
             # Other panes: horizontal scroll only (Y locked)
@@ -110,7 +180,7 @@ class Pane:
             
             # NOW create visuals for all series that were added before view was ready
             for series in self.series.values():
-                series.create_visual(self.view)
+                create_series_visual(series, self.view, self._line_batches)
                 logger.debug(f"Pane '{self.name}': Created visual for series '{series.name}'")
             
             logger.info(f"✅ Pane view created: {self.name} at grid row {row}")
@@ -190,7 +260,7 @@ class Pane:
         series = LineSeries(name, style)
         # Only create visual if view exists, otherwise defer until create_view()
         if self.view:
-            series.create_visual(self.view)
+            create_series_visual(series, self.view, self._line_batches)
         self.series[name or f"line_{len(self.series)}"] = series
         logger.debug(f"Pane {self.name}: Added line series '{name}'")
         return series
@@ -218,7 +288,7 @@ class Pane:
         series = AreaSeries(name, style)
         # Only create visual if view exists
         if self.view:
-            series.create_visual(self.view)
+            create_series_visual(series, self.view, self._line_batches)
         self.series[name or f"area_{len(self.series)}"] = series
         logger.debug(f"Pane {self.name}: Added area series '{name}'")
         return series
@@ -241,35 +311,39 @@ class Pane:
     
     def update_price_scale(self) -> None:
         """Update price scale based on visible data in this pane."""
-        min_prices = []
-        max_prices = []
-        
-        for series in self.series.values():
-            if series.visible:
-                visible = series.get_visible_data(self.time_scale)
-                if visible:
-                    min_p, max_p = series._get_price_range(visible)
-                    min_prices.append(min_p)
-                    max_prices.append(max_p)
-        
-        if min_prices and max_prices:
-            self.price_scale.update_range(
-                min(min_prices),
-                max(max_prices),
-                auto_pad=True
+        price_ranges = [
+            price_range
+            for price_range in (
+                series.get_price_range(self.time_scale)
+                for series in self.series.values() if series.visible
             )
-            logger.debug(f"Pane {self.name}: Price scale {min(min_prices):.2f} - {max(max_prices):.2f}")
+            if price_range
+        ]
+        
+        if price_ranges:
+            lows, highs = zip(*price_ranges)
+            low, high = min(lows), max(highs)
+            self.price_scale.update_range(low, high, auto_pad=True)
+            # Runs every frame; let logging skip the formatting when DEBUG is off
+            logger.debug("Pane %s: Price scale %.2f - %.2f", self.name, low, high)
         else:
             self.price_scale.update_range(0, 100)
     
     def update_visuals(self) -> None:
         """Update all series visuals in this pane."""
+        if self.view is not None:
+            self.time_scale.fit_pixel_width(self.view)
         for series in self.series.values():
             if series.visible:
                 try:
                     series.update_visual(self.time_scale, self.price_scale)
                 except Exception as e:
                     logger.error(f"Pane {self.name}: Failed to update series '{series.name}': {e}")
+        for batch in self._line_batches.values():
+            try:
+                batch.update_visual(self.time_scale, self.price_scale)
+            except Exception as e:
+                logger.error(f"Pane {self.name}: Failed to update line batch: {e}")
     
     def sync_horizontal_view(self, x: float, width: float) -> None:
         """
@@ -291,23 +365,12 @@ class Pane:
     def remove_series(self, name: str) -> bool:
         """Remove series from this pane."""
         if name in self.series:
-            series = self.series.pop(name)
-            for visual in series.visuals.values():
-                try:
-                    visual.parent = None
-                except Exception:
-                    pass
+            remove_series_visuals(self.series.pop(name))
             logger.debug(f"Pane {self.name}: Removed series '{name}'")
             return True
         return False
     
     def clear_series(self) -> None:
         """Clear all series from this pane."""
-        for series in list(self.series.values()):
-            for visual in series.visuals.values():
-                try:
-                    visual.parent = None
-                except Exception:
-                    pass
-        self.series.clear()
+        remove_all_series(self.series, self._line_batches)
         logger.debug(f"Pane {self.name}: Cleared all series")
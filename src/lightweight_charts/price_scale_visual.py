@@ -149,7 +149,7 @@ class PriceScaleVisual:
             # Recreate price labels and ticks
             self._update_labels_and_ticks(price_labels, visible_data_range, canvas_width)
             
-            logger.debug(f"Price scale updated with {len(price_labels)} labels")
+            logger.debug("Price scale updated with %d labels", len(price_labels))
         else:
             # Just update positions (for pan/zoom without price change)
             self._update_label_positions(canvas_width)
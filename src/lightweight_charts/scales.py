@@ -2,11 +2,13 @@
 Time and Price scale management
 """
 
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Union
 from datetime import datetime
 from enum import Enum
 import numpy as np
 
+from .utils import columns_to_records, to_list
+
 
 class PriceScaleMode(Enum):
     """Price scale display modes"""
@@ -86,25 +88,68 @@ class TimeScale:
     Handles visible range and time-based data access.
     """
 
-    def __init__(self, data: Optional[List] = None):
+    def __init__(self, data: Optional[Union[List, Dict[str, np.ndarray]]] = None):
         """
         Initialize TimeScale.
         
         Args:
-            data: Initial data list
+            data: Initial data list, or column arrays (see set_data)
         """
-        self.data = data or []
-        self.visible_range = (0, len(self.data) - 1) if self.data else (0, 0)
+        self.set_data(data if data is not None else [])
         self._zoom_level = 1.0
+        # Pixels the visible range spans on screen (see fit_pixel_width);
+        # dense line series are decimated to one bin per pixel (None draws
+        # every point)
+        self.pixel_width: Optional[int] = None
+
+    def set_data(self, data: Union[List, Dict[str, np.ndarray]]):
+        """
+        Set the data and update range.
+        
+        Args:
+            data: List of data points, or column arrays with a 'time' field
+                (e.g. ``series.columns`` after ``set_data_columnar``), which
+                are used as is without building per-point dicts
+        """
+        if isinstance(data, dict):
+            if "time" not in data:
+                raise ValueError("TimeScale: Column data missing 'time' field")
+            self.columns: Optional[Dict[str, np.ndarray]] = data
+            self._data: Optional[List] = None
+        else:
+            self.columns = None
+            self._data = data
+        self.visible_range = (0, len(self) - 1) if len(self) else (0, 0)
 
-    def set_data(self, data: List):
-        """Set the data and update range."""
-        self.data = data
-        self.visible_range = (0, len(data) - 1) if data else (0, 0)
+    @property
+    def data(self) -> List:
+        """Data points as a list (built on first access for column data)."""
+        if self._data is None:
+            self._data = columns_to_records(self.columns or {})
+        return self._data
+
+    @data.setter
+    def data(self, data: List) -> None:
+        self.set_data(data)
+
+    def __len__(self) -> int:
+        """Number of data points."""
+        if self._data is not None:
+            return len(self._data)
+        return len((self.columns or {}).get("time", ()))
+
+    def point_at(self, index: int) -> Any:
+        """Data point at index, read from the columns without building the list."""
+        if self._data is not None:
+            return self._data[index]
+        return {
+            field: to_list(values[index:index + 1])[0]
+            for field, values in (self.columns or {}).items()
+        }
 
     def get_visible_data(self) -> List:
         """Get currently visible data points."""
-        if not self.data:
+        if not len(self):
             return []
         start, end = self.visible_range
         return self.data[int(start):int(end) + 1]
@@ -117,10 +162,31 @@ class TimeScale:
             start: Start index
             end: End index
         """
-        start = max(0, min(start, len(self.data) - 1))
-        end = max(start, min(end, len(self.data) - 1))
+        start = max(0, min(start, len(self) - 1))
+        end = max(start, min(end, len(self) - 1))
         self.visible_range = (start, end)
 
+    def fit_pixel_width(self, view: Any) -> None:
+        """
+        Set pixel_width from the view the visible range is drawn in.
+        
+        The camera need not frame the visible range: one bar spans
+        (view width in pixels / camera width in bars) pixels, whatever part
+        of the range is on screen.
+        
+        Args:
+            view: Vispy ViewBox with a PanZoomCamera
+        """
+        try:
+            view_pixels = view.size[0]
+            view_bars = view.camera.rect.width
+        except AttributeError:
+            return
+        if view_pixels <= 0 or view_bars <= 0:
+            return
+        start, end = self.visible_range
+        self.pixel_width = max(1, int(np.ceil((end - start + 1) * view_pixels / view_bars)))
+
     def zoom(self, factor: float, center: Optional[float] = None):
         """
         Zoom in/out.
@@ -263,6 +329,23 @@ class PriceScale:
             return 0.0
         return (price - self.min_value) / (self.max_value - self.min_value) * 2 - 1
 
+    def get_y_at_prices(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of prices to normalized Y coordinates.
+        
+        Args:
+            prices: Price values
+        
+        Returns:
+            Normalized Y values (-1 to 1)
+        """
+        prices = np.asarray(prices)
+        if prices.dtype.kind != "f":
+            prices = prices.astype(np.float64)
+        if self.max_value == self.min_value:
+            return np.zeros_like(prices)
+        return (prices - self.min_value) / (self.max_value - self.min_value) * 2 - 1
+
     @staticmethod
     def _format_price(value: float) -> str:
         """Format price value."""
@@ -3,7 +3,7 @@ Series classes for different chart types
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, Any, Union, TYPE_CHECKING
 import numpy as np
 import logging
 
@@ -16,7 +16,15 @@ from .data_types import (
     AreaStyleOptions
 )
 from .scales import TimeScale, PriceScale
-from .utils import hex_to_rgb, hex_to_rgba, normalize_value
+from . import utils
+from .utils import (
+    columns_to_records,
+    hex_to_rgb,
+    hex_to_rgba,
+    m4_decimate,
+    normalize_value,
+    to_list
+)
 
 # Type checking imports to avoid runtime issues
 if TYPE_CHECKING:
@@ -28,9 +36,37 @@ except ImportError:
     visuals = None  # type: ignore
 
 
+# Marks a cached value that has not been computed yet (None is a valid result)
+_UNSET: Any = object()
+
+
+def _get_field(item: Any, field: str, default: Any = None) -> Any:
+    """Read one field from a dict or dataclass data point."""
+    if isinstance(item, dict):
+        return item.get(field, default)
+    return getattr(item, field, default)
+
+
+def _extract_column(data: List, field: str) -> np.ndarray:
+    """Extract one numeric field from a list of dicts or dataclass objects."""
+    return np.fromiter(
+        (
+            item.get(field, 0) if isinstance(item, dict) else getattr(item, field, 0)
+            for item in data
+        ),
+        dtype=np.float64,
+        count=len(data)
+    )
+
+
 class BaseSeries(ABC):
     """Base class for all series types"""
 
+    # Numeric fields rendered by this series (kept as column arrays)
+    _fields: Tuple[str, ...] = ("value",)
+    # Fields holding the (lowest, highest) price of each point
+    _range_fields: Tuple[str, str] = ("value", "value")
+
     def __init__(self, name: str = "", visible: bool = True):
         """
         Initialize BaseSeries.
@@ -41,20 +77,68 @@ class BaseSeries(ABC):
         """
         self.name = name
         self.visible = visible
-        self.data: List = []
+        self._data: Optional[List] = []
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        # Owned storage behind _columns with spare capacity for update()
+        self._buffers: Optional[Dict[str, np.ndarray]] = None
+        # Visible slice and its price range, shared by the price scale and
+        # visual updates of a frame; keyed by the (start, stop) index range
+        self._visible_range: Optional[Tuple[int, int]] = None
+        self._visible_columns: Dict[str, np.ndarray] = {}
+        self._visible_price_range: Any = _UNSET
+        # (pixel width, indices, values) of the decimated visible line
+        self._visible_decimated: Optional[Tuple[Optional[int], np.ndarray, np.ndarray]] = None
         self.visuals: Dict[str, Any] = {}
 
-    def set_data(self, data: List[Dict[str, Any]]) -> None:
+    @property
+    def data(self) -> List:
+        """Data points as a list (built on first access after set_data_columnar)."""
+        if self._data is None:
+            self._data = columns_to_records(self._columns or {})
+        return self._data
+
+    @data.setter
+    def data(self, data: List) -> None:
+        self._data = data
+        self._columns = None
+        self._buffers = None
+        self._visible_range = None
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Column arrays used for rendering (extracted once from list data)."""
+        if self._columns is None:
+            data = self._data or []
+            self._columns = {field: _extract_column(data, field) for field in self._fields}
+        return self._columns
+
+    def set_data(self, data: Union[List[Dict[str, Any]], np.ndarray]) -> None:
         """
         Set series data.
         
         Args:
-            data: List of data points (dicts or dataclass objects)
+            data: List of data points (dicts or dataclass objects), or a
+                structured array with a 'time' field (e.g. ``CANDLE_DTYPE``
+                or ``VALUE_DTYPE``)
         
         Raises:
             ValueError: If data is empty or invalid
             TypeError: If data is not a list
         """
+        if isinstance(data, np.ndarray) and data.dtype.names:
+            if "time" not in data.dtype.names:
+                raise ValueError(f"{self.__class__.__name__}: Structured data missing 'time' field")
+            # Fields of a record array are strided views; copy each into
+            # its own contiguous column
+            self.set_data_columnar(
+                time=np.ascontiguousarray(data["time"]),
+                **{
+                    name: np.ascontiguousarray(data[name])
+                    for name in data.dtype.names if name != "time"
+                }
+            )
+            return
+        
         if not data:
             raise ValueError(f"{self.__class__.__name__}: Data cannot be empty")
         
@@ -77,30 +161,111 @@ class BaseSeries(ABC):
         self._validate_data(data)
         
         self.data = data
-        logger.debug(f"{self.__class__.__name__}: Set {len(data)} data points")
+        logger.debug("%s: Set %d data points", self.__class__.__name__, len(data))
+
+    def set_data_columnar(self, time: Any, **columns: Any) -> None:
+        """
+        Set series data from column arrays, bypassing per-point dicts.
+        
+        Args:
+            time: Array of times
+            **columns: One array per field (e.g. value=..., or open=/high=/low=/close=)
+        
+        Raises:
+            ValueError: If data is empty, a required field is missing or lengths differ
+        """
+        time = np.asarray(time)
+        if len(time) == 0:
+            raise ValueError(f"{self.__class__.__name__}: Data cannot be empty")
+        
+        missing = set(self._fields) - set(columns)
+        if missing:
+            raise ValueError(f"{self.__class__.__name__}: Missing columns: {missing}")
+        
+        arrays = {"time": time}
+        for field, values in columns.items():
+            # Float columns keep their precision (float32 halves memory and upload size)
+            arrays[field] = np.asarray(values)
+            if arrays[field].dtype.kind != "f":
+                arrays[field] = arrays[field].astype(np.float64)
+            if len(arrays[field]) != len(time):
+                raise ValueError(
+                    f"{self.__class__.__name__}: Column '{field}' has {len(arrays[field])} "
+                    f"points, expected {len(time)}"
+                )
+        
+        self._data = None
+        self._columns = arrays
+        self._buffers = None
+        self._visible_range = None
+        logger.debug("%s: Set %d columnar data points", self.__class__.__name__, len(time))
     
     def update(self, bar: Dict[str, Any]) -> None:
         """
         Update the last bar in real-time (for live data).
         If bar time matches last bar, updates it. Otherwise appends new bar.
         
+        Only the changed point is written: the list data (if built) and the
+        column arrays are patched in place, so a tick costs O(1) instead of
+        re-extracting every point.
+        
         Args:
             bar: New or updated bar data
         """
-        if not self.data:
+        last_time = self._last_time()
+        if last_time is None:
             self.data = [bar]
             return
         
-        # Get time of incoming bar
-        bar_time = bar.get("time") if isinstance(bar, dict) else getattr(bar, "time", None)
-        last_time = self.data[-1].get("time") if isinstance(self.data[-1], dict) else getattr(self.data[-1], "time", None)
+        replace = _get_field(bar, "time") == last_time
+        self._visible_range = None
         
-        if bar_time == last_time:
-            # Update existing last bar
-            self.data[-1] = bar
-        else:
-            # Append new bar
-            self.data.append(bar)
+        if self._data is not None:
+            if replace:
+                # Update existing last bar
+                self._data[-1] = bar
+            else:
+                # Append new bar
+                self._data.append(bar)
+        
+        if self._columns is not None:
+            self._write_columns(bar, replace)
+    
+    def _is_empty(self) -> bool:
+        """Whether the series has no points (without building the list form)."""
+        if self._data is not None:
+            return not self._data
+        return not self._columns or len(next(iter(self._columns.values()))) == 0
+    
+    def _last_time(self) -> Any:
+        """Time of the last point, or None if the series is empty."""
+        if self._data is not None:
+            return _get_field(self._data[-1], "time") if self._data else None
+        times = (self._columns or {}).get("time")
+        if times is None or len(times) == 0:
+            return None
+        return to_list(times[-1:])[0]
+    
+    def _write_columns(self, bar: Any, replace: bool) -> None:
+        """Write bar into the last column slot, appending a slot first unless replacing."""
+        length = len(next(iter(self._columns.values())))
+        if not replace:
+            length += 1
+        
+        # Columns may share arrays with the caller, so the first write copies
+        # them into owned buffers; doubling the capacity keeps appends O(1)
+        capacity = len(next(iter(self._buffers.values()))) if self._buffers else 0
+        if length > capacity:
+            capacity = max(2 * length, 64)
+            self._buffers = {}
+            for field, values in self._columns.items():
+                buffer = np.empty(capacity, dtype=values.dtype)
+                buffer[:len(values)] = values
+                self._buffers[field] = buffer
+        
+        self._columns = {field: buffer[:length] for field, buffer in self._buffers.items()}
+        for field, values in self._columns.items():
+            values[-1] = _get_field(bar, field, 0)
     
     def _validate_data(self, data: List[Dict[str, Any]]) -> None:
         """
@@ -122,6 +287,49 @@ class BaseSeries(ABC):
         start, end = time_scale.visible_range
         return self.data[int(start):int(end) + 1]
 
+    def get_visible_columns(self, time_scale: TimeScale) -> Dict[str, np.ndarray]:
+        """
+        Get column array slices in visible time range.
+        
+        The slices are cached until the range or the data changes, so the
+        price scale and the visual update of a frame share one lookup.
+        """
+        start, end = time_scale.visible_range
+        visible_range = (int(start), int(end) + 1)
+        if visible_range != self._visible_range:
+            visible = slice(*visible_range)
+            self._visible_columns = {
+                field: values[visible] for field, values in self.columns.items()
+            }
+            self._visible_price_range = _UNSET
+            self._visible_decimated = None
+            self._visible_range = visible_range
+        return self._visible_columns
+
+    def get_price_range(self, time_scale: TimeScale) -> Optional[Tuple[float, float]]:
+        """Calculate min/max prices of visible data, or None if nothing is visible."""
+        columns = self.get_visible_columns(time_scale)
+        if self._visible_price_range is not _UNSET:
+            return self._visible_price_range
+        
+        low_field, high_field = self._range_fields
+        lows = columns[low_field]
+        highs = columns[high_field]
+        self._visible_price_range = None
+        if lows.size and highs.size:
+            if utils.HAS_NUMBA:
+                # Both columns in a single compiled loop
+                low, high = utils._min_max_kernel(lows, highs)
+                low, high = float(low), float(high)
+            else:
+                # fmin/fmax skip NaNs in one pass without masked copies
+                low = float(np.fmin.reduce(lows))
+                high = float(np.fmax.reduce(highs))
+            # Every point NaN: no range (inf from the kernel, NaN from fmin)
+            if np.isfinite(low) and np.isfinite(high):
+                self._visible_price_range = (low, high)
+        return self._visible_price_range
+
     def _get_price_range(self, data: List) -> Tuple[float, float]:
         """Calculate min/max prices from data."""
         if not data:
@@ -167,6 +375,8 @@ class LineSeries(BaseSeries):
         super().__init__(name)
         self.style = style or LineStyleOptions()
         self.line_visual: Any = None
+        # Shared visual that draws this line when batched with others
+        self.batch: Optional["LineBatch"] = None
     
     def _validate_data(self, data: List[Dict[str, Any]]) -> None:
         """Validate line series data."""
@@ -178,7 +388,10 @@ class LineSeries(BaseSeries):
                 )
 
     def create_visual(self, view: Any) -> Any:
-        """Create Vispy line visual."""
+        """Create Vispy line visual (none when the line is drawn by a LineBatch)."""
+        if self.batch is not None:
+            return None
+        
         if not visuals:
             logger.warning("LineSeries: Vispy not available, visual not created")
             return None
@@ -200,48 +413,221 @@ class LineSeries(BaseSeries):
 
     def update_visual(self, time_scale: TimeScale, price_scale: PriceScale) -> None:
         """Update line visual with data."""
+        if self.batch is not None:
+            # Drawn by the batch, which the owner updates once for all its lines
+            return
+        
         if not self.line_visual:
             logger.warning("LineSeries: Visual not initialized, skipping update")
             return
         
-        if not self.data:
-            logger.warning("LineSeries: No data to render")
-            return
-
         try:
-            visible_data = self.get_visible_data(time_scale)
-            if not visible_data:
-                logger.debug("LineSeries: No visible data in current range")
+            pos = self.get_line_positions(time_scale, price_scale)
+            if pos is None:
                 return
-
-            x_coords = np.arange(len(visible_data))
-            y_coords = np.array([
-                item.get("value") if isinstance(item, dict) else getattr(item, "value")
-                for item in visible_data
-            ])
-
-            # Normalize Y to screen space
-            y_normalized = np.array([
-                price_scale.get_y_at_price(float(y)) for y in y_coords
-            ])
-
-            pos = np.column_stack([x_coords, y_normalized, np.zeros(len(x_coords))])
             self.line_visual.set_data(pos)
-            logger.debug(f"LineSeries: Updated visual with {len(visible_data)} points")
+            logger.debug("LineSeries: Updated visual with %d points", len(pos))
         except Exception as e:
             logger.error(f"LineSeries: Failed to update visual: {e}")
             raise
 
+    def get_line_positions(
+        self, time_scale: TimeScale, price_scale: PriceScale
+    ) -> Optional[np.ndarray]:
+        """Vertex positions of the visible line, or None if there is nothing to draw."""
+        if self._is_empty():
+            logger.warning("LineSeries: No data to render")
+            return None
+
+        values = self.get_visible_columns(time_scale)["value"]
+        if values.size == 0:
+            logger.debug("LineSeries: No visible data in current range")
+            return None
+
+        # More points than pixels: keep each pixel column's extremes only
+        pixel_width = time_scale.pixel_width
+        cached = self._visible_decimated
+        if cached is None or cached[0] != pixel_width:
+            cached = (pixel_width, *m4_decimate(values, pixel_width or 0))
+            self._visible_decimated = cached
+        _, x_coords, values = cached
+
+        # Normalize Y to screen space
+        y_normalized = price_scale.get_y_at_prices(values)
+
+        pos = np.zeros((len(values), 3), dtype=np.float32)
+        pos[:, 0] = x_coords
+        pos[:, 1] = y_normalized
+        return pos
+
+
+def create_series_visual(
+    series: BaseSeries, view: Any, line_batches: Dict[float, "LineBatch"]
+) -> None:
+    """
+    Create the visuals of series in view, batching line series by width.
+    
+    Args:
+        series: Series to draw
+        view: Vispy view to draw into
+        line_batches: The view's batches keyed by line width (filled on demand)
+    """
+    if isinstance(series, LineSeries) and visuals:
+        width = series.style.width
+        if width not in line_batches:
+            line_batches[width] = LineBatch(view, width)
+        line_batches[width].add(series)
+    series.create_visual(view)
+
+
+def remove_series_visuals(series: BaseSeries) -> None:
+    """Detach the visuals of series from their view, leaving any line batch."""
+    if isinstance(series, LineSeries) and series.batch is not None:
+        series.batch.remove(series)
+    for visual in series.visuals.values():
+        try:
+            visual.parent = None
+        except Exception:
+            pass
+
+
+def remove_all_series(
+    series: Dict[str, BaseSeries], line_batches: "Dict[float, LineBatch]"
+) -> None:
+    """Detach every series and line batch of a chart or pane, and empty both dicts."""
+    # Detach each shared line visual once, then only the series that still
+    # own visuals, instead of unlinking batched series one by one
+    for batch in line_batches.values():
+        batch.detach()
+    line_batches.clear()
+    for item in series.values():
+        remove_series_visuals(item)
+    series.clear()
+
+
+class LineBatch:
+    """
+    Several line series drawn by one Line visual.
+    
+    Each Vispy visual is its own GL program and draw call, so lines that
+    share a width are concatenated into a single vertex buffer; a boolean
+    connect array leaves the gap between one series and the next undrawn.
+    """
+
+    def __init__(self, view: Any, width: float):
+        """
+        Initialize LineBatch.
+        
+        Args:
+            view: Vispy view to draw into
+            width: Line width shared by every series in the batch
+        """
+        self.series: List[LineSeries] = []
+        self.line_visual: Any = None
+        # Vertex buffers reused across frames; they only grow, so panning
+        # and zooming write into them instead of allocating new arrays
+        self._pos_buf = np.empty((0, 3), dtype=np.float32)
+        self._color_buf = np.empty((0, 4), dtype=np.float32)
+        self._connect_buf = np.empty(0, dtype=bool)
+        # (colour, vertex count) per drawn series at the last upload; while it
+        # holds, colours and the connect mask are unchanged and not re-sent
+        self._layout: List[Tuple[str, int]] = []
+        if visuals:
+            self.line_visual = visuals.Line(width=width)  # type: ignore[attr-defined]
+            view.add(self.line_visual)
+
+    def add(self, series: LineSeries) -> None:
+        """Draw series with this batch instead of a visual of its own."""
+        series.batch = self
+        self.series.append(series)
+
+    def remove(self, series: LineSeries) -> None:
+        """Stop drawing series with this batch."""
+        if series in self.series:
+            self.series.remove(series)
+        series.batch = None
+
+    def update_visual(self, time_scale: TimeScale, price_scale: PriceScale) -> None:
+        """Rebuild the shared vertex buffer from every visible series."""
+        if not self.line_visual:
+            return
+
+        positions = []
+        for series in self.series:
+            if not series.visible:
+                continue
+            pos = series.get_line_positions(time_scale, price_scale)
+            if pos is None:
+                continue
+            positions.append((series, pos))
+
+        if not positions:
+            self.line_visual.visible = False
+            return
+
+        total = sum(len(pos) for _, pos in positions)
+        layout = [(series.style.color, len(pos)) for series, pos in positions]
+        self._reserve(total)
+
+        start = 0
+        for series, pos in positions:
+            self._pos_buf[start:start + len(pos)] = pos
+            start += len(pos)
+
+        self.line_visual.visible = True
+        if layout == self._layout:
+            # Panning at a steady zoom: only the positions moved
+            self.line_visual.set_data(pos=self._pos_buf[:total])
+        else:
+            start = 0
+            for color, count in layout:
+                end = start + count
+                self._color_buf[start:end, :3] = hex_to_rgb(color)
+                # Connect each vertex to the next, except the last vertex of each series
+                self._connect_buf[start:end - 1] = True
+                self._connect_buf[end - 1] = False
+                start = end
+            self._color_buf[:total, 3] = 1.0
+            self.line_visual.set_data(
+                pos=self._pos_buf[:total],
+                color=self._color_buf[:total],
+                connect=self._connect_buf[:total]
+            )
+            self._layout = layout
+        logger.debug("LineBatch: Updated %d lines with %d points", len(positions), total)
+
+    def _reserve(self, size: int) -> None:
+        """Grow the vertex buffers to hold at least size vertices."""
+        if len(self._pos_buf) >= size:
+            return
+        capacity = max(size, 2 * len(self._pos_buf))
+        self._layout = []
+        self._pos_buf = np.empty((capacity, 3), dtype=np.float32)
+        self._color_buf = np.empty((capacity, 4), dtype=np.float32)
+        self._connect_buf = np.empty(capacity, dtype=bool)
+
+    def detach(self) -> None:
+        """Remove the shared visual, and with it every batched series, from its view."""
+        for series in self.series:
+            series.batch = None
+        self.series.clear()
+        if self.line_visual is not None:
+            self.line_visual.parent = None
+
 
 class CandlestickSeries(BaseSeries):
     """Candlestick chart series"""
 
+    _fields = ("open", "high", "low", "close")
+    _range_fields = ("low", "high")
+
     def __init__(self, name: str = "", style: Optional[CandleStickStyleOptions] = None):
         super().__init__(name)
         self.style = style or CandleStickStyleOptions()
-        self.bodies_visual: Any = None
-        self.wicks_visual: Any = None
+        self.candles_visual: Any = None
         self.view: Any = None
+        # Triangle indices for the last quad count (unchanged while panning)
+        self._faces = np.empty((0, 3), dtype=np.uint32)
     
     def _validate_data(self, data: List[Dict[str, Any]]) -> None:
         """Validate candlestick OHLC data."""
@@ -261,20 +647,17 @@ class CandlestickSeries(BaseSeries):
                         )
 
     def create_visual(self, view: Any) -> None:
-        """Create Vispy candlestick visuals."""
+        """Create Vispy candlestick visual."""
         if not visuals:
             logger.warning("CandlestickSeries: Vispy not available, visuals not created")
             return
 
         try:
             self.view = view
-            # Create empty line visuals that will be updated with data
-            self.bodies_visual = visuals.Line(connect='segments')  # type: ignore[attr-defined]
-            self.wicks_visual = visuals.Line(connect='segments')  # type: ignore[attr-defined]
-            view.add(self.bodies_visual)
-            view.add(self.wicks_visual)
-            self.visuals['bodies'] = self.bodies_visual
-            self.visuals['wicks'] = self.wicks_visual
+            # Wicks and bodies are quads in one mesh: one draw call for all candles
+            self.candles_visual = visuals.Mesh()  # type: ignore[attr-defined]
+            view.add(self.candles_visual)
+            self.visuals['candles'] = self.candles_visual
             logger.debug("CandlestickSeries: Visuals created successfully")
         except Exception as e:
             logger.error(f"CandlestickSeries: Failed to create visuals: {e}")
@@ -282,96 +665,80 @@ class CandlestickSeries(BaseSeries):
 
     def update_visual(self, time_scale: TimeScale, price_scale: PriceScale) -> None:
         """Update candlestick visual."""
-        if not self.bodies_visual:
+        if not self.candles_visual:
             logger.warning("CandlestickSeries: Visuals not initialized, skipping update")
             return
         
-        if not self.data:
+        if self._is_empty():
             logger.warning("CandlestickSeries: No data to render")
             return
 
         try:
-            visible_data = self.get_visible_data(time_scale)
-            if not visible_data:
+            columns = self.get_visible_columns(time_scale)
+            count = len(columns["close"])
+            if count == 0:
                 logger.debug("CandlestickSeries: No visible data in current range")
                 return
 
-            wick_positions = []
-            wick_colors = []
-            body_positions = []
-            body_colors = []
-
-            for i, item in enumerate(visible_data):
-                # Extract OHLC values with proper type handling
-                if isinstance(item, dict):
-                    open_p = float(item.get("open", 0))
-                    close_p = float(item.get("close", 0))
-                    high = float(item.get("high", 0))
-                    low = float(item.get("low", 0))
-                else:
-                    open_p = float(getattr(item, "open", 0))
-                    close_p = float(getattr(item, "close", 0))
-                    high = float(getattr(item, "high", 0))
-                    low = float(getattr(item, "low", 0))
-
-                is_up = close_p >= open_p
-
-                # Normalize prices
-                y_open = price_scale.get_y_at_price(open_p)
-                y_close = price_scale.get_y_at_price(close_p)
-                y_high = price_scale.get_y_at_price(high)
-                y_low = price_scale.get_y_at_price(low)
-
-                # Body color
-                body_color = hex_to_rgb(self.style.up_color if is_up else self.style.down_color)
-                wick_color = hex_to_rgb(self.style.wick_color)
-
-                # Create body as thick line segment
-                body_positions.extend([
-                    [i, y_open, 0],
-                    [i, y_close, 0]
-                ])
-                body_colors.extend([body_color, body_color])
-
-                # Create wicks if visible
-                if self.style.wick_visible:
-                    # Upper wick
-                    wick_positions.extend([
-                        [i, max(y_open, y_close), 0],
-                        [i, y_high, 0]
-                    ])
-                    wick_colors.extend([wick_color, wick_color])
-                    
-                    # Lower wick
-                    wick_positions.extend([
-                        [i, min(y_open, y_close), 0],
-                        [i, y_low, 0]
-                    ])
-                    wick_colors.extend([wick_color, wick_color])
-
-            # Update bodies (thick lines)
-            if body_positions:
-                self.bodies_visual.set_data(
-                    pos=np.array(body_positions),
-                    color=np.array(body_colors),
-                    width=self.style.body_width * 50,  # Scale width for visibility
-                    connect='segments'
-                )
-
-            # Update wicks (thin lines)
-            if wick_positions:
-                self.wicks_visual.set_data(
-                    pos=np.array(wick_positions),
-                    color=np.array(wick_colors),
-                    width=1,
-                    connect='segments'
-                )
+            x_coords = np.arange(count, dtype=np.float32)
+            is_up = columns["close"] >= columns["open"]
+
+            # Normalize prices
+            y_open = price_scale.get_y_at_prices(columns["open"])
+            y_close = price_scale.get_y_at_prices(columns["close"])
+            y_high = price_scale.get_y_at_prices(columns["high"])
+            y_low = price_scale.get_y_at_prices(columns["low"])
+
+            # Wicks are one pixel wide; bodies span body_width of a bar but
+            # never less than a pixel, so zoomed-out candles stay visible
+            pixel = self._bar_units_per_pixel()
+            quads = [(max(self.style.body_width, pixel) / 2, y_open, y_close)]
+            if self.style.wick_visible:
+                # Drawn first so the body covers the wick's middle
+                quads.insert(0, (pixel / 2, y_low, y_high))
+
+            # Four corners per quad, candle-major: (candle, quad, corner, xyz)
+            vertices = np.zeros((count, len(quads), 4, 3), dtype=np.float32)
+            for q, (half_width, y_from, y_to) in enumerate(quads):
+                vertices[:, q, (0, 3), 0] = (x_coords - half_width)[:, None]
+                vertices[:, q, (1, 2), 0] = (x_coords + half_width)[:, None]
+                vertices[:, q, (0, 1), 1] = np.asarray(y_from)[:, None]
+                vertices[:, q, (2, 3), 1] = np.asarray(y_to)[:, None]
+
+            colors = np.empty((count, len(quads), 4, 4), dtype=np.float32)
+            colors[:, -1] = np.where(
+                is_up[:, None],
+                (*hex_to_rgb(self.style.up_color), 1.0),
+                (*hex_to_rgb(self.style.down_color), 1.0)
+            )[:, None]
+            if self.style.wick_visible:
+                colors[:, 0] = (*hex_to_rgb(self.style.wick_color), 1.0)
+
+            self.candles_visual.set_data(
+                vertices=vertices.reshape(-1, 3),
+                faces=self._quad_faces(count * len(quads)),
+                vertex_colors=colors.reshape(-1, 4)
+            )
             
-            logger.debug(f"CandlestickSeries: Updated visual with {len(visible_data)} candles")
+            logger.debug("CandlestickSeries: Updated visual with %d candles", count)
         except Exception as e:
             logger.error(f"CandlestickSeries: Failed to update visual: {e}")
             raise
 
+    def _bar_units_per_pixel(self) -> float:
+        """Width of one screen pixel in bars, at the view's current zoom."""
+        try:
+            return self.view.camera.rect.width / max(self.view.size[0], 1)
+        except Exception:
+            return 0.1
+
+    def _quad_faces(self, num_quads: int) -> np.ndarray:
+        """Two triangles per quad of four consecutive vertices."""
+        if len(self._faces) != 2 * num_quads:
+            corner = 4 * np.arange(num_quads, dtype=np.uint32)[:, None]
+            self._faces = (corner + np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)).reshape(-1, 3)
+        return self._faces
+
 
 class AreaSeries(LineSeries):
     """Area chart series with fill"""
@@ -412,36 +779,21 @@ class AreaSeries(LineSeries):
         if not self.fill_visual:
             logger.warning("AreaSeries: Fill visual not initialized, skipping update")
             return
-        
-        if not self.data:
-            return
 
         try:
-            visible_data = self.get_visible_data(time_scale)
-            if not visible_data:
+            # Same (possibly decimated) vertices as the line
+            line = self.get_line_positions(time_scale, price_scale)
+            if line is None:
                 return
+            count = len(line)
 
-            x_coords = np.arange(len(visible_data))
-            y_coords = np.array([
-                item.get("value") if isinstance(item, dict) else getattr(item, "value")
-                for item in visible_data
-            ])
-
-            y_normalized = np.array([
-                price_scale.get_y_at_price(float(y)) for y in y_coords
-            ])
-
-            # Create polygon vertices for area fill
-            vertices = []
-            for x, y in zip(x_coords, y_normalized):
-                vertices.append([x, y, 0])
-            
-            # Add bottom edge (reverse order)
-            for x in reversed(x_coords):
-                vertices.append([x, -1.0, 0])
+            # Create polygon vertices for area fill: top edge, then bottom edge (reverse order)
+            vertices_array = np.zeros((2 * count, 3), dtype=np.float32)
+            vertices_array[:count] = line
+            vertices_array[count:, 0] = line[::-1, 0]
+            vertices_array[count:, 1] = -1.0
 
             # Update polygon with new vertices
-            vertices_array = np.array(vertices, dtype=np.float32)
             self.fill_visual.pos = vertices_array
             logger.debug("AreaSeries: Updated fill visual")
         except Exception as e:
@@ -492,40 +844,33 @@ class HistogramSeries(BaseSeries):
             logger.warning("HistogramSeries: Visual not initialized, skipping update")
             return
         
-        if not self.data:
+        if self._is_empty():
             logger.warning("HistogramSeries: No data to render")
             return
 
         try:
-            visible_data = self.get_visible_data(time_scale)
-            if not visible_data:
+            values = self.get_visible_columns(time_scale)["value"]
+            count = len(values)
+            if count == 0:
                 logger.debug("HistogramSeries: No visible data in current range")
                 return
 
-            bar_positions = []
-            bar_colors = []
-            color = hex_to_rgb(self.style.color)
-
-            for i, item in enumerate(visible_data):
-                value = item.get("value") if isinstance(item, dict) else getattr(item, "value", 0)
-                value = float(value) if value is not None else 0.0
-                y_normalized = price_scale.get_y_at_price(value)
-
-                # Create bar as line segment from bottom to value
-                bar_positions.extend([
-                    [i, -1.0, 0],  # Bottom
-                    [i, y_normalized, 0]  # Top
-                ])
-                bar_colors.extend([color, color])
-
-            if bar_positions:
-                self.bars_visual.set_data(
-                    pos=np.array(bar_positions),
-                    color=np.array(bar_colors),
-                    width=self.style.bar_width * 50,  # Scale width for visibility
-                    connect='segments'
-                )
-                logger.debug(f"HistogramSeries: Updated visual with {len(visible_data)} bars")
+            # Create bars as line segments from bottom to value
+            bar_positions = np.zeros((2 * count, 3), dtype=np.float32)
+            bar_positions[:, 0] = np.repeat(np.arange(count), 2)
+            bar_positions[0::2, 1] = -1.0  # Bottom
+            bar_positions[1::2, 1] = price_scale.get_y_at_prices(values)  # Top
+            bar_colors = np.tile(
+                np.array(hex_to_rgb(self.style.color), dtype=np.float32), (2 * count, 1)
+            )
+
+            self.bars_visual.set_data(
+                pos=bar_positions,
+                color=bar_colors,
+                width=self.style.bar_width * 50,  # Scale width for visibility
+                connect='segments'
+            )
+            logger.debug("HistogramSeries: Updated visual with %d bars", count)
         except Exception as e:
             logger.error(f"HistogramSeries: Failed to update visual: {e}")
             raise
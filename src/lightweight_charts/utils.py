@@ -2,7 +2,22 @@
 Utility functions for Lightweight Charts
 """
 
-from typing import Tuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
@@ -114,3 +129,118 @@ def denormalize_value(normalized: float, min_val: float, max_val: float) -> floa
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Clamp value to range [min_val, max_val]."""
     return max(min_val, min(max_val, value))
+
+
+# No fastmath: it assumes no NaNs, and skipping NaNs relies on comparisons
+# with NaN being false
+@njit(cache=True)
+def _min_max_kernel(lows, highs):
+    """Lowest of lows and highest of highs in one pass; (inf, -inf) if all NaN"""
+    low = np.inf
+    high = -np.inf
+    for i in range(len(lows)):
+        if lows[i] < low:
+            low = lows[i]
+        if highs[i] > high:
+            high = highs[i]
+    return low, high
+
+
+def m4_decimate(values: np.ndarray, num_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a dense series to the first, lowest, highest and last point of each bin.
+    
+    With one bin per pixel column this draws the same line as every point
+    (M4 decimation), using at most four vertices per column.
+    
+    Args:
+        values: Values to decimate (NaNs are skipped when picking extremes)
+        num_bins: Number of bins, usually the drawing width in pixels
+    
+    Returns:
+        Tuple of (indices of the kept points, their values); every point is
+        kept when there are no more than four per bin
+    """
+    count = len(values)
+    if num_bins <= 0 or count <= 4 * num_bins:
+        return np.arange(count), values
+    
+    bin_size = -(-count // num_bins)
+    num_bins = -(-count // bin_size)
+    # Index grid of shape (bins, bin_size); the last bin repeats its final point
+    grid = np.minimum(np.arange(num_bins * bin_size).reshape(num_bins, bin_size), count - 1)
+    binned = values[grid]
+    missing = np.isnan(binned)
+    lowest = np.argmin(np.where(missing, np.inf, binned), axis=1)
+    highest = np.argmax(np.where(missing, -np.inf, binned), axis=1)
+    
+    picks = np.stack([
+        np.zeros_like(lowest), lowest, highest, np.full_like(lowest, bin_size - 1)
+    ], axis=1)
+    picks.sort(axis=1)
+    indices = np.take_along_axis(grid, picks, axis=1).ravel()
+    return indices, values[indices]
+
+
+def to_list(values: np.ndarray) -> List[Any]:
+    """
+    Convert an array to a Python list.
+    
+    datetime64 values become datetime objects (a plain ``tolist()`` would
+    give dates or integers for day and nanosecond units).
+    
+    Args:
+        values: Array to convert
+    
+    Returns:
+        List of Python scalars
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[us]")
+    return values.tolist()
+
+
+def columns_to_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Build the list-of-dicts form of column arrays.
+    
+    Args:
+        columns: One array per field, all the same length
+    
+    Returns:
+        One dict per point, with Python scalars (see to_list)
+    """
+    fields = list(columns)
+    rows = zip(*(to_list(values) for values in columns.values()))
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def records_to_columns(
+    records: List[Any], fields: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Build the column-array form of a list of data points.
+    
+    Converting once lets repeated indicator calls (and set_data_columnar)
+    read whole arrays instead of walking the points on every call.
+    
+    Args:
+        records: Data points (dicts or dataclass objects)
+        fields: Fields to extract (default: the keys of the first dict point)
+    
+    Returns:
+        One array per field; datetime times become datetime64[us]
+    """
+    if fields is None:
+        fields = list(records[0]) if records and isinstance(records[0], dict) else ["time"]
+    columns = {}
+    for field in fields:
+        column = np.array([
+            item[field] if isinstance(item, dict) else getattr(item, field)
+            for item in records
+        ])
+        if column.dtype == object and len(column) and isinstance(column[0], datetime):
+            column = column.astype("datetime64[us]")
+        columns[field] = column
+    return columns
@@ -4,13 +4,16 @@ Unit tests for Chart class
 
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
 import sys
 import os
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from lightweight_charts import Chart, LineStyleOptions, CandleStickStyleOptions
+from lightweight_charts import (
+    Chart, LineStyleOptions, CandleStickStyleOptions, PriceMarker, TimeMarker, CrosshairVisual
+)
 
 
 class TestChart:
@@ -51,6 +54,28 @@ class TestChart:
         assert "OHLC" in chart.series
         assert chart.series["OHLC"].name == "OHLC"
     
+    def test_candlesticks_drawn_as_one_mesh(self):
+        """Test every candle's wick and body go into a single mesh visual"""
+        chart = Chart()
+        candles = chart.add_candlestick_series("OHLC")
+        data = [
+            {"time": datetime(2024, 1, 1) + timedelta(days=i),
+             "open": 100 + i, "high": 103 + i, "low": 98 + i, "close": 101 + i - 2 * (i % 2)}
+            for i in range(10)
+        ]
+        candles.set_data(data)
+        chart.update_time_scale_data(data)
+        chart._refresh()
+        
+        assert list(candles.visuals) == ["candles"]
+        mesh = candles.candles_visual._meshdata
+        assert mesh.get_vertices().shape == (10 * 2 * 4, 3)
+        assert mesh.get_faces().shape == (10 * 2 * 2, 3)
+        
+        candles.style.wick_visible = False
+        chart._refresh()
+        assert candles.candles_visual._meshdata.get_faces().shape == (10 * 2, 3)
+    
     def test_add_area_series(self):
         """Test adding area series"""
         chart = Chart()
@@ -120,6 +145,18 @@ class TestChart:
         chart.clear_series()
         assert len(chart.series) == 0
     
+    def test_every_pane_outlined(self):
+        """Test the main pane gets the same border as the panes below it"""
+        chart = Chart()
+        chart.add_pane("Main", height_ratio=0.7)
+        chart.add_pane("RSI", height_ratio=0.3)
+
+        chart._setup_multi_pane_layout()
+
+        for pane in chart.panes:
+            assert pane.view.border_width == 2
+            assert pane.view.border_color.alpha == 1.0
+
     def test_set_background_color(self):
         """Test setting background color"""
         chart = Chart()
@@ -134,6 +171,20 @@ class TestChart:
         
         assert size == (1200, 800)
     
+    def test_add_markers(self):
+        """Test adding price and time markers in bulk"""
+        chart = Chart()
+        chart.add_price_marker(PriceMarker(price=100))
+        chart.add_price_markers([PriceMarker(price=110), PriceMarker(price=90)])
+        chart.add_time_markers([TimeMarker(time=datetime(2024, 1, 1))])
+        
+        assert [m.price for m in chart.price_markers] == [100, 110, 90]
+        assert len(chart.time_markers) == 1
+        
+        chart.clear_markers()
+        assert chart.price_markers == []
+        assert chart.time_markers == []
+    
     def test_multiple_series(self):
         """Test adding multiple series"""
         chart = Chart()
@@ -145,6 +196,193 @@ class TestChart:
         assert "Line1" in chart.series
         assert "Line2" in chart.series
         assert "Candles" in chart.series
+    
+    def test_line_series_share_batch(self):
+        """Test lines of the same width are drawn by one visual"""
+        chart = Chart()
+        thin = chart.add_line_series("Thin1")
+        chart.add_line_series("Thin2")
+        thick = chart.add_line_series("Thick", LineStyleOptions(width=4))
+        
+        assert thin.batch is chart.series["Thin2"].batch
+        assert thick.batch is not thin.batch
+        assert thin.line_visual is None
+        
+        data = [{"time": datetime(2024, 1, 1) + timedelta(days=i), "value": i} for i in range(5)]
+        thin.set_data(data)
+        chart.series["Thin2"].set_data(data[:3])
+        chart.update_time_scale_data(data)
+        chart.update_price_scale()
+        chart._update_visuals()
+        
+        # Both lines in one buffer, with no segment joining them
+        connect = thin.batch.line_visual.connect
+        assert len(connect) == 8
+        assert not connect[4] and not connect[7]
+        
+        # Same layout again: positions are re-sent, colours are not
+        visual = thin.batch.line_visual
+        visual._changed["color"] = False
+        chart._update_visuals()
+        assert visual._changed["pos"] and not visual._changed["color"]
+        
+        chart.remove_series("Thin1")
+        assert thin.batch is None
+        assert chart.series["Thin2"].batch.series == [chart.series["Thin2"]]
+    
+    def test_dense_line_decimated_at_camera_scale(self):
+        """Test decimation follows the camera's bars-per-pixel, not the canvas width"""
+        chart = Chart()
+        line = chart.add_line_series("Dense")
+        values = np.sin(np.arange(20_000) / 50.0)
+        times = np.datetime64("2024-01-01T00:00", "m") + np.arange(20_000)
+        line.set_data_columnar(time=times, value=values)
+        chart.update_time_scale_data(line.columns)
+        chart._refresh()
+        
+        # Default camera shows bars 0-1000: each of them keeps its own vertex
+        pos = line.batch.line_visual.pos
+        assert np.count_nonzero(pos[:, 0] <= 1000) == 1001
+        
+        # Zooming the camera out to the whole range re-decimates on the next turn
+        chart.view.camera.rect = (0, -1, 20_000, 2)
+        assert chart._refresh_pending
+        chart._flush_refresh()
+        assert len(line.batch.line_visual.pos) <= 4 * chart.view.size[0]
+    
+    def test_crosshair_lines_reuse_buffers(self):
+        """Test both crosshair lines share one visual whose buffer is rewritten in place"""
+        chart = Chart()
+        crosshair = CrosshairVisual(chart.view)
+        buf = crosshair._buf
+        
+        crosshair.update_position(x=3.0, y=0.5, x_range=(0, 10))
+        crosshair.update_position(x=4.0, y=-0.25, x_range=(0, 10))
+        
+        assert crosshair.lines.pos is buf
+        assert (buf[:2, 0] == 4.0).all()
+        assert (buf[2:, 1] == -0.25).all()
+        assert crosshair.lines.color.shape == (4, 4)
+    
+    def test_crosshair_follows_view_changes(self):
+        """Test the crosshair is re-placed once per pan/zoom, not polled"""
+        chart = Chart()
+        data = [{"time": datetime(2024, 1, 1) + timedelta(days=i), "value": i} for i in range(10)]
+        chart.add_line_series("Test").set_data(data)
+        chart.update_time_scale_data(data)
+        
+        positions = []
+        chart.crosshair_visual = type("Recorder", (), {
+            "update_position": lambda self, **kwargs: positions.append(kwargs)
+        })()
+        chart.crosshair.show()
+        chart._last_mouse_pos = (100, 100)
+        
+        chart._update_crosshair_position()
+        assert positions == []
+        
+        chart.view.camera.rect = (0, -1, 500, 2)
+        chart._update_crosshair_position()
+        chart._update_crosshair_position()
+        assert len(positions) == 1
+    
+    def test_mouse_move_reports_bar_changes(self):
+        """Test subscribers hear about a new bar or price, not every mouse move"""
+        chart = Chart()
+        data = [{"time": datetime(2024, 1, 1) + timedelta(days=i), "value": i} for i in range(10)]
+        chart.add_line_series("Test").set_data(data)
+        chart.update_time_scale_data(data)
+        chart.update_price_scale()
+        chart.crosshair_visual = type("Stub", (), {
+            "update_position": lambda self, **kwargs: None,
+            "hide": lambda self: None
+        })()
+        chart.view.camera.rect = (0, -1, 10, 2)
+        
+        moves = []
+        chart.subscribe_crosshair_move(moves.append)
+        move = lambda x, y: chart._on_mouse_move(type("Event", (), {"pos": (x, y)})())
+        
+        move(100, 300)
+        move(101, 300)
+        assert len(moves) == 1
+        
+        move(300, 300)
+        move(300, 200)
+        assert len(moves) == 3
+        
+        chart._on_mouse_leave(None)
+        move(300, 200)
+        assert len(moves) == 4
+        
+        move(-5, 200)
+        move(300, chart.canvas.size[1])
+        assert len(moves) == 4
+        
+        # Moves within the same device pixel are not mapped at all
+        mapped = []
+        imap = chart._view_transform.imap
+        chart._view_transform.imap = lambda pos: mapped.append(pos) or imap(pos)
+        move(300.3, 199.8)
+        assert mapped == []
+        move(301, 200)
+        assert len(mapped) == 1
+        
+        # Same bar and row, but after the data changed: reported again
+        reported = len(moves)
+        move(302, 200)
+        assert len(moves) == reported
+        chart.update_time_scale_data(data)
+        move(303, 200)
+        assert len(moves) == reported + 1
+    
+    def test_throttled_crosshair_subscriber(self):
+        """Test a throttled subscriber gets only the latest of several moves"""
+        chart = Chart()
+        moves = []
+        chart.subscribe_crosshair_move(moves.append, throttled=True)
+        
+        for x in range(3):
+            chart.crosshair.set_position(x=x, y=0.0)
+        assert moves == []
+        
+        chart.crosshair._flush_moves()
+        assert [position.x for position in moves] == [2]
+        
+        chart.crosshair.set_position(x=5, y=0.0)
+        chart.crosshair.clear_position()
+        chart.crosshair._flush_moves()
+        assert len(moves) == 1
+    
+    def test_pan_zoom_burst_refreshes_once(self):
+        """Test consecutive pan/zoom calls are redrawn together"""
+        chart = Chart()
+        data = [{"time": datetime(2024, 1, 1) + timedelta(days=i), "value": i} for i in range(50)]
+        chart.add_line_series("Test").set_data(data)
+        chart.update_time_scale_data(data)
+        
+        refreshes = []
+        original_refresh = chart._refresh
+        chart._refresh = lambda: (refreshes.append(chart.time_scale.visible_range), original_refresh())
+        
+        chart.pan(5)
+        chart.zoom(2.0)
+        chart.pan(-1)
+        assert refreshes == []
+        
+        chart.flush()
+        chart.flush()
+        assert refreshes == [chart.time_scale.visible_range]
+    
+    def test_cached_mouse_mapping(self):
+        """Test the cached canvas-to-data mapping tracks camera moves"""
+        chart = Chart()
+        
+        for rect in [(0, -1, 1000, 2), (37, -3, 120, 0.5)]:
+            chart.view.camera.rect = rect
+            for pos in [(10, 20), (400, 300.5)]:
+                expected = chart.view.scene.transform.imap(pos)[:2]
+                assert chart._view_transform.imap(pos) == pytest.approx(tuple(expected))
 
 
 class TestChartData:
@@ -190,3 +428,28 @@ class TestChartData:
         self.chart.update_time_scale_data(self.sample_data)
         
         assert len(self.chart.time_scale.data) == 3
+
+
+class TestPackageImport:
+    """Test the package's lazy re-exports"""
+    
+    def test_import_defers_submodules(self):
+        """Test importing the package loads no submodules until a name is used"""
+        import subprocess
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = (
+            "import sys, lightweight_charts as lc\n"
+            "assert 'lightweight_charts.chart' not in sys.modules\n"
+            "assert 'vispy' not in sys.modules\n"
+            "lc.hex_to_rgb('#ffffff')\n"
+            "assert 'vispy' not in sys.modules\n"
+            "assert lc.Chart.__module__ == 'lightweight_charts.chart'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": src},
+            capture_output=True,
+            text=True
+        )
+        
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,281 @@
+"""
+Unit tests for technical indicators
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lightweight_charts import indicators, records_to_columns, OHLCColumns
+from lightweight_charts.indicators import (
+    IndicatorCalculator, MovingAverage, RSI, MACD, BollingerBands, IncrementalSMA, IncrementalRSI
+)
+
+
+@pytest.fixture
+def ohlc_data():
+    """Random-walk closes with daily times"""
+    rng = np.random.default_rng(0)
+    closes = 100 + np.cumsum(rng.standard_normal(120))
+    base_date = datetime(2024, 1, 1)
+    return [
+        {"time": base_date + timedelta(days=i), "close": float(close)}
+        for i, close in enumerate(closes)
+    ]
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    """Disable the optional accelerated backends"""
+    monkeypatch.setattr(indicators, "HAS_BOTTLENECK", False)
+    monkeypatch.setattr(indicators, "HAS_TALIB", False)
+    monkeypatch.setattr(indicators, "HAS_NUMBA", False)
+
+
+def values_of(series):
+    return np.array([point["value"] for point in series])
+
+
+class TestMovingAverage:
+    """Test moving averages"""
+
+    def test_sma(self, ohlc_data):
+        """Test SMA values and warm-up period"""
+        result = MovingAverage.sma(ohlc_data, period=5)
+        closes = np.array([d["close"] for d in ohlc_data])
+
+        assert len(result) == len(ohlc_data)
+        assert result[10]["time"] == ohlc_data[10]["time"]
+        assert np.isnan(values_of(result)[:4]).all()
+        assert result[10]["value"] == pytest.approx(closes[6:11].mean())
+
+    def test_sma_matches_fallback(self, ohlc_data, monkeypatch):
+        """Test accelerated SMA agrees with the pure-Python implementation"""
+        fast = values_of(MovingAverage.sma(ohlc_data, period=20))
+        monkeypatch.setattr(indicators, "HAS_BOTTLENECK", False)
+        monkeypatch.setattr(indicators, "HAS_TALIB", False)
+        monkeypatch.setattr(indicators, "HAS_NUMBA", False)
+        slow = values_of(MovingAverage.sma(ohlc_data, period=20))
+
+        np.testing.assert_allclose(fast, slow, equal_nan=True)
+
+    def test_wma_weights_recent_values(self, ohlc_data):
+        """Test WMA gives the newest value in each window the largest weight"""
+        result = values_of(MovingAverage.wma(ohlc_data, period=3))
+        closes = np.array([d["close"] for d in ohlc_data])
+        
+        assert np.isnan(result[:2]).all()
+        assert result[10] == pytest.approx((closes[8] + 2 * closes[9] + 3 * closes[10]) / 6)
+        assert np.isnan(values_of(MovingAverage.wma(ohlc_data[:2], period=3))).all()
+    
+    def test_ema_seeded_with_sma(self, ohlc_data, pure_python):
+        """Test EMA starts from the SMA of the first period"""
+        result = values_of(MovingAverage.ema(ohlc_data, period=10))
+        closes = np.array([d["close"] for d in ohlc_data])
+
+        assert np.isnan(result[:9]).all()
+        assert result[9] == pytest.approx(closes[:10].mean())
+
+
+class TestRSI:
+    """Test RSI"""
+
+    def test_range(self, ohlc_data):
+        """Test RSI stays within 0-100 after the warm-up period"""
+        result = values_of(RSI.calculate(ohlc_data, period=14))
+
+        assert np.isnan(result[:14]).all()
+        assert ((result[14:] >= 0) & (result[14:] <= 100)).all()
+
+
+class TestMACD:
+    """Test MACD"""
+
+    def test_histogram(self, ohlc_data, pure_python):
+        """Test histogram is MACD minus signal"""
+        macd_line, signal_line, histogram = MACD.calculate(ohlc_data)
+
+        np.testing.assert_allclose(
+            values_of(histogram),
+            values_of(macd_line) - values_of(signal_line),
+            equal_nan=True
+        )
+
+
+class TestBollingerBands:
+    """Test Bollinger Bands"""
+
+    def test_bands_match_fallback(self, ohlc_data, monkeypatch):
+        """Test accelerated bands agree with the pure-Python implementation"""
+        fast = [values_of(band) for band in BollingerBands.calculate(ohlc_data)]
+        monkeypatch.setattr(indicators, "HAS_BOTTLENECK", False)
+        monkeypatch.setattr(indicators, "HAS_TALIB", False)
+        monkeypatch.setattr(indicators, "HAS_NUMBA", False)
+        slow = [values_of(band) for band in BollingerBands.calculate(ohlc_data)]
+
+        for fast_band, slow_band in zip(fast, slow):
+            np.testing.assert_allclose(fast_band, slow_band, equal_nan=True)
+
+
+class TestColumnarInput:
+    """Test indicators accept column-oriented data"""
+    
+    def test_records_to_columns(self, ohlc_data):
+        """Test list data converts to arrays with datetime64 times"""
+        columns = records_to_columns(ohlc_data)
+        
+        assert columns["time"].dtype == np.dtype("datetime64[us]")
+        np.testing.assert_array_equal(columns["close"], [d["close"] for d in ohlc_data])
+    
+    def test_matches_records(self, ohlc_data):
+        """Test dict-of-arrays and OHLCColumns input give the same series as records"""
+        columns = records_to_columns(ohlc_data)
+        close = columns["close"]
+        ohlc = OHLCColumns(time=columns["time"], open=close, high=close, low=close, close=close)
+        expected = MovingAverage.sma(ohlc_data, period=5)
+        
+        for data in (columns, ohlc):
+            result = MovingAverage.sma(data, period=5)
+            assert [point["time"] for point in result] == [point["time"] for point in expected]
+            np.testing.assert_allclose(values_of(result), values_of(expected), equal_nan=True)
+    
+    def test_missing_source_is_zero(self, ohlc_data):
+        """Test a missing column extracts as zeros, like a missing dict key"""
+        values = IndicatorCalculator.extract_values(records_to_columns(ohlc_data), "volume")
+        
+        np.testing.assert_array_equal(values, np.zeros(len(ohlc_data)))
+
+
+class TestValueCache:
+    """Test values extracted from lists are reused across indicator calls"""
+    
+    def test_reused_until_list_changes(self, ohlc_data):
+        """Test the same list shares one array until it grows or is invalidated"""
+        values = IndicatorCalculator._source_values(ohlc_data)
+        
+        assert IndicatorCalculator._source_values(ohlc_data) is values
+        assert not values.flags.writeable
+        
+        ohlc_data.append(dict(ohlc_data[-1]))
+        assert len(IndicatorCalculator._source_values(ohlc_data)) == len(values) + 1
+        
+        ohlc_data[0] = {"time": ohlc_data[0]["time"], "close": 0.0}
+        IndicatorCalculator.invalidate(ohlc_data)
+        assert IndicatorCalculator._source_values(ohlc_data)[0] == 0.0
+    
+    def test_extract_values_writable(self, ohlc_data):
+        """Test callers get their own copy that does not touch the cache"""
+        values = IndicatorCalculator.extract_values(ohlc_data)
+        values[0] = -1.0
+        
+        assert IndicatorCalculator.extract_values(ohlc_data)[0] == ohlc_data[0]["close"]
+    
+    @pytest.mark.parametrize("replace", [True, False])
+    def test_forming_bar_recomputed(self, ohlc_data, pure_python, replace):
+        """Test replacing or revising the last point of the same list is picked up"""
+        MovingAverage.sma(ohlc_data, period=5)
+        MovingAverage.ema(ohlc_data, period=5)
+        
+        if replace:
+            ohlc_data[-1] = {"time": ohlc_data[-1]["time"], "close": 500.0}
+        else:
+            ohlc_data[-1]["close"] = 500.0
+        fresh = [dict(point) for point in ohlc_data]
+        
+        for indicator in (MovingAverage.sma, MovingAverage.ema):
+            np.testing.assert_array_equal(
+                values_of(indicator(ohlc_data, period=5)), values_of(indicator(fresh, period=5))
+            )
+    
+    def test_ema_reused(self, ohlc_data, pure_python, monkeypatch):
+        """Test a second EMA of the same list and period is not recomputed"""
+        first = MovingAverage.ema(ohlc_data, period=10)
+        monkeypatch.setattr(np, "mean", None)
+        
+        np.testing.assert_array_equal(
+            values_of(MovingAverage.ema(ohlc_data, period=10)), values_of(first)
+        )
+
+
+class TestIncremental:
+    """Test the incremental indicators agree with the batch versions"""
+    
+    def test_sma(self, ohlc_data, pure_python):
+        """Test bar-by-bar SMA matches MovingAverage.sma"""
+        sma = IncrementalSMA(period=20)
+        result = values_of([sma.update(bar) for bar in ohlc_data])
+        expected = values_of(MovingAverage.sma(ohlc_data, period=20))
+        
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+    
+    def test_rsi(self, ohlc_data, pure_python):
+        """Test bar-by-bar RSI matches RSI.calculate"""
+        rsi = IncrementalRSI(period=14)
+        result = values_of([rsi.update(bar) for bar in ohlc_data])
+        expected = values_of(RSI.calculate(ohlc_data, period=14))
+        
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+    
+    @pytest.mark.parametrize("indicator", [IncrementalSMA(period=5), IncrementalRSI(period=5)])
+    def test_same_time_replaces_last_bar(self, ohlc_data, indicator):
+        """Test revising the forming bar gives the same value as sending it once"""
+        for bar in ohlc_data[:10]:
+            indicator.update({"time": bar["time"], "close": bar["close"] + 50})
+            expected = indicator.update(bar)["value"]
+        
+        fresh = type(indicator)(period=5)
+        for bar in ohlc_data[:10]:
+            value = fresh.update(bar)["value"]
+        
+        assert expected == pytest.approx(value)
+
+
+class TestKernels:
+    """Test the JIT kernels agree with the pure-Python implementations"""
+    
+    @pytest.mark.parametrize("period", [1, 5, 20])
+    def test_sma_kernel(self, ohlc_data, pure_python, period):
+        """Test the SMA kernel"""
+        closes = np.array([d["close"] for d in ohlc_data])
+        expected = values_of(MovingAverage.sma(ohlc_data, period=period))
+        
+        np.testing.assert_allclose(indicators._sma_kernel(closes, period), expected, equal_nan=True)
+    
+    @pytest.mark.parametrize("period", [1, 10, 200])
+    def test_ema_kernel(self, ohlc_data, pure_python, period):
+        """Test the EMA kernel, including data shorter than the period"""
+        closes = np.array([d["close"] for d in ohlc_data])
+        expected = values_of(MovingAverage.ema(ohlc_data, period=period))
+        
+        np.testing.assert_allclose(indicators._ema_kernel(closes, period), expected, equal_nan=True)
+    
+    def test_rsi_kernel(self, ohlc_data, pure_python):
+        """Test the RSI kernel"""
+        closes = np.array([d["close"] for d in ohlc_data])
+        expected = values_of(RSI.calculate(ohlc_data, period=14))
+        
+        np.testing.assert_allclose(indicators._rsi_kernel(closes, 14), expected, equal_nan=True)
+    
+    @pytest.mark.parametrize("num_bars", [120, 30, 20])
+    def test_macd_kernel(self, ohlc_data, pure_python, num_bars):
+        """Test the MACD kernel, including too few bars for a signal or MACD line"""
+        data = ohlc_data[:num_bars]
+        closes = np.array([d["close"] for d in data])
+        expected = [values_of(line) for line in MACD.calculate(data)]
+        
+        for line, expected_line in zip(indicators._macd_kernel(closes, 12, 26, 9), expected):
+            np.testing.assert_allclose(line, expected_line, equal_nan=True)
+    
+    def test_bollinger_std_kernel(self, ohlc_data, pure_python):
+        """Test the rolling standard deviation kernel"""
+        closes = np.array([d["close"] for d in ohlc_data])
+        upper, middle, _ = BollingerBands.calculate(ohlc_data, period=20, std_dev=1.0)
+        expected = values_of(upper) - values_of(middle)
+        
+        np.testing.assert_allclose(
+            indicators._bollinger_std_kernel(closes, 20), expected, equal_nan=True, atol=1e-9
+        )
@@ -4,6 +4,7 @@ Unit tests for Scale classes
 
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
 import sys
 import os
 
@@ -86,6 +87,23 @@ class TestTimeScale:
         # Pan right
         scale.pan(5)
         assert scale.visible_range[0] >= 5
+    
+    def test_column_data(self):
+        """Test column arrays are used without building per-point dicts"""
+        scale = TimeScale({
+            "time": np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-11")),
+            "close": np.arange(10.0)
+        })
+        
+        assert len(scale) == 10
+        assert scale.visible_range == (0, 9)
+        assert scale.point_at(3) == {"time": datetime(2024, 1, 4), "close": 3.0}
+        assert scale._data is None
+        
+        assert scale.data[9]["close"] == 9.0
+        
+        with pytest.raises(ValueError):
+            scale.set_data({"close": np.arange(3.0)})
 
 
 class TestPriceScale:
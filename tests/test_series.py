@@ -3,19 +3,27 @@ Unit tests for Series classes
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+import numpy as np
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from lightweight_charts import utils
 from lightweight_charts import (
     LineSeries,
     CandlestickSeries,
     AreaSeries,
     HistogramSeries,
     LineStyleOptions,
-    CandleStickStyleOptions
+    CandleStickStyleOptions,
+    OHLCColumns,
+    TimeScale,
+    PriceScale,
+    m4_decimate,
+    CANDLE_DTYPE,
+    VALUE_DTYPE
 )
 
 
@@ -171,3 +179,244 @@ class TestSeriesDataRange:
         min_p, max_p = series._get_price_range(data)
         assert min_p == 95
         assert max_p == 105
+    
+    def test_visible_price_range_follows_updates(self):
+        """Test the cached visible range is refreshed by data changes"""
+        times = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-04"))
+        series = LineSeries()
+        series.set_data_columnar(time=times, value=np.array([100.0, 150.0, 120.0]))
+        time_scale = TimeScale(series.data)
+        
+        assert series.get_price_range(time_scale) == (100.0, 150.0)
+        assert series.get_visible_columns(time_scale) is series.get_visible_columns(time_scale)
+        
+        series.update({"time": datetime(2024, 1, 3), "value": 200})
+        assert series.get_price_range(time_scale) == (100.0, 200.0)
+        
+        series.set_data_columnar(time=times, value=np.array([10.0, 20.0, 30.0]))
+        assert series.get_price_range(time_scale) == (10.0, 30.0)
+    
+    @pytest.mark.parametrize("has_numba", [False, True])
+    def test_visible_price_range_skips_nan(self, monkeypatch, has_numba):
+        """Test indicator warm-up NaNs are ignored, and all-NaN data has no range"""
+        # Without numba installed the kernel runs as plain Python
+        monkeypatch.setattr(utils, "HAS_NUMBA", has_numba)
+        times = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-04"))
+        series = LineSeries()
+        series.set_data_columnar(time=times, value=np.array([np.nan, 150.0, 120.0]))
+        time_scale = TimeScale(series.data)
+        assert series.get_price_range(time_scale) == (120.0, 150.0)
+        
+        series.set_data_columnar(time=times, value=np.full(3, np.nan))
+        assert series.get_price_range(time_scale) is None
+
+
+class TestColumnarData:
+    """Test column array data path"""
+    
+    def test_set_data_columnar(self):
+        """Test setting candlestick data from column arrays"""
+        series = CandlestickSeries()
+        series.set_data_columnar(
+            time=np.array([datetime(2024, 1, 1), datetime(2024, 1, 2)]),
+            open=np.array([100.0, 102.0]),
+            high=np.array([105.0, 106.0]),
+            low=np.array([95.0, 101.0]),
+            close=np.array([102.0, 104.0])
+        )
+        
+        assert series.columns["close"].tolist() == [102.0, 104.0]
+        assert len(series.data) == 2
+        assert series.data[0]["time"] == datetime(2024, 1, 1)
+        assert series.data[1]["low"] == 101.0
+    
+    def test_set_data_columnar_datetime64(self):
+        """Test datetime64 times are converted to datetime in list data"""
+        series = LineSeries()
+        start = np.datetime64("2024-01-01")
+        series.set_data_columnar(time=np.arange(start, start + 3), value=np.arange(3.0))
+        
+        assert series.data[2] == {"time": datetime(2024, 1, 3), "value": 2.0}
+    
+    def test_set_structured_data(self):
+        """Test setting candlestick data from a structured array"""
+        candles = np.zeros(2, dtype=CANDLE_DTYPE)
+        candles["time"] = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[s]")
+        candles["open"] = [100.0, 102.0]
+        candles["high"] = [105.0, 106.0]
+        candles["low"] = [95.0, 101.0]
+        candles["close"] = [102.0, 104.0]
+        
+        series = CandlestickSeries()
+        series.set_data(candles)
+        
+        assert series.columns["high"].tolist() == [105.0, 106.0]
+        assert series.data[1]["time"] == datetime(2024, 1, 2)
+        assert series.data[1]["close"] == 104.0
+    
+    def test_set_data_columnar_float32(self):
+        """Test float32 columns are kept as float32 and integers promoted"""
+        series = CandlestickSeries()
+        series.set_data_columnar(
+            time=np.arange(2),
+            open=np.array([100.0, 102.0], dtype=np.float32),
+            high=np.array([105.0, 106.0], dtype=np.float32),
+            low=np.array([95.0, 101.0], dtype=np.float32),
+            close=np.array([102, 104])
+        )
+        
+        assert series.columns["open"].dtype == np.float32
+        assert series.columns["close"].dtype == np.float64
+        assert series.data[1]["high"] == 106.0
+    
+    def test_set_structured_value_data(self):
+        """Test setting line data from a VALUE_DTYPE array"""
+        points = np.zeros(3, dtype=VALUE_DTYPE)
+        points["time"] = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-04"))
+        points["value"] = [1.0, np.nan, 3.0]
+        
+        series = LineSeries()
+        series.set_data(points)
+        
+        assert series.columns["value"].flags["C_CONTIGUOUS"]
+        assert series.data[2] == {"time": datetime(2024, 1, 3), "value": 3.0}
+    
+    def test_set_data_columnar_validation(self):
+        """Test validation of column arrays"""
+        series = LineSeries()
+        with pytest.raises(ValueError):
+            series.set_data_columnar(time=np.array([]), value=np.array([]))
+        with pytest.raises(ValueError):
+            series.set_data_columnar(time=np.arange(3))
+        with pytest.raises(ValueError):
+            series.set_data_columnar(time=np.arange(3), value=np.arange(2))
+    
+    def test_columns_from_list_data(self):
+        """Test column arrays are extracted from list data and refreshed on update"""
+        series = LineSeries()
+        series.set_data([
+            {"time": datetime(2024, 1, 1), "value": 100},
+            {"time": datetime(2024, 1, 2), "value": 150},
+        ])
+        assert series.columns["value"].tolist() == [100.0, 150.0]
+        
+        series.update({"time": datetime(2024, 1, 3), "value": 120})
+        assert series.columns["value"].tolist() == [100.0, 150.0, 120.0]
+    
+    def test_update_columnar_data(self):
+        """Test update patches column arrays without touching the caller's arrays"""
+        times = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-03"))
+        values = np.array([100.0, 150.0])
+        series = LineSeries()
+        series.set_data_columnar(time=times, value=values)
+        
+        series.update({"time": datetime(2024, 1, 2), "value": 160})
+        series.update({"time": datetime(2024, 1, 3), "value": 120})
+        
+        assert series.columns["value"].tolist() == [100.0, 160.0, 120.0]
+        assert series.data[-1] == {"time": datetime(2024, 1, 3), "value": 120.0}
+        assert values.tolist() == [100.0, 150.0]
+        
+        # Appends keep going past the initial spare capacity
+        for day in range(4, 200):
+            series.update({"time": datetime(2024, 1, 1) + timedelta(days=day - 1), "value": day})
+        assert len(series.columns["value"]) == 199
+        assert series.columns["value"][-1] == 199.0
+        assert series.data[-1]["value"] == 199.0
+
+
+class TestDecimation:
+    """Test M4 decimation of dense line series"""
+    
+    def test_m4_keeps_extremes(self):
+        """Test each bin keeps its first, lowest, highest and last point in order"""
+        values = np.random.default_rng(0).standard_normal(1003)
+        values[500] = np.nan
+        indices, kept = m4_decimate(values, 100)
+        
+        assert len(indices) <= 4 * 100
+        assert (np.diff(indices) >= 0).all()
+        assert indices[0] == 0 and indices[-1] == 1002
+        assert np.nanmin(kept) == np.nanmin(values)
+        assert np.nanmax(kept) == np.nanmax(values)
+        np.testing.assert_array_equal(kept, values[indices])
+    
+    def test_m4_sparse_data_unchanged(self):
+        """Test data with few points per bin is returned as is"""
+        values = np.arange(10.0)
+        indices, kept = m4_decimate(values, 100)
+        
+        np.testing.assert_array_equal(indices, np.arange(10))
+        assert kept is values
+    
+    def test_line_positions_decimated(self):
+        """Test line vertices are capped by the time scale's pixel width"""
+        times = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-01") + 10_000)
+        series = LineSeries()
+        series.set_data_columnar(time=times, value=np.sin(np.arange(10_000) / 50))
+        time_scale = TimeScale(series.data)
+        price_scale = PriceScale()
+        price_scale.update_range(-1, 1)
+        
+        assert len(series.get_line_positions(time_scale, price_scale)) == 10_000
+        
+        time_scale.pixel_width = 200
+        pos = series.get_line_positions(time_scale, price_scale)
+        assert len(pos) <= 800
+        assert pos[-1, 0] == 9999
+
+
+class TestOHLCColumns:
+    """Test column-oriented OHLC data"""
+    
+    def test_to_records(self):
+        """Test conversion to list-of-dicts"""
+        columns = OHLCColumns(
+            time=np.array([datetime(2024, 1, 1), datetime(2024, 1, 2)]),
+            open=np.array([100.0, 101.0]),
+            high=np.array([102.0, 103.0]),
+            low=np.array([99.0, 100.0]),
+            close=np.array([101.0, 102.0]),
+            volume=np.array([1000, 2000])
+        )
+        records = columns.to_records()
+        
+        assert len(columns) == 2
+        assert records[1] == {
+            "time": datetime(2024, 1, 2),
+            "open": 101.0,
+            "high": 103.0,
+            "low": 100.0,
+            "close": 102.0,
+            "volume": 2000
+        }
+    
+    def test_to_structured(self):
+        """Test packing columns into a structured array"""
+        columns = OHLCColumns(
+            time=np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]"),
+            open=np.array([100.0, 101.0]),
+            high=np.array([102.0, 103.0]),
+            low=np.array([99.0, 100.0]),
+            close=np.array([101.0, 102.0])
+        )
+        candles = columns.to_structured()
+        
+        assert candles.dtype == CANDLE_DTYPE
+        assert candles["close"].tolist() == [101.0, 102.0]
+        assert np.isnan(candles["volume"]).all()
+    
+    def test_astype(self):
+        """Test casting price columns leaves time and volume untouched"""
+        columns = OHLCColumns(
+            time=np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]"),
+            open=np.array([100.0, 101.0]),
+            high=np.array([102.0, 103.0]),
+            low=np.array([99.0, 100.0]),
+            close=np.array([101.0, 102.0]),
+            volume=np.array([1000, 2000])
+        ).astype(np.float32)
+        
+        assert columns.close.dtype == np.float32
+        assert columns.volume.dtype == np.array([1000]).dtype
+        assert columns.time.dtype == np.dtype("datetime64[D]")